@@ -1,5 +1,7 @@
 """Public package exports for crapssim."""
 
+__version__ = "0.4.1"
+
 __all__ = ["table", "dice", "strategy", "bet", "rules", "Table", "Player"]
 
 from crapssim.dice import Dice
@@ -0,0 +1,31 @@
+"""
+Exact, simulation-free analysis of bets and strategies. Outcomes are computed
+from the 36 equally likely dice rolls with Markov chains over the table and bet
+state, using the bets' own payout logic, so the results follow the rules and
+table settings in use and can serve as oracles for simulations.
+"""
+
+from crapssim.analysis.bets import (
+    DICE_OUTCOMES,
+    BetAnalysis,
+    RollModel,
+    analyze_bet,
+    bet_table,
+    default_settings,
+)
+from crapssim.analysis.layout import LayoutAnalysis, analyze_layout
+from crapssim.analysis.policy import (
+    Objective,
+    OptimalPolicy,
+    PolicySolver,
+    PolicyStrategy,
+    default_actions,
+)
+from crapssim.analysis.progressive import (
+    ats_ev,
+    ats_probabilities,
+    ats_probability,
+    fire_ev,
+    fire_probabilities,
+)
+from crapssim.analysis.ruin import BankrollDistribution, RuinCurve, RuinSolver
@@ -0,0 +1,511 @@
+"""Exact expected value, house edge, and resolution time of single bets."""
+
+import copy
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Hashable, Mapping
+
+import numpy as np
+
+from crapssim import bet as B
+from crapssim.bet import Bet
+from crapssim.point import Point
+from crapssim.rules import ClassicRules, Rules
+from crapssim.table import Table, TableSettings
+
+__all__ = [
+    "DICE_OUTCOMES",
+    "BetAnalysis",
+    "analyze_bet",
+    "default_settings",
+    "bet_table",
+    "RollModel",
+]
+
+DICE_OUTCOMES: tuple[tuple[int, int], ...] = tuple(
+    (a, b) for a in range(1, 7) for b in range(1, 7)
+)
+"""The 36 equally likely ordered rolls of two dice."""
+
+_MAX_STATES = 100_000
+"""Largest Markov chain solved, to fail fast on bets with unbounded state."""
+
+_DENSE_STATES = 1500
+"""Largest Markov chain solved with a dense linear solve."""
+
+_TAIL = 1e-12
+"""Probability left unresolved at which the resolution time pmf is truncated."""
+
+_MAX_ROLLS = 10_000
+"""Longest resolution time computed."""
+
+
+_TOTALS: tuple[tuple[tuple[int, int], float], ...] = tuple(
+    (next(o for o in DICE_OUTCOMES if sum(o) == total), n / 36)
+    for total, n in sorted(Counter(sum(o) for o in DICE_OUTCOMES).items())
+)
+"""One roll of each dice total, with the probability of the total."""
+
+_PAIRS = tuple((outcome, 1 / 36) for outcome in DICE_OUTCOMES)
+
+
+class _Roll:
+    """Lightweight stand-in for :class:`~crapssim.dice.Dice` after a roll, which
+    records whether the individual dice were read."""
+
+    __slots__ = ("_result", "total", "result_read")
+
+    def __init__(self, result: tuple[int, int]) -> None:
+        self._result = result
+        self.total = result[0] + result[1]
+        self.result_read = False
+
+    @property
+    def result(self) -> tuple[int, int]:
+        self.result_read = True
+        return self._result
+
+
+class _Table:
+    """Minimal table seen by bets, which records whether the point was read."""
+
+    def __init__(self, rules: Rules, settings: TableSettings) -> None:
+        self.rules = rules
+        self.settings = settings
+        self.dice = _Roll((1, 1))
+        self._point = Point()
+        self.point_read = False
+
+    @property
+    def point(self) -> Point:
+        self.point_read = True
+        return self._point
+
+
+def _freeze(value: Any) -> Hashable:
+    """Hashable form of a (possibly nested) bet attribute or setting."""
+    if isinstance(value, dict):
+        return tuple(sorted(((k, _freeze(v)) for k, v in value.items()), key=repr))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(v) for v in value)
+    return value
+
+
+def _bet_key(bet: Bet) -> Hashable:
+    return type(bet), _freeze(vars(bet))
+
+
+_DEFAULT_SETTINGS: TableSettings = Table().settings
+
+
+def default_settings() -> TableSettings:
+    """Return a fresh copy of the default :class:`~crapssim.table.Table` settings."""
+    return copy.deepcopy(_DEFAULT_SETTINGS)
+
+
+@dataclass(frozen=True)
+class BetAnalysis:
+    """Exact outcome of a single bet, from placement until its first decision.
+
+    A decision is a roll on which the bet wins, loses, or is returned
+    (a push). Bets that stay up after a win, like Place bets under the
+    ``"real_casino"`` policy, are counted as resolved at that first win, with
+    the wager still on the layout counted as the player's.
+    """
+
+    amount: float
+    """Wager of the bet."""
+    cost: float
+    """Cash needed to place the bet (the wager plus any upfront vig)."""
+    ev: float
+    """Expected net win, in dollars, at the first decision."""
+    p_win: float
+    """Probability the first decision is a win."""
+    p_lose: float
+    """Probability the first decision is a loss."""
+    p_push: float
+    """Probability the first decision is a push (wager returned)."""
+    expected_rolls: float
+    """Expected number of rolls until the first decision."""
+    resolution_pmf: np.ndarray
+    """``resolution_pmf[n]`` is the probability the bet resolves on roll
+    ``n + 1``, truncated once less than 1e-12 is left unresolved."""
+    n_states: int
+    """Number of transient states of the Markov chain that was solved."""
+
+    @property
+    def house_edge(self) -> float:
+        """Expected loss per dollar of :attr:`cost`, per resolved bet (pushes
+        count as resolved)."""
+        return -self.ev / self.cost
+
+    @property
+    def edge_per_roll(self) -> float:
+        """House edge per roll the bet is in play."""
+        return self.house_edge / self.expected_rolls
+
+    @property
+    def edge_per_decision(self) -> float:
+        """House edge per resolved bet, not counting pushes."""
+        return self.house_edge / (1 - self.p_push)
+
+
+@dataclass
+class _Chain:
+    """Absorbing Markov chain of a bet, with transitions in coordinate form."""
+
+    rows: np.ndarray
+    cols: np.ndarray
+    probs: np.ndarray
+    absorbing: np.ndarray
+    """Per state expectations over the next roll: cash returned, and
+    probabilities of a win, a loss, and a push."""
+
+    @property
+    def n_states(self) -> int:
+        return len(self.absorbing)
+
+    def step(self, dist: np.ndarray) -> np.ndarray:
+        """Distribution over transient states after one more roll."""
+        weights = dist[self.rows] * self.probs
+        return np.bincount(self.cols, weights=weights, minlength=self.n_states)
+
+
+def _roll_once(
+    template: Bet,
+    point: int | None,
+    table: _Table,
+    outcomes: tuple[tuple[tuple[int, int], float], ...],
+) -> tuple[list[float], list[tuple[Bet, int | None, float]], bool]:
+    """Roll each outcome against a copy of ``template`` with ``point``.
+
+    Returns the expectations over the roll (cash returned, and probabilities
+    of a win, a loss, and a push), the bets left unresolved with the point
+    after the roll and its probability, and whether the individual dice were
+    read.
+    """
+    numbers = table.rules.point_numbers()
+    values = [0.0, 0.0, 0.0, 0.0]
+    unresolved = []
+    result_read = False
+    for outcome, p in outcomes:
+        trial = copy.copy(template)
+        table._point = Point(point)
+        table.dice = dice = _Roll(outcome)
+        result = trial.get_result(table)  # type: ignore[arg-type]
+        values[0] += p * result.bankroll_change
+        if result.remove or result.won or result.lost:
+            if not result.remove:
+                # Still on the layout, so still the player's money
+                values[0] += p * trial.amount
+            if result.won:
+                values[1] += p
+            elif result.lost:
+                values[2] += p
+            else:
+                values[3] += p
+        else:
+            trial.update_number(table)  # type: ignore[arg-type]
+            new_point = Point(point)
+            new_point.update(dice, numbers)  # type: ignore[arg-type]
+            unresolved.append((trial, new_point.number, p))
+        result_read = result_read or dice.result_read
+    return values, unresolved, result_read
+
+
+def _explore(
+    bet: Bet, point: int | None, table: _Table, track_point: bool
+) -> _Chain | None:
+    """Build the absorbing Markov chain of ``bet`` placed with ``point``.
+
+    States are ``(point, bet state)`` pairs. Unless ``track_point``, the point
+    is held fixed, and None is returned as soon as the bet reads it. Rolls are
+    grouped by total in states where the bet does not read the dice.
+    """
+    start = (point, _bet_key(bet))
+    templates = {start: copy.copy(bet)}
+    index = {start: 0}
+    order = [start]
+    transitions: dict[tuple[int, int], float] = {}
+    absorbing: list[list[float]] = []
+
+    table.point_read = False
+    for i, state in enumerate(order):
+        state_point, _ = state
+        template = templates.pop(state)
+        values, unresolved, result_read = _roll_once(
+            template, state_point, table, _TOTALS
+        )
+        if result_read:
+            values, unresolved, _ = _roll_once(template, state_point, table, _PAIRS)
+        if table.point_read and not track_point:
+            return None
+        absorbing.append(values)
+        for trial, next_point, p in unresolved:
+            next_state = (next_point if track_point else point, _bet_key(trial))
+            if next_state not in index:
+                if len(order) >= _MAX_STATES:
+                    raise ValueError(f"{bet!r} has more than {_MAX_STATES} states")
+                index[next_state] = len(order)
+                order.append(next_state)
+                templates[next_state] = trial
+            edge = (i, index[next_state])
+            transitions[edge] = transitions.get(edge, 0.0) + p
+
+    edges = np.array(list(transitions), dtype=np.intp).reshape(-1, 2)
+    return _Chain(
+        rows=edges[:, 0],
+        cols=edges[:, 1],
+        probs=np.array(list(transitions.values())),
+        absorbing=np.array(absorbing),
+    )
+
+
+def _solve(chain: _Chain) -> tuple[np.ndarray, float, np.ndarray]:
+    """Return the expected absorbing values and number of rolls from the
+    start state, and the probability of resolving on each roll.
+
+    Small chains are solved exactly with the fundamental matrix; for large
+    ones, the expectations are summed roll by roll along with the resolution
+    time distribution, until less than 1e-12 is left unresolved.
+    """
+    n = chain.n_states
+    resolved = chain.absorbing[:, 1:].sum(axis=1)
+    dist = np.zeros(n)
+    dist[0] = 1.0
+    totals = np.zeros(chain.absorbing.shape[1])
+    expected_rolls = 0.0
+    pmf = []
+    while dist.sum() > _TAIL:
+        if len(pmf) == _MAX_ROLLS:
+            raise ValueError("The bet may never resolve")
+        expected_rolls += dist.sum()
+        totals += dist @ chain.absorbing
+        pmf.append(float(dist @ resolved))
+        dist = chain.step(dist)
+
+    if n <= _DENSE_STATES:
+        q = np.zeros((n, n))
+        np.add.at(q, (chain.rows, chain.cols), chain.probs)
+        rhs = np.column_stack((chain.absorbing, np.ones(n)))
+        solution = np.linalg.solve(np.eye(n) - q, rhs)[0]
+        totals, expected_rolls = solution[:-1], float(solution[-1])
+    return totals, expected_rolls, np.array(pmf)
+
+
+_CACHE: dict[Hashable, BetAnalysis] = {}
+_CACHE_SIZE = 4096
+
+
+def analyze_bet(
+    bet: Bet,
+    rules: Rules | None = None,
+    settings: Mapping[str, Any] | None = None,
+    point: int | None = None,
+) -> BetAnalysis:
+    """Compute the exact outcome distribution of ``bet``.
+
+    The bet's own :meth:`~crapssim.bet.Bet.get_result` and
+    :meth:`~crapssim.bet.Bet.update_number` are run on each of the 36 dice
+    outcomes from every reachable state, a state being the point and the
+    bet's attributes (e.g. a Come bet's number, or the points made by a Fire
+    bet), and the point is updated after each roll as the table does. This
+    gives an absorbing Markov chain, which is solved exactly (or, for chains
+    of more than 1500 states, summed roll by roll until less than 1e-12 is
+    left unresolved). The point is left out of the state for bets that never
+    look at it (e.g. All/Tall/Small).
+
+    Results are cached by bet state, rules, settings, and point, so repeated
+    calls return in microseconds.
+
+    Args:
+        bet: Bet to analyze, in the state it is placed in. It is not modified.
+        rules: Table rules; defaults to ClassicRules.
+        settings: Overrides applied on top of the default table settings
+            (see :func:`default_settings`).
+        point: Point when the bet is placed, or None for a come-out roll.
+
+    Raises:
+        ValueError: If the point is not valid for the rules, or the bet can
+            keep from resolving forever or has too many states.
+
+    Returns:
+        BetAnalysis: The bet's exact expected value and resolution time.
+    """
+    rules = rules if rules is not None else ClassicRules()
+    if point is not None and point not in rules.point_numbers():
+        raise ValueError(f"Invalid point for {type(rules).__name__}: {point}")
+    key = (
+        _bet_key(bet),
+        type(rules),
+        _freeze(getattr(rules, "__dict__", {})),
+        _freeze(dict(settings or {})),
+        point,
+    )
+    if key in _CACHE:
+        return _CACHE[key]
+
+    table_settings = default_settings()
+    table_settings.update(copy.deepcopy(dict(settings or {})))  # type: ignore[typeddict-item]
+    table = _Table(rules, table_settings)
+    table._point = Point(point)
+    cost = bet.cost(table)  # type: ignore[arg-type]
+
+    chain = _explore(bet, point, table, track_point=False)
+    if chain is None:
+        chain = _explore(bet, point, table, track_point=True)
+    assert chain is not None
+    try:
+        totals, expected_rolls, pmf = _solve(chain)
+    except ValueError:
+        raise ValueError(f"{bet!r} may never resolve") from None
+    returned, p_win, p_lose, p_push = totals
+
+    analysis = BetAnalysis(
+        amount=bet.amount,
+        cost=cost,
+        ev=float(returned - cost),
+        p_win=float(p_win),
+        p_lose=float(p_lose),
+        p_push=float(p_push),
+        expected_rolls=expected_rolls,
+        resolution_pmf=pmf,
+        n_states=chain.n_states,
+    )
+    analysis.resolution_pmf.flags.writeable = False
+    if len(_CACHE) >= _CACHE_SIZE:
+        _CACHE.pop(next(iter(_CACHE)))
+    _CACHE[key] = analysis
+    return analysis
+
+
+class RollModel:
+    """Exact expected net win of a bet on the coming roll.
+
+    A model is called with a bet and the live table, after the dice are rolled
+    and before the bet is settled, and returns the mean over the 36 dice
+    outcomes of :attr:`~crapssim.bet.BetResult.net` for the bet's state and
+    the table's point. Installed as a player's
+    :attr:`~crapssim.table.Player.roll_model`, it makes the player's
+    :attr:`~crapssim.table.Player.expected_by_type` a compensator of
+    :attr:`~crapssim.table.Player.net_by_type`: their difference is a sum of
+    mean-zero terms, one per bet per roll, for any strategy and any rule for
+    ending the session.
+
+    Values are cached by bet state and point.
+
+    Args:
+        rules: Table rules; defaults to ClassicRules.
+        settings: Overrides applied on top of the default table settings.
+    """
+
+    def __init__(
+        self, rules: Rules | None = None, settings: Mapping[str, Any] | None = None
+    ) -> None:
+        table_settings = default_settings()
+        table_settings.update(copy.deepcopy(dict(settings or {})))  # type: ignore[typeddict-item]
+        self._table = _Table(
+            rules if rules is not None else ClassicRules(), table_settings
+        )
+        self._cache: dict[Hashable, float] = {}
+
+    def _expect(
+        self,
+        bet: Bet,
+        point: int | None,
+        outcomes: tuple[tuple[tuple[int, int], float], ...],
+    ) -> tuple[float, bool]:
+        table = self._table
+        net = 0.0
+        result_read = False
+        for outcome, p in outcomes:
+            table._point = Point(point)
+            table.dice = dice = _Roll(outcome)
+            net += p * copy.copy(bet).get_result(table).net  # type: ignore[arg-type]
+            result_read = result_read or dice.result_read
+        return net, result_read
+
+    def __call__(self, bet: Bet, table: Table) -> float:
+        point = table.point.number
+        key = (_bet_key(bet), point)
+        if key in self._cache:
+            return self._cache[key]
+        net, result_read = self._expect(bet, point, _TOTALS)
+        if result_read:
+            net, _ = self._expect(bet, point, _PAIRS)
+        if len(self._cache) >= _CACHE_SIZE:
+            self._cache.pop(next(iter(self._cache)))
+        self._cache[key] = net
+        return net
+
+
+def _standard_bets(rules: Rules, amount: float) -> list[tuple[Bet, int | None]]:
+    """One bet of every type and number allowed by ``rules``, with the point
+    it is placed on."""
+    points = rules.point_numbers()
+    dont = rules.allow_dont_pass()
+    bets: list[tuple[Bet, int | None]] = [(B.PassLine(amount), None)]
+    if dont:
+        bets.append((B.DontPass(amount), None))
+    bets.append((B.Come(amount), points[0]))
+    if rules.allow_dont_come():
+        bets.append((B.DontCome(amount), points[0]))
+    for base in (B.PassLine, B.Come, B.Put, B.DontPass, B.DontCome):
+        if not dont and base in (B.DontPass, B.DontCome):
+            continue
+        for number in points:
+            if base is B.DontCome and number not in B.CLASSIC_POINTS:
+                continue
+            bets.append((B.Odds(base, number, amount), number))
+    bets.extend((B.Put(number, amount), number) for number in points)
+    for box in (B.Place, B.Buy, B.Lay):
+        bets.extend((box(number, amount), None) for number in points)
+    for simple in (
+        B.Field,
+        B.CAndE,
+        B.Any7,
+        B.Two,
+        B.Three,
+        B.Yo,
+        B.Boxcars,
+        B.AnyCraps,
+        B.Horn,
+        B.World,
+        B.Big6,
+        B.Big8,
+    ):
+        bets.append((simple(amount), None))
+    bets.extend((B.HardWay(number, amount), None) for number in (4, 6, 8, 10))
+    bets.extend((B.Hop((a, b), amount), None) for a in range(1, 7) for b in range(a, 7))
+    bets.extend((ats(amount), None) for ats in (B.Fire, B.All, B.Tall, B.Small))
+    return bets
+
+
+def bet_table(
+    rules: Rules | None = None,
+    settings: Mapping[str, Any] | None = None,
+    amount: float = 20,
+) -> dict[str, BetAnalysis]:
+    """Analyze one bet of every class in :mod:`crapssim.bet`, for every number.
+
+    Odds and Put bets are placed with the point on their number, Come and
+    Don't Come bets with a point on, and all other bets on the come-out. Bets
+    the rules do not allow (e.g. Don't Pass in crapless craps) are left out.
+    Since vig is rounded to whole dollars by default, Buy and Lay edges
+    depend on ``amount``.
+
+    Args:
+        rules: Table rules; defaults to ClassicRules.
+        settings: Overrides applied on top of the default table settings.
+        amount: Wager of every bet.
+
+    Returns:
+        dict[str, BetAnalysis]: Analyses keyed by the bet's repr.
+    """
+    rules = rules if rules is not None else ClassicRules()
+    return {
+        repr(bet): analyze_bet(bet, rules, settings, point)
+        for bet, point in _standard_bets(rules, amount)
+    }
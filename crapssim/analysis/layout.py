@@ -0,0 +1,341 @@
+"""Exact long-run expectations of static betting layouts."""
+
+import copy
+from dataclasses import dataclass
+from typing import Any, Hashable, Mapping
+
+import numpy as np
+
+from crapssim.analysis.bets import _PAIRS, _TOTALS, _bet_key, _freeze
+from crapssim.dice import Dice, DicePair
+from crapssim.rules import Rules
+from crapssim.strategy import Strategy
+from crapssim.table import Player, Table, TableSnapshot, TableUpdate
+
+__all__ = ["LayoutAnalysis", "analyze_layout"]
+
+_BANKROLL = 1_000_000.0
+"""Bankroll the player is reset to before every roll, large enough that no bet
+is refused for lack of cash."""
+
+_N_BATCHES = 100
+"""Number of batches for the standard error of a simulated estimate."""
+
+
+class _Dice(Dice):
+    """Dice that record whether the individual dice (not just the total) were
+    read, e.g. by a Hop or HardWay bet."""
+
+    result_read = False
+
+    @property
+    def total(self) -> int | None:
+        return sum(self._result) if self._result is not None else None
+
+    @property
+    def result(self) -> DicePair | None:
+        self.result_read = True
+        return Dice.result.fget(self)  # type: ignore[attr-defined]
+
+
+class _NotRepresentable(Exception):
+    """The strategy's state cannot be captured by a finite Markov chain."""
+
+
+@dataclass(frozen=True)
+class LayoutAnalysis:
+    """Long-run expectations of a strategy played with an unlimited bankroll."""
+
+    win_per_roll: float
+    """Expected net win per roll, counting bets on the layout as the player's."""
+    wagered_per_roll: float
+    """Expected action per roll: the amount of the bets that win or lose (see
+    :attr:`~crapssim.table.Player.wagered`)."""
+    rolls_per_shooter: float
+    """Expected number of rolls per shooter."""
+    exact: bool
+    """Whether the values were computed exactly, rather than simulated."""
+    n_states: int = 0
+    """Number of states of the Markov chain, or 0 if simulated."""
+    n_rolls: int = 0
+    """Number of rolls simulated, or 0 if exact."""
+    stderr: float = 0.0
+    """Standard error of :attr:`win_per_roll` (batch means), or 0 if exact."""
+
+    @property
+    def win_per_shooter(self) -> float:
+        """Expected net win per shooter."""
+        return self.win_per_roll * self.rolls_per_shooter
+
+    @property
+    def win_per_dollar(self) -> float:
+        """Expected net win per dollar wagered (negative of the house edge)."""
+        return self.win_per_roll / self.wagered_per_roll
+
+
+def _build_table(
+    strategy: Strategy,
+    rules: Rules | None,
+    settings: Mapping[str, Any] | None,
+    seed: int | None = None,
+) -> tuple[Table, Player]:
+    table = Table(seed=seed, rules=rules)
+    table.dice = _Dice(seed)
+    table.settings.update(copy.deepcopy(dict(settings or {})))  # type: ignore[typeddict-item]
+    player = table.add_player(_BANKROLL, copy.deepcopy(strategy))
+    return table, player
+
+
+def _state_key(table: Table, player: Player) -> Hashable:
+    """Everything that decides what happens from now on, bankroll aside: the
+    point, whether a new shooter is up, the last roll, the bets on the layout,
+    and the strategy's state."""
+    bets = sorted((_bet_key(bet) for bet in player.bets), key=repr)
+    key = (
+        table.point.number,
+        table.new_shooter,
+        table.last_roll,
+        tuple(bets),
+        _freeze(player.strategy.snapshot()),
+    )
+    try:
+        hash(key)
+    except TypeError:
+        raise _NotRepresentable("Unhashable strategy state") from None
+    return key
+
+
+class _Update(TableUpdate):
+    """Table update that records the player's bankroll once the strategy has
+    placed its bets, just before the dice are rolled."""
+
+    bankroll_at_roll = 0.0
+
+    def before_roll(self, table: Table) -> None:  # type: ignore[override]
+        self.bankroll_at_roll = table.players[0].bankroll
+
+
+def _play(
+    table: Table,
+    player: Player,
+    snapshot: TableSnapshot,
+    outcomes: tuple[tuple[DicePair, float], ...],
+    known: Mapping[Hashable, int],
+) -> tuple[
+    list[tuple[Hashable, TableSnapshot | None, float, float, float]], float, bool
+]:
+    """Play each outcome from ``snapshot``.
+
+    Returns the state key, a snapshot of the table if the state is not in
+    ``known``, the probability, the win, and the action of every outcome, the
+    cash the layout needs (the bets on it once the strategy has placed its
+    bets, including any upfront vig), and whether the individual dice were
+    read.
+    """
+    dice = table.dice
+    assert isinstance(dice, _Dice)
+    dice.result_read = False
+    update = _Update()
+    played = []
+    need = 0.0
+    for outcome, p in outcomes:
+        table.restore(snapshot)
+        player.bankroll = _BANKROLL
+        player.wagered = 0.0
+        wealth = _BANKROLL + player.total_bet_amount
+        update.run(table, outcome)
+        need = max(need, wealth - update.bankroll_at_roll)
+        win = player.bankroll + player.total_bet_amount - wealth
+        key = _state_key(table, player)
+        next_snapshot = table.snapshot() if key not in known else None
+        played.append((key, next_snapshot, p, win, player.wagered))
+    return played, need, dice.result_read
+
+
+@dataclass
+class _LayoutChain:
+    """Markov chain over the table states after each roll, with the win of
+    every transition."""
+
+    src: np.ndarray
+    """State each transition leaves."""
+    dst: np.ndarray
+    """State each transition enters."""
+    prob: np.ndarray
+    """Probability of each transition."""
+    win: np.ndarray
+    """Net win of each transition, counting bets on the layout as the
+    player's."""
+    new_shooter: np.ndarray
+    """Whether a new shooter is up in each state, i.e. the roll entering it was
+    a seven-out."""
+    wagered: np.ndarray
+    """Expected action of the roll from each state."""
+    need: np.ndarray
+    """Cash the layout needs on the roll from each state."""
+
+    @property
+    def n_states(self) -> int:
+        return len(self.new_shooter)
+
+    def transition_matrix(self) -> np.ndarray:
+        """Dense matrix of transition probabilities, ``[from, to]``."""
+        matrix = np.zeros((self.n_states, self.n_states))
+        np.add.at(matrix, (self.src, self.dst), self.prob)
+        return matrix
+
+
+def _explore(
+    strategy: Strategy,
+    rules: Rules | None,
+    settings: Mapping[str, Any] | None,
+    max_states: int,
+) -> _LayoutChain:
+    """Build the chain over table states after each roll by playing every dice
+    outcome from every reachable state. Outcomes are grouped by total from
+    states where nothing reads the individual dice."""
+    table, player = _build_table(strategy, rules, settings)
+    snapshots = [table.snapshot()]
+    index = {_state_key(table, player): 0}
+    new_shooter = [table.new_shooter]
+    transitions: dict[tuple[int, int, float], float] = {}
+    action: list[float] = []
+    needs: list[float] = []
+
+    for i, snapshot in enumerate(snapshots):
+        played, need, result_read = _play(table, player, snapshot, _TOTALS, index)
+        if result_read:
+            played, need, _ = _play(table, player, snapshot, _PAIRS, index)
+        wagered = 0.0
+        for key, next_snapshot, p, win, outcome_wagered in played:
+            wagered += p * outcome_wagered
+            if key not in index:
+                assert next_snapshot is not None
+                if len(snapshots) >= max_states:
+                    raise _NotRepresentable(f"More than {max_states} states")
+                index[key] = len(snapshots)
+                snapshots.append(next_snapshot)
+                new_shooter.append(next_snapshot.new_shooter)
+            edge = (i, index[key], win)
+            transitions[edge] = transitions.get(edge, 0.0) + p
+        action.append(wagered)
+        needs.append(need)
+
+    edges = np.array(list(transitions), dtype=float).reshape(-1, 3)
+    return _LayoutChain(
+        src=edges[:, 0].astype(np.intp),
+        dst=edges[:, 1].astype(np.intp),
+        prob=np.fromiter(transitions.values(), dtype=float, count=len(transitions)),
+        win=edges[:, 2],
+        new_shooter=np.array(new_shooter, dtype=bool),
+        wagered=np.array(action),
+        need=np.array(needs),
+    )
+
+
+def _solve(
+    strategy: Strategy,
+    rules: Rules | None,
+    settings: Mapping[str, Any] | None,
+    max_states: int,
+) -> LayoutAnalysis:
+    """Solve for the stationary distribution of the strategy's chain."""
+    chain = _explore(strategy, rules, settings, max_states)
+    n = chain.n_states
+    a = chain.transition_matrix().T - np.eye(n)
+    # Stationary distribution: pi P = pi with pi summing to 1
+    a[-1, :] = 1.0
+    b = np.zeros(n)
+    b[-1] = 1.0
+    try:
+        pi = np.linalg.solve(a, b)
+    except np.linalg.LinAlgError:
+        raise _NotRepresentable("No unique stationary distribution") from None
+    wins = np.bincount(chain.src, weights=chain.prob * chain.win, minlength=n)
+    return LayoutAnalysis(
+        win_per_roll=float(pi @ wins),
+        wagered_per_roll=float(pi @ chain.wagered),
+        rolls_per_shooter=1 / float(pi @ chain.new_shooter),
+        exact=True,
+        n_states=n,
+    )
+
+
+def _simulate(
+    strategy: Strategy,
+    rules: Rules | None,
+    settings: Mapping[str, Any] | None,
+    n_rolls: int,
+    seed: int,
+) -> LayoutAnalysis:
+    table, player = _build_table(strategy, rules, settings, seed=seed)
+    fields = ("bankrolls", "bet_totals", "shooter")
+    wealth = [_BANKROLL]
+    shooters = []
+    for record in table.iter_run(n_rolls, verbose=False, fields=fields):
+        wealth.append(record.bankrolls[0] + record.bet_totals[0])  # type: ignore[index]
+        shooters.append(record.shooter)
+    wins = np.diff(wealth)
+    n = len(wins)
+    seven_outs = shooters[-1] - shooters[0] + int(table.new_shooter)
+    batches = np.array_split(wins, min(_N_BATCHES, n))
+    means = np.array([batch.mean() for batch in batches])
+    return LayoutAnalysis(
+        win_per_roll=float(wins.mean()),
+        wagered_per_roll=player.wagered / n,
+        rolls_per_shooter=n / max(seven_outs, 1),
+        exact=False,
+        n_rolls=n,
+        stderr=float(means.std(ddof=1) / np.sqrt(len(means))),
+    )
+
+
+def analyze_layout(
+    strategy: Strategy,
+    rules: Rules | None = None,
+    settings: Mapping[str, Any] | None = None,
+    *,
+    max_states: int = 2000,
+    fallback_rolls: int = 100_000,
+    seed: int = 0,
+) -> LayoutAnalysis:
+    """Compute the long-run expected win per roll, shooter, and dollar wagered
+    of a static layout, such as PassLinePlace68, PlaceInside, or IronCross.
+
+    The strategy is played on a real table with every one of the 36 dice
+    outcomes from every reachable state, a state being the point, whether a
+    new shooter is up, the last roll, the bets on the layout (with their
+    numbers and other attributes), and the strategy's
+    :meth:`~crapssim.strategy.tools.Strategy.snapshot`. This gives a finite
+    Markov chain, whose stationary distribution gives the exact long-run
+    expectations.
+
+    The player has an unlimited bankroll, so strategies that depend on the
+    bankroll, or on counts of rolls or shooters, are not static layouts and
+    can give wrong exact results. Strategies whose state is unhashable, that
+    reach more than ``max_states`` states, or that have no unique long-run
+    behavior are simulated for ``fallback_rolls`` rolls instead, and the
+    result has ``exact=False`` and a standard error.
+
+    Args:
+        strategy: Strategy to analyze. It is copied, not modified.
+        rules: Table rules; defaults to ClassicRules.
+        settings: Overrides applied on top of the default table settings.
+        max_states: Largest Markov chain built.
+        fallback_rolls: Number of rolls simulated if the strategy is not
+            representable, or 0 to raise an error instead.
+        seed: Dice seed of the simulation.
+
+    Raises:
+        ValueError: If the strategy is not representable and
+            ``fallback_rolls`` is 0.
+
+    Returns:
+        LayoutAnalysis: The strategy's long-run expectations.
+    """
+    try:
+        return _solve(strategy, rules, settings, max_states)
+    except _NotRepresentable as e:
+        if fallback_rolls <= 0:
+            raise ValueError(f"{strategy!r} is not a static layout: {e}") from None
+    return _simulate(strategy, rules, settings, fallback_rolls, seed)
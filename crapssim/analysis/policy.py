@@ -0,0 +1,435 @@
+"""Optimal betting policies for bankroll-limited sessions."""
+
+import copy
+import math
+from dataclasses import dataclass
+from typing import Any, Hashable, Literal, Mapping, Sequence
+
+import numpy as np
+
+from crapssim.analysis.bets import _PAIRS, _TOTALS, _bet_key, default_settings
+from crapssim.analysis.layout import _BANKROLL, _build_table
+from crapssim.analysis.ruin import _lattice_step
+from crapssim.bet import Bet, DontPass, Field, Odds, PassLine, Place
+from crapssim.rules import ClassicRules, Rules
+from crapssim.strategy.tools import NullStrategy, Strategy
+from crapssim.table import Player, Table, TableUpdate
+
+__all__ = [
+    "Objective",
+    "default_actions",
+    "OptimalPolicy",
+    "PolicySolver",
+    "PolicyStrategy",
+]
+
+Objective = Literal["target", "survival", "final"]
+"""Quantity a policy maximizes: the probability of reaching the target, the
+probability of not being ruined, or the expected final wealth."""
+
+_TOL = 1e-10
+"""Largest change of a value between sweeps at which value iteration stops."""
+
+_MAX_SWEEPS = 100_000
+"""Most value-iteration sweeps for one shooter."""
+
+_TIE = 1e-9
+"""Values within this of the best are ties, which go to the earliest action."""
+
+
+def default_actions(
+    unit: float = 5,
+    rules: Rules | None = None,
+    settings: Mapping[str, Any] | None = None,
+) -> dict[str, tuple[Bet, ...]]:
+    """A menu of common bets at the table minimum: nothing, a pass line or
+    don't pass bet, full odds behind the pass line (from the ``"max_odds"``
+    setting), place bets on 6 and 8 (rounded to a multiple of $6), and the
+    field.
+
+    Args:
+        unit: Table minimum, in dollars.
+        rules: Table rules; defaults to ClassicRules.
+        settings: Overrides applied on top of the default table settings.
+
+    Returns:
+        dict[str, tuple[Bet, ...]]: Bets placed by each action, keyed by name.
+    """
+    rules = rules if rules is not None else ClassicRules()
+    max_odds = (settings or {}).get("max_odds", default_settings()["max_odds"])
+    place = 6 * math.ceil(unit / 6)
+    actions: dict[str, tuple[Bet, ...]] = {"none": (), "pass line": (PassLine(unit),)}
+    if rules.allow_dont_pass():
+        actions["don't pass"] = (DontPass(unit),)
+    for number in rules.point_numbers():
+        actions[f"odds {number}"] = (Odds(PassLine, number, unit * max_odds[number]),)
+    actions["place 6"] = (Place(6, place),)
+    actions["place 8"] = (Place(8, place),)
+    actions["place 6 and 8"] = (Place(6, place), Place(8, place))
+    actions["field"] = (Field(unit),)
+    return actions
+
+
+def _layout_key(table: Table, player: Player) -> Hashable:
+    """The point, whether a new shooter is up, and the bets on the layout."""
+    bets = sorted((_bet_key(bet) for bet in player.bets), key=repr)
+    return table.point.number, table.new_shooter, tuple(bets)
+
+
+def _place(player: Player, bets: Sequence[Bet]) -> bool:
+    """Add copies of ``bets`` to the layout, and return whether every one of
+    them was placed as a new bet."""
+    for bet in bets:
+        if player.already_placed(bet):
+            return False
+        player.add_bet(copy.copy(bet))
+        if not player.already_placed(bet):
+            return False
+    return True
+
+
+@dataclass(frozen=True)
+class OptimalPolicy:
+    """The best action, and the value it achieves, for every number of
+    shooters left, state of the layout, and wealth on the lattice.
+
+    Use :meth:`strategy` to play the policy on a table.
+    """
+
+    actions: Mapping[str, tuple[Bet, ...]]
+    """The action menu the policy chooses from."""
+    objective: Objective
+    """Quantity the policy maximizes."""
+    target: float
+    """Wealth at which the session ends in success."""
+    ruin: float
+    """Wealth at or below which the session ends in ruin."""
+    shooters: int
+    """Number of seven-outs in the session."""
+    bankrolls: np.ndarray
+    """Wealth lattice strictly between ``ruin`` and ``target``."""
+    values: np.ndarray
+    """``values[k, s, i]``: optimal objective with ``k`` shooters left, from
+    layout state ``s`` (0 being an empty table before the first come-out) and
+    wealth ``bankrolls[i]``."""
+    decisions: np.ndarray
+    """``decisions[k - 1, s, i]``: index in :attr:`actions` of the best action
+    with ``k`` shooters left, from layout state ``s`` and wealth
+    ``bankrolls[i]``."""
+    states: Mapping[Hashable, int]
+    """Index of each layout state, keyed by the point, whether a new shooter
+    is up, and the bets on the layout."""
+
+    def _wealth_index(self, wealth: float) -> int:
+        step = self.bankrolls[1] - self.bankrolls[0] if len(self.bankrolls) > 1 else 1
+        return int(round((wealth - self.bankrolls[0]) / step))
+
+    def value(self, bankroll: float) -> float:
+        """Optimal objective of a session started from ``bankroll`` on an
+        empty table, rounded to the wealth lattice."""
+        if bankroll <= self.ruin:
+            return bankroll if self.objective == "final" else 0.0
+        if bankroll >= self.target:
+            return bankroll if self.objective == "final" else 1.0
+        i = min(max(self._wealth_index(bankroll), 0), len(self.bankrolls) - 1)
+        return float(self.values[self.shooters, 0, i])
+
+    def choose(self, table: Table, player: Player, shooters_left: int) -> str | None:
+        """Return the name of the best action for ``player`` at ``table`` with
+        ``shooters_left`` seven-outs to go, or None if the session is over or
+        the layout is not one the policy can reach."""
+        state = self.states.get(_layout_key(table, player))
+        wealth = player.bankroll + player.total_bet_amount
+        if (
+            state is None
+            or not 0 < shooters_left <= self.shooters
+            or not self.ruin < wealth < self.target
+        ):
+            return None
+        i = min(max(self._wealth_index(wealth), 0), len(self.bankrolls) - 1)
+        return list(self.actions)[self.decisions[shooters_left - 1, state, i]]
+
+    def strategy(self) -> "PolicyStrategy":
+        """Return a strategy that plays the policy."""
+        return PolicyStrategy(self)
+
+
+class PolicyStrategy(Strategy):
+    """Strategy that plays an :class:`OptimalPolicy`.
+
+    Shooters are counted from the first roll after the strategy is reset, so
+    it should be played from the start of a session, with ``max_shooter`` set
+    to the policy's :attr:`~OptimalPolicy.shooters`. The strategy reports
+    itself completed once the player's wealth reaches the target or the ruin
+    level.
+    """
+
+    def __init__(self, policy: OptimalPolicy) -> None:
+        self.policy = policy
+        self._first_shooter: int | None = None
+
+    def update_bets(self, player: Player) -> None:
+        """Place the bets of the policy's best action for the player's layout,
+        wealth, and shooters left; place nothing once the session is over or
+        the layout is one the policy cannot reach."""
+        table = player.table
+        if self._first_shooter is None:
+            self._first_shooter = table.n_shooters
+        left = self.policy.shooters - (table.n_shooters - self._first_shooter)
+        action = self.policy.choose(table, player, left)  # type: ignore[arg-type]
+        for bet in self.policy.actions.get(action, ()) if action else ():
+            player.add_bet(copy.copy(bet))
+
+    def completed(self, player: Player) -> bool:
+        """Return True once the player's wealth (bankroll plus bets on the
+        layout) is at or beyond the policy's target or ruin level."""
+        wealth = player.bankroll + player.total_bet_amount
+        return not self.policy.ruin < wealth < self.policy.target
+
+    def reset(self) -> None:
+        """Restart the shooter count at the next roll."""
+        self._first_shooter = None
+
+    def snapshot(self) -> int | None:
+        """Return the table's shooter count when the strategy started, or
+        None if it has not played yet."""
+        return self._first_shooter
+
+    def restore(self, state: int | None) -> None:
+        """Restore the shooter count returned by :meth:`snapshot`."""
+        self._first_shooter = state
+
+
+class PolicySolver:
+    """Optimal betting policies of bankroll-limited sessions, by value
+    iteration over the state of the layout and the player's wealth.
+
+    Before each roll the player picks one action from a menu of bet bundles
+    (see :func:`default_actions`), placing its bets if they are allowed, not
+    already on the layout, and affordable; bets stay up until they resolve.
+    Every layout state reachable this way (the point, whether a new shooter is
+    up, and the bets on the layout) is found by playing every action and dice
+    outcome on a real table, as :func:`~crapssim.analysis.analyze_layout`
+    does, so the payouts follow the rules and settings in use.
+
+    :meth:`solve` then works backward over the shooters left. With ``k``
+    shooters left, the value of every state and wealth solves a Bellman
+    equation whose seven-out transitions lead to the values with ``k - 1``
+    left, which is iterated to a fixed point; shooters always end, so the
+    iteration converges for any menu. Wealth lives on a lattice of ``step``
+    dollars as in :class:`~crapssim.analysis.RuinSolver`, and the session ends
+    at the target, at ruin, or at the last seven-out.
+
+    Args:
+        actions: Bets placed by each action, keyed by name; an empty action
+            (betting nothing) is added first if missing. Defaults to
+            :func:`default_actions`.
+        rules: Table rules; defaults to ClassicRules.
+        settings: Overrides applied on top of the default table settings.
+        step: Wealth lattice step, in dollars; found from the wins if None.
+        max_states: Most layout states explored.
+
+    Raises:
+        ValueError: If the menu reaches more than ``max_states`` layout
+            states, or its wins are not on a lattice and no ``step`` is given.
+    """
+
+    def __init__(
+        self,
+        actions: Mapping[str, Sequence[Bet]] | None = None,
+        rules: Rules | None = None,
+        settings: Mapping[str, Any] | None = None,
+        *,
+        step: float | None = None,
+        max_states: int = 5000,
+    ) -> None:
+        if actions is None:
+            actions = default_actions(rules=rules, settings=settings)
+        menu = {name: tuple(bets) for name, bets in actions.items()}
+        if () not in menu.values():
+            menu = {"none": (), **menu}
+        empty = list(menu.values()).index(())
+        names = list(menu)
+        names.insert(0, names.pop(empty))
+        self.actions: dict[str, tuple[Bet, ...]] = {name: menu[name] for name in names}
+        """Bets placed by each action, keyed by name, the empty action first."""
+        self._explore(rules, settings, max_states)
+        self.step = _lattice_step(self._win) if step is None else float(step)
+        """Wealth lattice step, in dollars."""
+        self._offsets = np.rint(self._win / self.step).astype(np.intp)
+        self._margin = int(np.abs(self._offsets).max())
+        self._cache: dict[tuple[Any, ...], OptimalPolicy] = {}
+
+    def _explore(
+        self,
+        rules: Rules | None,
+        settings: Mapping[str, Any] | None,
+        max_states: int,
+    ) -> None:
+        """Play every allowed action and dice outcome from every reachable
+        layout state. Choices (a state and an action allowed from it) are
+        numbered in order of their state, with the empty action first."""
+        table, player = _build_table(NullStrategy(), rules, settings)
+        update = TableUpdate()
+        snapshots = [table.snapshot()]
+        self.states: dict[Hashable, int] = {_layout_key(table, player): 0}
+        """Index of each layout state."""
+        choice_state: list[int] = []
+        choice_action: list[int] = []
+        needs: list[float] = []
+        transitions: dict[tuple[int, int, float, bool], float] = {}
+
+        for i, snapshot in enumerate(snapshots):
+            for a, bets in enumerate(self.actions.values()):
+                table.restore(snapshot)
+                player.bankroll = _BANKROLL
+                if not _place(player, bets):
+                    continue
+                c = len(needs)
+                choice_state.append(i)
+                choice_action.append(a)
+                needs.append(player.total_bet_amount)
+                placed = table.snapshot()
+                wealth = player.bankroll + player.total_bet_amount
+                for outcomes in (_TOTALS, _PAIRS):
+                    table.dice.result_read = False  # type: ignore[attr-defined]
+                    played = []
+                    for outcome, p in outcomes:
+                        table.restore(placed)
+                        update.run(table, outcome)
+                        win = player.bankroll + player.total_bet_amount - wealth
+                        key = _layout_key(table, player)
+                        if key not in self.states:
+                            if len(snapshots) >= max_states:
+                                raise ValueError(
+                                    f"More than {max_states} layout states"
+                                )
+                            self.states[key] = len(snapshots)
+                            snapshots.append(table.snapshot())
+                        played.append((self.states[key], win, table.new_shooter, p))
+                    if not table.dice.result_read:  # type: ignore[attr-defined]
+                        break
+                for dst, win, seven_out, p in played:
+                    edge = (c, dst, win, seven_out)
+                    transitions[edge] = transitions.get(edge, 0.0) + p
+
+        self.n_states = len(snapshots)
+        """Number of layout states."""
+        self._choice_state = np.array(choice_state, dtype=np.intp)
+        self._choice_action = np.array(choice_action, dtype=np.intp)
+        self._need = np.array(needs)
+        self._first_choice = np.searchsorted(
+            self._choice_state, np.arange(len(snapshots))
+        )
+        edges = sorted(transitions)
+        self._src = np.array([e[0] for e in edges], dtype=np.intp)
+        self._dst = np.array([e[1] for e in edges], dtype=np.intp)
+        self._win = np.array([e[2] for e in edges])
+        self._seven_out = np.array([e[3] for e in edges], dtype=np.intp)
+        self._prob = np.array([transitions[e] for e in edges])
+
+    def _terminal(
+        self, objective: Objective, wealth: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Value of ending the session by ruin, by the target, and by the
+        horizon, at each wealth."""
+        ones, zeros = np.ones_like(wealth), np.zeros_like(wealth)
+        if objective == "target":
+            return zeros, ones, zeros
+        if objective == "survival":
+            return zeros, ones, ones
+        if objective == "final":
+            return wealth, wealth, wealth
+        raise ValueError(f"Unknown objective: {objective!r}")
+
+    def solve(
+        self,
+        target: float,
+        *,
+        ruin: float = 0.0,
+        shooters: int = 10,
+        objective: Objective = "target",
+    ) -> OptimalPolicy:
+        """Compute the optimal policy for sessions of ``shooters`` seven-outs.
+
+        Args:
+            target: Wealth at which the session ends in success.
+            ruin: Wealth at or below which the session ends in ruin.
+            shooters: Number of seven-outs in the session.
+            objective: Quantity to maximize.
+
+        Raises:
+            ValueError: If the limits or the objective are invalid.
+
+        Returns:
+            OptimalPolicy: The best action and its value for every state.
+        """
+        key = (target, ruin, shooters, objective)
+        if key not in self._cache:
+            if shooters < 1:
+                raise ValueError("shooters must be positive")
+            self._cache[key] = self._solve(target, ruin, shooters, objective)
+        return self._cache[key]
+
+    def _solve(
+        self, target: float, ruin: float, shooters: int, objective: Objective
+    ) -> OptimalPolicy:
+        lo = math.floor(ruin / self.step + 1e-9) + 1
+        hi = math.ceil(target / self.step - 1e-9)
+        if hi <= lo:
+            raise ValueError("The target must be above the ruin level")
+        m, g, n = self._margin, hi - lo, self.n_states
+        inner = slice(m, m + g)
+        wealth = np.arange(lo - m, hi + m) * self.step
+        ruined, reached, horizon = self._terminal(objective, wealth)
+
+        # values[k, s, :] is the value with k shooters left, with margins on
+        # both sides holding the value of ruin and of reaching the target
+        values = np.zeros((shooters + 1, n, g + 2 * m))
+        values[:, :, :m] = ruined[:m]
+        values[:, :, m + g :] = reached[m + g :]
+        values[0, :, inner] = horizon[inner]
+        decisions = np.zeros((shooters, n, g), dtype=np.intp)
+        infeasible = wealth[inner][np.newaxis, :] < self._need[:, np.newaxis] - 1e-9
+        infeasible[self._first_choice] = False
+        choices = np.arange(len(self._need))[:, np.newaxis]
+
+        # Every transition reads a window of g values from the flattened values
+        # with k - 1 and k shooters left; windows shared by several choices are
+        # read once, and summed with a matrix of choice-by-window probabilities
+        base = ((1 - self._seven_out) * n + self._dst) * (g + 2 * m) + m
+        starts, window = np.unique(base + self._offsets, return_inverse=True)
+        windows = starts[:, np.newaxis] + np.arange(g)
+        weights = np.zeros((len(self._need), len(starts)))
+        np.add.at(weights, (self._src, window), self._prob)
+
+        for k in range(1, shooters + 1):
+            values[k] = values[k - 1]
+            for _ in range(_MAX_SWEEPS):
+                q = weights @ values[k - 1 : k + 1].ravel()[windows]
+                q[infeasible] = -np.inf
+                best = np.maximum.reduceat(q, self._first_choice, axis=0)
+                change = np.abs(best - values[k, :, inner]).max()
+                values[k, :, inner] = best
+                if change < _TOL:
+                    break
+            else:
+                raise ValueError(f"No convergence within {_MAX_SWEEPS} sweeps")
+            # The earliest action within a tie of the best
+            tied = q >= best[self._choice_state] - _TIE
+            first = np.minimum.reduceat(
+                np.where(tied, choices, len(choices)), self._first_choice, axis=0
+            )
+            decisions[k - 1] = self._choice_action[first]
+
+        return OptimalPolicy(
+            actions=self.actions,
+            objective=objective,
+            target=target,
+            ruin=ruin,
+            shooters=shooters,
+            bankrolls=wealth[inner],
+            values=values[:, :, inner],
+            decisions=decisions,
+            states=self.states,
+        )
@@ -0,0 +1,161 @@
+"""Exact outcome probabilities of the Fire and All/Tall/Small bets."""
+
+from collections import Counter
+from fractions import Fraction
+from functools import cache
+from typing import Any, Iterable, Mapping
+
+from crapssim.analysis.bets import DICE_OUTCOMES, default_settings
+from crapssim.bet import All, Small, Tall, _ATSBet
+from crapssim.rules import ClassicRules, Rules
+
+__all__ = [
+    "fire_probabilities",
+    "fire_ev",
+    "ats_probability",
+    "ats_probabilities",
+    "ats_ev",
+]
+
+_TOTALS: dict[int, Fraction] = {
+    total: Fraction(n, 36)
+    for total, n in Counter(sum(o) for o in DICE_OUTCOMES).items()
+}
+"""Exact probability of each dice total."""
+
+_FIRE_POINTS = 6
+"""Number of unique points made at which the Fire bet ends on its own."""
+
+
+@cache
+def _fire(points: frozenset[int], made: frozenset[int]) -> tuple[Fraction, ...]:
+    """Probability of each number of unique points made when a Fire bet with
+    points ``made`` so far ends, from a come-out roll.
+
+    Come-out rolls that set no point change nothing, so the next point is
+    ``n`` with probability proportional to the probability of ``n``. Making a
+    point already made leads back here, which is solved for rather than
+    recursed into.
+    """
+    result = [Fraction(0)] * (_FIRE_POINTS + 1)
+    if len(made) == _FIRE_POINTS:
+        result[_FIRE_POINTS] = Fraction(1)
+        return tuple(result)
+    total = sum(_TOTALS[n] for n in points)
+    again = seven_out = Fraction(0)
+    for n in points:
+        p_point = _TOTALS[n] / total
+        p_made = _TOTALS[n] / (_TOTALS[n] + _TOTALS[7])
+        seven_out += p_point * (1 - p_made)
+        if n in made:
+            again += p_point * p_made
+            continue
+        for k, p in enumerate(_fire(points, made | {n})):
+            result[k] += p_point * p_made * p
+    result[len(made)] += seven_out
+    return tuple(p / (1 - again) for p in result)
+
+
+def fire_probabilities(
+    rules: Rules | None = None, points_made: Iterable[int] = ()
+) -> dict[int, Fraction]:
+    """Exact probability of each number of unique points made when a Fire bet
+    ends, i.e. at the first seven-out or the sixth unique point.
+
+    The probabilities are computed by recursion over the sets of points made,
+    using the point numbers of ``rules``, so they hold under any rules (with
+    CraplessRules, any six of the ten points end the bet).
+
+    Args:
+        rules: Table rules; defaults to ClassicRules.
+        points_made: Points already made, as in :attr:`~crapssim.bet.Fire.
+            points_made`, for a bet placed earlier in the shooter's turn.
+
+    Returns:
+        dict[int, Fraction]: Probability of ending with each number of points
+        made, from 0 to 6.
+    """
+    rules = rules or ClassicRules()
+    points = frozenset(rules.point_numbers())
+    made = frozenset(points_made)
+    if not made <= points:
+        raise ValueError(f"Points made {set(made)} are not all point numbers")
+    return dict(enumerate(_fire(points, made)))
+
+
+def fire_ev(
+    rules: Rules | None = None, settings: Mapping[str, Any] | None = None
+) -> Fraction:
+    """Exact expected net win of a $1 Fire bet under ``rules`` and the
+    ``"fire_payouts"`` of ``settings`` (overrides applied on top of the
+    default table settings). Numbers of points without a payout lose.
+    """
+    payouts = (settings or {}).get("fire_payouts", default_settings()["fire_payouts"])
+    return sum(
+        (
+            p * Fraction(payouts[k]) if k in payouts else -p
+            for k, p in fire_probabilities(rules).items()
+        ),
+        Fraction(0),
+    )
+
+
+@cache
+def _ats(numbers: frozenset[int], hit: frozenset[int]) -> Fraction:
+    """Probability that every one of ``numbers`` not in ``hit`` rolls before a
+    7. Rolls of other numbers change nothing."""
+    left = numbers - hit
+    if not left:
+        return Fraction(1)
+    p_left = sum(_TOTALS[n] for n in left)
+    return sum(
+        (_TOTALS[n] / (p_left + _TOTALS[7]) * _ats(numbers, hit | {n}) for n in left),
+        Fraction(0),
+    )
+
+
+def ats_probability(numbers: Iterable[int], hit: Iterable[int] = ()) -> Fraction:
+    """Exact probability that every one of ``numbers`` rolls before a 7.
+
+    All/Tall/Small bets lose on any 7, come-out or not, so the result does
+    not depend on the rules.
+
+    Args:
+        numbers: Dice totals to roll.
+        hit: Totals already rolled, as in :attr:`~crapssim.bet._ATSBet.
+            rolled_numbers`.
+
+    Returns:
+        Fraction: Probability of completing the set.
+    """
+    numbers = frozenset(numbers)
+    if 7 in numbers or not numbers <= _TOTALS.keys():
+        raise ValueError(f"Cannot roll all of {sorted(numbers)} before a 7")
+    return _ats(numbers, frozenset(hit) & numbers)
+
+
+def ats_probabilities() -> dict[str, Fraction]:
+    """Exact probability of completing the All, Tall, and Small bets, keyed by
+    their ``type`` (the keys of the ``"ATS_payouts"`` setting)."""
+    return {bet.type: ats_probability(bet.numbers) for bet in (All, Tall, Small)}
+
+
+def ats_ev(
+    bet_type: type[_ATSBet] | str, settings: Mapping[str, Any] | None = None
+) -> Fraction:
+    """Exact expected net win of a $1 All, Tall, or Small bet under the
+    ``"ATS_payouts"`` of ``settings`` (overrides applied on top of the default
+    table settings).
+
+    Args:
+        bet_type: The bet class, or its ``type`` (``"all"``, ``"tall"``, or
+            ``"small"``).
+        settings: Overrides applied on top of the default table settings.
+    """
+    bets = {bet.type: bet for bet in (All, Tall, Small)}
+    name = bet_type if isinstance(bet_type, str) else bet_type.type
+    if name not in bets:
+        raise ValueError(f"Unknown All/Tall/Small bet: {bet_type!r}")
+    payouts = (settings or {}).get("ATS_payouts", default_settings()["ATS_payouts"])
+    p = ats_probability(bets[name].numbers)
+    return p * Fraction(payouts[name]) - (1 - p)
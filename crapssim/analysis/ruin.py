@@ -0,0 +1,424 @@
+"""Exact ruin and target probabilities, and final-bankroll distributions, of
+bankroll-limited sessions."""
+
+import math
+from dataclasses import dataclass
+from fractions import Fraction
+from typing import Any, Mapping
+
+import numpy as np
+
+from crapssim.analysis.layout import _explore, _LayoutChain, _NotRepresentable
+from crapssim.rules import Rules
+from crapssim.strategy import Strategy
+
+__all__ = ["RuinCurve", "BankrollDistribution", "RuinSolver"]
+
+_TAIL = 1e-12
+"""Probability of a session still running at which a session without a roll
+limit is considered over."""
+
+_MAX_ROLLS = 100_000
+"""Most rolls iterated for a session without a roll limit."""
+
+_MAX_DENOMINATOR = 100
+"""Largest denominator of a win (in dollars) when finding the wealth lattice."""
+
+# Quantities computed by the backward recursion, along its second axis
+_RUIN, _TARGET, _FINAL, _DONE = range(4)
+
+
+@dataclass(frozen=True)
+class RuinCurve:
+    """Outcome probabilities of a session for every starting bankroll on the
+    wealth lattice strictly between the ruin level and the target."""
+
+    bankrolls: np.ndarray
+    """Starting bankrolls, in increasing order."""
+    p_ruin: np.ndarray
+    """Probability of ruin from each starting bankroll."""
+    p_target: np.ndarray
+    """Probability of reaching the target from each starting bankroll."""
+    expected_final: np.ndarray
+    """Expected final wealth from each starting bankroll."""
+
+    def at(self, bankroll: float) -> tuple[float, float, float]:
+        """Return the ruin probability, target probability, and expected final
+        wealth from ``bankroll``, which is rounded to the nearest bankroll of
+        the curve, or is ruined or at the target if outside of it."""
+        step = self.bankrolls[1] - self.bankrolls[0] if len(self.bankrolls) > 1 else 1
+        i = int(round((bankroll - self.bankrolls[0]) / step))
+        if i < 0:
+            return 1.0, 0.0, bankroll
+        if i >= len(self.bankrolls):
+            return 0.0, 1.0, bankroll
+        return (
+            float(self.p_ruin[i]),
+            float(self.p_target[i]),
+            float(self.expected_final[i]),
+        )
+
+
+@dataclass(frozen=True)
+class BankrollDistribution:
+    """Distribution of the final wealth of a session from one bankroll."""
+
+    values: np.ndarray
+    """Final wealth values, on the wealth lattice, in increasing order."""
+    probabilities: np.ndarray
+    """Probability of each final wealth."""
+    p_ruin: float
+    """Probability the session ended in ruin."""
+    p_target: float
+    """Probability the session ended by reaching the target."""
+
+    @property
+    def mean(self) -> float:
+        """Expected final wealth."""
+        return float(self.values @ self.probabilities)
+
+    def quantile(self, q: float) -> float:
+        """Smallest final wealth with cumulative probability of at least
+        ``q``."""
+        cdf = np.cumsum(self.probabilities)
+        i = int(np.searchsorted(cdf, q - 1e-12))
+        return float(self.values[min(i, len(self.values) - 1)])
+
+
+def _lattice_step(wins: np.ndarray) -> float:
+    """Largest step of which every win is a whole multiple."""
+    numerators = 0
+    denominators = 1
+    for win in np.unique(np.abs(wins)):
+        fraction = Fraction(float(win)).limit_denominator(_MAX_DENOMINATOR)
+        if abs(float(fraction) - win) > 1e-9:
+            raise ValueError(f"Win of {win} is not on a lattice; pass a step")
+        numerators = math.gcd(numerators, fraction.numerator)
+        denominators = math.lcm(denominators, fraction.denominator)
+    return numerators / denominators if numerators else 1.0
+
+
+def _lump(chain: _LayoutChain, offsets: np.ndarray) -> np.ndarray:
+    """Merge the states of ``chain`` that have the same future, i.e. the same
+    cash need, whether a new shooter is up, and probability of every wealth
+    offset into every merged state (e.g. states that differ only in the last
+    roll, which most layouts ignore). Returns the merged state of each state,
+    numbered in order of first appearance."""
+    classes = np.unique(
+        np.stack([chain.need, chain.new_shooter]), axis=1, return_inverse=True
+    )[1].ravel()
+    while True:
+        moves: list[dict[tuple[int, int], float]] = [{} for _ in classes]
+        for src, dst, offset, p in zip(chain.src, chain.dst, offsets, chain.prob):
+            move = (int(classes[dst]), int(offset))
+            moves[src][move] = moves[src].get(move, 0.0) + p
+        signatures: dict[tuple[Any, ...], int] = {}
+        refined = np.array(
+            [
+                signatures.setdefault(
+                    (int(c), tuple(sorted((m, round(p, 12)) for m, p in move.items()))),
+                    len(signatures),
+                )
+                for c, move in zip(classes, moves)
+            ]
+        )
+        if len(signatures) == len(np.unique(classes)):
+            return refined
+        classes = refined
+
+
+class RuinSolver:
+    """Exact outcome distributions of a static layout played with a limited
+    bankroll, by dynamic programming over the layout's Markov chain (see
+    :func:`~crapssim.analysis.analyze_layout`) and the player's wealth.
+
+    Wealth (bankroll plus bets on the layout) lives on a lattice of ``step``
+    dollars, found from the wins of every transition of the chain, so the
+    results are exact as long as the wins are whole multiples of ``step``
+    (otherwise they are rounded to it). A session ends when one of these comes
+    first:
+
+    * ruin: before a roll, the player's wealth is at most ``ruin``, or is less
+      than the cash the layout needs for the roll (the bets on it once the
+      strategy has placed its bets, and any upfront vig). A real player would
+      keep playing with what they can still afford, so ruin here means the
+      strategy can no longer be played as designed;
+    * target: the player's wealth is at least ``target``;
+    * the horizon: ``rolls`` rolls or ``shooters`` seven-outs, like
+      ``max_rolls`` and ``max_shooter`` of :meth:`~crapssim.table.Table.run`,
+      or never if neither is given.
+
+    The chain is built once, and every question reuses it.
+    :meth:`curve` solves the session backward from its end, which gives the
+    probabilities for every starting bankroll at the cost of one, and
+    :meth:`distribution` pushes the distribution of wealth forward from one
+    bankroll. Results are cached.
+
+    Args:
+        strategy: Static layout to analyze. It is copied, not modified.
+        rules: Table rules; defaults to ClassicRules.
+        settings: Overrides applied on top of the default table settings.
+        step: Wealth lattice step, in dollars; found from the wins if None.
+        max_states: Largest Markov chain built.
+
+    Raises:
+        ValueError: If the strategy is not a static layout, or its wins are
+            not on a lattice and no ``step`` is given.
+    """
+
+    def __init__(
+        self,
+        strategy: Strategy,
+        rules: Rules | None = None,
+        settings: Mapping[str, Any] | None = None,
+        *,
+        step: float | None = None,
+        max_states: int = 2000,
+    ) -> None:
+        try:
+            chain = _explore(strategy, rules, settings, max_states)
+        except _NotRepresentable as e:
+            raise ValueError(f"{strategy!r} is not a static layout: {e}") from None
+        self.step = _lattice_step(chain.win) if step is None else float(step)
+        """Wealth lattice step, in dollars."""
+
+        offsets = np.rint(chain.win / self.step).astype(np.intp)
+        classes = _lump(chain, offsets)
+        first = np.unique(classes, return_index=True)[1]
+        self.n_states = len(first)
+        """Number of states of the layout's Markov chain, once states with the
+        same future are merged."""
+        self.need = chain.need[first]
+        """Cash the layout needs on the roll from each state."""
+        self.new_shooter = chain.new_shooter[first]
+        """Whether each state follows a seven-out."""
+        self._start = int(classes[0])
+
+        kept = np.isin(chain.src, first)
+        self._offsets = np.unique(offsets)
+        self._margin = int(np.abs(self._offsets).max())
+        # One transition matrix per wealth offset, split by whether the
+        # transition is a seven-out
+        n = self.n_states
+        self._matrices = np.zeros((len(self._offsets), 2, n, n))
+        np.add.at(
+            self._matrices,
+            (
+                np.searchsorted(self._offsets, offsets[kept]),
+                chain.new_shooter[chain.dst[kept]].astype(np.intp),
+                classes[chain.src[kept]],
+                classes[chain.dst[kept]],
+            ),
+            chain.prob[kept],
+        )
+        self._cache: dict[tuple[Any, ...], Any] = {}
+
+    def _lattice(self, target: float, ruin: float) -> tuple[int, int]:
+        """First and past-the-last index of the wealth lattice strictly between
+        ``ruin`` and ``target``."""
+        lo = math.floor(ruin / self.step + 1e-9) + 1
+        hi = math.ceil(target / self.step - 1e-9)
+        if hi <= lo:
+            raise ValueError("The target must be above the ruin level")
+        return lo, hi
+
+    def _ruined(self, lo: int, hi: int) -> np.ndarray:
+        """Mask of the (state, wealth) cells where the layout cannot be
+        covered."""
+        wealth = np.arange(lo, hi) * self.step
+        return wealth[np.newaxis, :] < self.need[:, np.newaxis] - 1e-9
+
+    @staticmethod
+    def _check_horizon(rolls: int | None, shooters: int | None) -> None:
+        if rolls is not None and rolls < 0:
+            raise ValueError("rolls must be non-negative")
+        if shooters is not None and shooters < 1:
+            raise ValueError("shooters must be positive")
+
+    def curve(
+        self,
+        target: float,
+        *,
+        ruin: float = 0.0,
+        rolls: int | None = None,
+        shooters: int | None = None,
+    ) -> RuinCurve:
+        """Compute the ruin and target probabilities, and the expected final
+        wealth, from every starting bankroll.
+
+        Args:
+            target: Wealth at which the session ends in success.
+            ruin: Wealth at or below which the session ends in ruin.
+            rolls: Most rolls in the session, or None for no limit.
+            shooters: Most seven-outs in the session, or None for no limit.
+
+        Raises:
+            ValueError: If the limits are invalid, or a session without a roll
+                limit does not end.
+
+        Returns:
+            RuinCurve: Outcomes from every bankroll between ``ruin`` and
+            ``target``.
+        """
+        key = ("curve", target, ruin, rolls, shooters)
+        if key not in self._cache:
+            self._check_horizon(rolls, shooters)
+            self._cache[key] = self._backward(target, ruin, rolls, shooters)
+        return self._cache[key]
+
+    def _backward(
+        self, target: float, ruin: float, rolls: int | None, shooters: int | None
+    ) -> RuinCurve:
+        lo, hi = self._lattice(target, ruin)
+        m = self._margin
+        n, g = self.n_states, hi - lo
+        k = shooters or 1
+        wealth = np.arange(lo - m, hi + m) * self.step
+
+        # Values of each quantity, for each number of seven-outs left (0 being
+        # the end of the session), state, and wealth with margins on both sides
+        values = np.zeros((k + 1, n, 4, g + 2 * m))
+        values[:, :, _RUIN, :m] = 1.0
+        values[:, :, _TARGET, m + g :] = 1.0
+        values[:, :, _FINAL, :] = wealth
+        values[:, :, _DONE, :m] = values[:, :, _DONE, m + g :] = 1.0
+        values[0, :, _DONE, :] = 1.0
+        if rolls is not None:
+            # The session ends at the roll limit
+            values[1:, :, _DONE, :] = 1.0
+        ruined = self._ruined(lo, hi)
+        ruin_values = np.array([1.0, 0.0, 0.0, 1.0])[:, np.newaxis] * np.ones(g)
+        ruin_values[_FINAL] = wealth[m : m + g]
+        columns = np.nonzero(ruined)[1]
+
+        inner = slice(m, m + g)
+        limit = rolls if rolls is not None else _MAX_ROLLS
+        for _ in range(limit):
+            updated = np.zeros((k, n, 4 * g))
+            for o, offset in enumerate(self._offsets):
+                window = values[:, :, :, m + offset : m + offset + g].reshape(
+                    k + 1, n, 4 * g
+                )
+                same, seven_out = self._matrices[o]
+                if shooters is None:
+                    updated += (same + seven_out) @ window[1:]
+                else:
+                    updated += same @ window[1:] + seven_out @ window[:-1]
+            updated = updated.reshape(k, n, 4, g)
+            for q in range(4):
+                updated[:, :, q, :][:, ruined] = ruin_values[q, columns]
+            done = updated[-1, self._start, _DONE]
+            values[1:, :, :, inner] = updated
+            if rolls is None and done.min() >= 1 - _TAIL:
+                break
+        else:
+            if rolls is None:
+                raise ValueError(f"The session does not end within {limit} rolls")
+
+        start = values[k, self._start, :, inner]
+        return RuinCurve(
+            bankrolls=wealth[inner],
+            p_ruin=start[_RUIN],
+            p_target=start[_TARGET],
+            expected_final=start[_FINAL],
+        )
+
+    def distribution(
+        self,
+        bankroll: float,
+        target: float,
+        *,
+        ruin: float = 0.0,
+        rolls: int | None = None,
+        shooters: int | None = None,
+    ) -> BankrollDistribution:
+        """Compute the distribution of final wealth from ``bankroll``.
+
+        Args:
+            bankroll: Starting bankroll, rounded to the wealth lattice.
+            target: Wealth at which the session ends in success.
+            ruin: Wealth at or below which the session ends in ruin.
+            rolls: Most rolls in the session, or None for no limit.
+            shooters: Most seven-outs in the session, or None for no limit.
+
+        Raises:
+            ValueError: If the limits are invalid, or a session without a roll
+                limit does not end.
+
+        Returns:
+            BankrollDistribution: Distribution of the final wealth, which for a
+            session ended by ruin or the target is the wealth it ended with.
+        """
+        start = int(round(bankroll / self.step))
+        key = ("distribution", start, target, ruin, rolls, shooters)
+        if key not in self._cache:
+            self._check_horizon(rolls, shooters)
+            self._cache[key] = self._forward(start, target, ruin, rolls, shooters)
+        return self._cache[key]
+
+    def _forward(
+        self,
+        start: int,
+        target: float,
+        ruin: float,
+        rolls: int | None,
+        shooters: int | None,
+    ) -> BankrollDistribution:
+        lo, hi = self._lattice(target, ruin)
+        if not lo <= start < hi:
+            reached = start >= hi
+            return BankrollDistribution(
+                values=np.array([start * self.step]),
+                probabilities=np.ones(1),
+                p_ruin=float(not reached),
+                p_target=float(reached),
+            )
+        m = self._margin
+        n, g = self.n_states, hi - lo
+        k = shooters or 1
+        inner = slice(m, m + g)
+        ruined = self._ruined(lo, hi)
+
+        # Probability of each number of seven-outs left, state, and wealth, for
+        # the sessions still running
+        running = np.zeros((k + 1, n, g))
+        running[k, self._start, start - lo] = 1.0
+        # Probability of each final wealth (with margins on both sides) of the
+        # sessions ended by ruin, by the target, and by the horizon
+        ended = np.zeros((3, g + 2 * m))
+        ended[0, inner] = (running[1:] * ruined).sum(axis=(0, 1))
+        running[1:] *= ~ruined
+
+        limit = rolls if rolls is not None else _MAX_ROLLS
+        for _ in range(limit):
+            if rolls is None and running.sum() < _TAIL:
+                break
+            rolled = np.zeros((k + 1, n, g + 2 * m))
+            for o, offset in enumerate(self._offsets):
+                window = slice(m + offset, m + offset + g)
+                same, seven_out = self._matrices[o]
+                if shooters is None:
+                    rolled[1:, :, window] += (same + seven_out).T @ running[1:]
+                else:
+                    rolled[1:, :, window] += same.T @ running[1:]
+                    rolled[:-1, :, window] += seven_out.T @ running[1:]
+            ended[0, :m] += rolled[:, :, :m].sum(axis=(0, 1))
+            ended[1, m + g :] += rolled[:, :, m + g :].sum(axis=(0, 1))
+            ended[2, inner] += rolled[0, :, inner].sum(axis=0)
+            running = rolled[:, :, inner]
+            running[0] = 0.0
+            ended[0, inner] += (running[1:] * ruined).sum(axis=(0, 1))
+            running[1:] *= ~ruined
+        else:
+            if rolls is None:
+                raise ValueError(f"The session does not end within {limit} rolls")
+        ended[2, inner] += running.sum(axis=(0, 1))
+
+        probabilities = ended.sum(axis=0)
+        kept = probabilities > 0
+        return BankrollDistribution(
+            values=np.arange(lo - m, hi + m)[kept] * self.step,
+            probabilities=probabilities[kept],
+            p_ruin=float(ended[0].sum()),
+            p_target=float(ended[1].sum()),
+        )
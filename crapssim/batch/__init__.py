@@ -0,0 +1,52 @@
+"""
+Run many table sessions of an experiment and aggregate the results. Sessions are
+seeded from the experiment's seed root and the session index, so any range of
+sessions can be run on its own, in parallel, resumed from a checkpoint, or
+sharded across hosts through a file-system work queue.
+"""
+
+from crapssim.batch.cache import ResultCache, experiment_key
+from crapssim.batch.checkpoint import Checkpoint
+from crapssim.batch.control import ControlledStats, ControlVariateSummary
+from crapssim.batch.experiment import (
+    Experiment,
+    PlayerOutcome,
+    SessionResult,
+    run_session,
+    session_seed,
+)
+from crapssim.batch.fanchart import BANDS, FanChart
+from crapssim.batch.importance import Event, ImportanceSummary, WeightedStats
+from crapssim.batch.queue import (
+    QueueStatus,
+    Shard,
+    claim_shard,
+    merge_results,
+    queue_status,
+    requeue_stale,
+    submit_shards,
+    work,
+)
+from crapssim.batch.reservoir import SessionPath, TrajectoryReservoir
+from crapssim.batch.runner import BatchResult, run_batch, run_range
+from crapssim.batch.sequential import Estimate, PrecisionResult, run_until_precise
+from crapssim.batch.stats import (
+    Comoments,
+    CovarianceMatrix,
+    Moments,
+    QuantileSketch,
+)
+from crapssim.batch.summary import Aggregate, Metric, StrategyStats, Summary
+from crapssim.batch.sweep import (
+    ResultStore,
+    Sweep,
+    SweepPoint,
+    SweepResult,
+    run_sweep,
+)
+from crapssim.batch.tournament import (
+    PairedNet,
+    Standing,
+    TournamentResult,
+    run_tournament,
+)
@@ -0,0 +1,47 @@
+"""Command line entry point for file-system work queue workers.
+
+Usage::
+
+    python -m crapssim.batch work QUEUE_DIR
+    python -m crapssim.batch status QUEUE_DIR
+    python -m crapssim.batch requeue QUEUE_DIR --older-than 3600
+"""
+
+import argparse
+from typing import Sequence
+
+from crapssim.batch.queue import queue_status, requeue_stale, work
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Command line entry point for workers and queue status."""
+    parser = argparse.ArgumentParser(
+        prog="python -m crapssim.batch",
+        description="Run or inspect a crapssim file-system work queue.",
+    )
+    parser.add_argument("command", choices=["work", "status", "requeue"])
+    parser.add_argument("queue_dir")
+    parser.add_argument(
+        "--max-shards", type=int, default=None, help="stop after this many shards"
+    )
+    parser.add_argument(
+        "--older-than",
+        type=float,
+        default=3600.0,
+        help="seconds after which a claim is stale (requeue)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.command == "work":
+        n_run = work(args.queue_dir, max_shards=args.max_shards)
+        print(f"Ran {n_run} shards")
+    elif args.command == "requeue":
+        n_requeued = requeue_stale(args.queue_dir, args.older_than)
+        print(f"Requeued {n_requeued} shards")
+    else:
+        status = queue_status(args.queue_dir)
+        print(f"pending={status.pending} claimed={status.claimed} done={status.done}")
+
+
+if __name__ == "__main__":
+    main()
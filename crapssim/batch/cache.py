@@ -0,0 +1,242 @@
+"""Content-addressed on-disk cache of batch results."""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Callable
+
+import crapssim
+from crapssim.batch.experiment import Experiment
+from crapssim.batch.runner import BatchResult, run_batch
+from crapssim.batch.summary import Aggregate, Summary
+from crapssim.strategy import serialize
+
+__all__ = ["experiment_key", "ResultCache"]
+
+_CACHE_VERSION = 1
+"""Version of the serialized form of cache entries."""
+
+
+def experiment_key(
+    experiment: Experiment, aggregate: Callable[[], Aggregate] = Summary
+) -> str:
+    """Return a content hash identifying the results of an experiment.
+
+    The hash covers everything that determines the sessions' outcomes (the
+    canonical form of the experiment from :meth:`Experiment.to_dict`: the
+    strategies and their configuration, bankroll, limits, rules, settings, and
+    seed root), the aggregate type, and the crapssim version, but not the
+    session range.
+
+    Raises:
+        TypeError: If a strategy cannot be serialized.
+
+    Returns:
+        str: Hex digest.
+    """
+    content = [crapssim.__version__, experiment.to_dict()]
+    digest = hashlib.sha256(serialize.canonical_json(content).encode())
+    digest.update(pickle.dumps(aggregate))
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """On-disk cache of session-range aggregates, keyed by experiment content.
+
+    Each experiment (see :func:`experiment_key`) has a directory holding one
+    file per cached session range. A repeated request is loaded from disk,
+    and a request that extends cached ranges, e.g. from sessions
+    ``[0, 100_000)`` to ``[0, 1_000_000)``, only runs the missing sessions
+    and merges them with the cached aggregates in session order. Ranges made
+    redundant by a larger one are removed.
+
+    The cache implements :class:`~crapssim.batch.sweep.ResultStore`, so it
+    can be passed to :func:`~crapssim.batch.sweep.run_sweep`.
+
+    Args:
+        directory: Cache directory, created when the first result is stored.
+    """
+
+    def __init__(self, directory: str | os.PathLike[str]) -> None:
+        self.directory = Path(directory)
+
+    def _entry_dir(self, experiment: Experiment, aggregate: Callable) -> Path:
+        return self.directory / experiment_key(experiment, aggregate)
+
+    def ranges(
+        self, experiment: Experiment, aggregate: Callable[[], Aggregate] = Summary
+    ) -> list[tuple[int, int]]:
+        """Return the cached session ranges of ``experiment``, sorted."""
+        entry = self._entry_dir(experiment, aggregate)
+        if not entry.is_dir():
+            return []
+        ranges = []
+        for path in entry.glob("*.pkl"):
+            start, _, stop = path.stem.partition("-")
+            ranges.append((int(start), int(stop)))
+        return sorted(ranges)
+
+    def missing(
+        self,
+        experiment: Experiment,
+        start: int,
+        stop: int,
+        aggregate: Callable[[], Aggregate] = Summary,
+    ) -> list[tuple[int, int]]:
+        """Return the session ranges of ``[start, stop)`` that would be run."""
+        return [
+            (a, b)
+            for a, b, cached in self._plan(experiment, start, stop, aggregate)
+            if not cached
+        ]
+
+    def _plan(
+        self, experiment: Experiment, start: int, stop: int, aggregate: Callable
+    ) -> list[tuple[int, int, bool]]:
+        """Split ``[start, stop)`` into cached ranges and ranges to run."""
+        ranges = [(a, b) for a, b in self.ranges(experiment, aggregate) if b <= stop]
+        plan = []
+        cursor = start
+        while cursor < stop:
+            ends = [b for a, b in ranges if a == cursor]
+            if ends:
+                plan.append((cursor, max(ends), True))
+                cursor = max(ends)
+            else:
+                gap_stop = min((a for a, _ in ranges if a > cursor), default=stop)
+                plan.append((cursor, gap_stop, False))
+                cursor = gap_stop
+        return plan
+
+    def _load(
+        self, experiment: Experiment, start: int, stop: int, aggregate: Callable
+    ) -> Aggregate:
+        path = self._entry_dir(experiment, aggregate) / f"{start}-{stop}.pkl"
+        with open(path, "rb") as f:
+            version, result = pickle.load(f)
+        if version != _CACHE_VERSION:
+            raise ValueError(f"Unsupported cache entry version: {version}")
+        return result
+
+    def get(
+        self,
+        experiment: Experiment,
+        start: int,
+        stop: int,
+        *,
+        aggregate: Callable[[], Aggregate] = Summary,
+    ) -> Aggregate | None:
+        """Return the aggregate of sessions ``[start, stop)`` if fully cached.
+
+        Args:
+            experiment: Experiment that was run.
+            start: First session index.
+            stop: One past the last session index.
+            aggregate: Factory the aggregate was created with.
+
+        Returns:
+            The aggregate, merged from cached ranges, or None if some sessions
+            are not cached.
+        """
+        plan = self._plan(experiment, start, stop, aggregate)
+        if not all(cached for _, _, cached in plan):
+            return None
+        if not plan:
+            return aggregate()
+        result = self._load(experiment, *plan[0][:2], aggregate)
+        for a, b, _ in plan[1:]:
+            result.merge(self._load(experiment, a, b, aggregate))
+        return result
+
+    def put(
+        self,
+        experiment: Experiment,
+        start: int,
+        stop: int,
+        result: Aggregate,
+        *,
+        aggregate: Callable[[], Aggregate] = Summary,
+    ) -> None:
+        """Store the aggregate of sessions ``[start, stop)``.
+
+        The file is written to a temporary name and then renamed, so readers
+        never see a partial entry. Cached ranges inside ``[start, stop)`` are
+        removed afterwards.
+
+        Args:
+            experiment: Experiment that was run.
+            start: First session index.
+            stop: One past the last session index.
+            result: Aggregate of the sessions.
+            aggregate: Factory the aggregate was created with.
+        """
+        entry = self._entry_dir(experiment, aggregate)
+        entry.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=entry, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((_CACHE_VERSION, result), f)
+            os.replace(tmp_name, entry / f"{start}-{stop}.pkl")
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+        for a, b in self.ranges(experiment, aggregate):
+            if start <= a and b <= stop and (a, b) != (start, stop):
+                (entry / f"{a}-{b}.pkl").unlink(missing_ok=True)
+
+    def run(
+        self,
+        experiment: Experiment,
+        n_sessions: int,
+        *,
+        start: int = 0,
+        chunk_size: int = 1000,
+        workers: int = 1,
+        aggregate: Callable[[], Aggregate] = Summary,
+    ) -> BatchResult:
+        """Run ``n_sessions`` sessions of ``experiment``, reusing cached ranges.
+
+        Cached ranges are loaded, the remaining ranges are run with
+        :func:`~crapssim.batch.runner.run_batch`, and the parts are merged
+        in session order. The merged result is stored for later calls.
+
+        Args:
+            experiment: Experiment to run.
+            n_sessions: Number of sessions.
+            start: First session index.
+            chunk_size: Number of sessions per chunk of the missing ranges.
+            workers: Number of worker processes.
+            aggregate: Factory for the empty aggregate to update.
+
+        Returns:
+            BatchResult: The aggregate of the sessions.
+        """
+        stop = start + n_sessions
+        plan = self._plan(experiment, start, stop, aggregate)
+        if len(plan) == 1 and plan[0][2]:
+            result = self._load(experiment, start, stop, aggregate)
+            return BatchResult(experiment, start, stop, result)
+
+        result = None
+        for a, b, cached in plan:
+            if cached:
+                part = self._load(experiment, a, b, aggregate)
+            else:
+                part = run_batch(
+                    experiment,
+                    b - a,
+                    start=a,
+                    chunk_size=chunk_size,
+                    workers=workers,
+                    aggregate=aggregate,
+                ).aggregate
+            if result is None:
+                result = part
+            else:
+                result.merge(part)
+        if result is None:
+            result = aggregate()
+        self.put(experiment, start, stop, result, aggregate=aggregate)
+        return BatchResult(experiment, start, stop, result)
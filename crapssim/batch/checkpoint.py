@@ -0,0 +1,119 @@
+"""On-disk checkpoints of partially completed batch runs."""
+
+import os
+import pickle
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+__all__ = ["CHECKPOINT_FILE", "Checkpoint"]
+
+CHECKPOINT_FILE = "checkpoint.pkl"
+"""Name of the checkpoint file inside a checkpoint directory."""
+
+_CHECKPOINT_VERSION = 1
+"""Version of the serialized form written by ``Checkpoint.save``."""
+
+
+@dataclass
+class Checkpoint:
+    """Progress of a batch run over the sessions ``[start, stop)``.
+
+    The sessions are run in chunks of ``chunk_size``. Sessions before
+    ``next_index`` have been merged, in order, into ``aggregate``; chunks that
+    finished ahead of that prefix (e.g. on another worker) are kept in
+    ``pending`` until the chunks before them finish. Because the dice of each
+    session are seeded from the session index, ``next_index`` and ``pending``
+    are also the complete random number generator position of the run.
+    """
+
+    fingerprint: str
+    """Identity of the run (see :func:`~crapssim.batch.runner.run_fingerprint`)."""
+    start: int
+    """First session index of the run."""
+    stop: int
+    """One past the last session index of the run."""
+    chunk_size: int
+    """Number of sessions per chunk."""
+    next_index: int
+    """First session index not yet merged into ``aggregate``."""
+    aggregate: Any
+    """Aggregate of the sessions ``[start, next_index)``."""
+    pending: dict[int, tuple[int, Any]] = field(default_factory=dict)
+    """Aggregates of completed chunks after ``next_index``, as
+    ``{chunk start: (chunk stop, aggregate)}``."""
+
+    @property
+    def done(self) -> bool:
+        """Whether every session of the run has been merged."""
+        return self.next_index >= self.stop
+
+    @property
+    def completed_ranges(self) -> list[tuple[int, int]]:
+        """Completed session index ranges, as sorted ``(start, stop)`` pairs."""
+        ranges: list[tuple[int, int]] = []
+        if self.next_index > self.start:
+            ranges.append((self.start, self.next_index))
+        for chunk_start, (chunk_stop, _) in sorted(self.pending.items()):
+            if ranges and ranges[-1][1] == chunk_start:
+                ranges[-1] = (ranges[-1][0], chunk_stop)
+            else:
+                ranges.append((chunk_start, chunk_stop))
+        return ranges
+
+    def add_chunk(self, chunk_start: int, chunk_stop: int, aggregate: Any) -> None:
+        """Record a completed chunk and merge any chunks that are now in order.
+
+        Args:
+            chunk_start: First session index of the chunk.
+            chunk_stop: One past the last session index of the chunk.
+            aggregate: Aggregate of the chunk's sessions.
+        """
+        self.pending[chunk_start] = (chunk_stop, aggregate)
+        while self.next_index in self.pending:
+            chunk_stop, chunk_aggregate = self.pending.pop(self.next_index)
+            self.aggregate.merge(chunk_aggregate)
+            self.next_index = chunk_stop
+
+    def save(self, directory: str | os.PathLike[str]) -> None:
+        """Write the checkpoint to ``directory``.
+
+        The file is written to a temporary name and then renamed, so an
+        interruption while saving leaves the previous checkpoint intact.
+
+        Args:
+            directory: Checkpoint directory, created if needed.
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((_CHECKPOINT_VERSION, self), f)
+            os.replace(tmp_name, directory / CHECKPOINT_FILE)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+    @classmethod
+    def load(cls, directory: str | os.PathLike[str]) -> "Checkpoint | None":
+        """Read the checkpoint in ``directory``.
+
+        Args:
+            directory: Checkpoint directory.
+
+        Returns:
+            The checkpoint, or None if the directory has no checkpoint.
+
+        Raises:
+            ValueError: If the checkpoint was written by an unsupported version.
+        """
+        path = Path(directory) / CHECKPOINT_FILE
+        if not path.exists():
+            return None
+        with open(path, "rb") as f:
+            version, checkpoint = pickle.load(f)
+        if version != _CHECKPOINT_VERSION:
+            raise ValueError(f"Unsupported checkpoint version: {version}")
+        return checkpoint
@@ -0,0 +1,163 @@
+"""Control-variate estimates of mean session outcomes."""
+
+import math
+from dataclasses import dataclass, field
+from typing import Iterator
+
+import numpy as np
+
+from crapssim.batch.experiment import PlayerOutcome, SessionResult
+from crapssim.batch.stats import CovarianceMatrix
+
+__all__ = ["ControlledStats", "ControlVariateSummary"]
+
+
+def _widen(stats: CovarianceMatrix, size: int) -> CovarianceMatrix:
+    """Pad ``stats`` with components that were zero in every vector."""
+    extra = size - len(stats.mean)
+    if extra <= 0:
+        return stats
+    result = CovarianceMatrix(size)
+    result.count = stats.count
+    result.mean[: len(stats.mean)] = stats.mean
+    result.m2[: len(stats.mean), : len(stats.mean)] = stats.m2
+    return result
+
+
+@dataclass
+class ControlledStats:
+    """Net wins of one strategy's sessions with the strategy's control
+    variates, one per bet type (see
+    :attr:`~crapssim.batch.experiment.PlayerOutcome.controls`).
+
+    The controls have mean zero exactly, and most of a session's luck is in
+    them: a pass line player's net win is mostly the net win of the pass line
+    bets. Subtracting the best linear combination of the controls, fitted by
+    least squares on the same sessions, leaves an estimate of the mean net win
+    whose variance is that of the part of the net win the controls do not
+    explain.
+    """
+
+    labels: list[str] = field(default_factory=list)
+    """Bet types of the controls, in the order of :attr:`stats`."""
+    stats: CovarianceMatrix = field(default_factory=lambda: CovarianceMatrix(1))
+    """Mean and covariance of the vectors of the net win followed by the
+    controls."""
+
+    def _widen(self, labels: list[str]) -> None:
+        for label in labels:
+            if label not in self.labels:
+                self.labels.append(label)
+        self.stats = _widen(self.stats, len(self.labels) + 1)
+
+    def add(self, outcome: PlayerOutcome) -> None:
+        """Add one session's outcome."""
+        self._widen(list(outcome.controls))
+        values = np.zeros(len(self.labels) + 1)
+        values[0] = outcome.net
+        for i, label in enumerate(self.labels, 1):
+            values[i] = outcome.controls.get(label, 0.0)
+        self.stats.add(values)
+
+    def merge(self, other: "ControlledStats") -> None:
+        """Add the sessions counted by ``other``."""
+        self._widen(other.labels)
+        order = [0] + [self.labels.index(label) + 1 for label in other.labels]
+        aligned = CovarianceMatrix(len(self.labels) + 1)
+        aligned.count = other.stats.count
+        aligned.mean[order] = other.stats.mean
+        aligned.m2[np.ix_(order, order)] = other.stats.m2
+        self.stats.merge(aligned)
+
+    @property
+    def count(self) -> int:
+        """Number of sessions."""
+        return self.stats.count
+
+    def _fit(self) -> tuple[np.ndarray, float]:
+        """Least-squares coefficients of the net win on the controls, and the
+        residual variance per session."""
+        m2 = self.stats.m2
+        coef, *_ = np.linalg.lstsq(m2[1:, 1:], m2[1:, 0], rcond=None)
+        residual = max(m2[0, 0] - m2[0, 1:] @ coef, 0.0)
+        rank = np.linalg.matrix_rank(m2[1:, 1:]) if len(coef) else 0
+        dof = self.count - 1 - rank
+        return coef, residual / dof if dof > 0 else math.nan
+
+    @property
+    def coefficients(self) -> dict[str, float]:
+        """Fitted coefficient of each control."""
+        coef, _ = self._fit()
+        return dict(zip(self.labels, coef.tolist()))
+
+    def plain(self) -> tuple[float, float]:
+        """Return the sample mean net win and its standard error."""
+        if not self.count:
+            return math.nan, math.nan
+        variance = self.stats.covariance[0, 0]
+        return float(self.stats.mean[0]), math.sqrt(variance / self.count)
+
+    def estimate(self) -> tuple[float, float]:
+        """Return the control-variate estimate of the mean net win and its
+        standard error.
+
+        The estimate is consistent, with a bias of order ``1 / count`` from
+        fitting the coefficients; the standard error is that of the
+        regression intercept, which holds for a few hundred sessions or more.
+        """
+        if not self.count:
+            return math.nan, math.nan
+        coef, variance = self._fit()
+        mean = self.stats.mean
+        return float(mean[0] - mean[1:] @ coef), math.sqrt(variance / self.count)
+
+    def variance_reduction(self) -> float:
+        """Variance of the plain mean over that of the control-variate
+        estimate: how many times fewer sessions the estimate needs for the same
+        precision."""
+        _, plain = self.plain()
+        _, controlled = self.estimate()
+        return (plain / controlled) ** 2 if controlled else math.nan
+
+
+@dataclass
+class ControlVariateSummary:
+    """Control-variate estimates of each strategy's mean net win.
+
+    Use it as the aggregate of :func:`~crapssim.batch.runner.run_batch`; it
+    has every session record its control variates. The controls come from an
+    exact model of every bet on every roll (see
+    :class:`~crapssim.analysis.RollModel`), so they have mean zero whatever
+    the strategy and however the session ends, and the estimates need no
+    knowledge of the strategy's own edge.
+    """
+
+    needs_controls = True
+
+    sessions: int = 0
+    """Number of sessions aggregated."""
+    strategies: dict[str, ControlledStats] = field(default_factory=dict)
+    """Statistics of each strategy, keyed by strategy name."""
+
+    def _stats(self, name: str) -> ControlledStats:
+        if name not in self.strategies:
+            self.strategies[name] = ControlledStats()
+        return self.strategies[name]
+
+    def update(self, session: SessionResult) -> None:
+        """Add one session to the summary."""
+        self.sessions += 1
+        for player in session.players:
+            self._stats(player.name).add(player)
+
+    def merge(self, other: "ControlVariateSummary") -> None:
+        """Add the sessions of ``other`` to this summary, in place."""
+        self.sessions += other.sessions
+        for name, stats in other.strategies.items():
+            self._stats(name).merge(stats)
+
+    def __getitem__(self, name: str) -> ControlledStats:
+        return self.strategies[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.strategies)
@@ -0,0 +1,301 @@
+"""Experiment definitions and single-session execution for batch runs."""
+
+import copy
+from dataclasses import dataclass, field
+from typing import Any, Mapping
+
+import numpy as np
+
+from crapssim.analysis.bets import RollModel
+from crapssim.dice import TiltedDice
+from crapssim.rules import Rules
+from crapssim.strategy import Strategy, serialize
+from crapssim.table import Table
+
+__all__ = [
+    "Experiment",
+    "PlayerOutcome",
+    "SessionResult",
+    "session_seed",
+    "run_session",
+]
+
+
+@dataclass(frozen=True)
+class Experiment:
+    """Description of a many-session experiment.
+
+    Every session seats one player per strategy at the same table, so all
+    strategies see the same dice. The dice for session ``i`` depend only on
+    ``seed_root`` and ``i`` (see :func:`session_seed`), which makes any range
+    of sessions reproducible on its own.
+    """
+
+    strategies: Mapping[str, Strategy]
+    """Strategies to compare, keyed by player name."""
+    bankroll: float = 300
+    """Starting bankroll of every player."""
+    max_rolls: float = float("inf")
+    """Maximum number of rolls per session."""
+    max_shooter: float = 10
+    """Maximum number of shooters per session."""
+    runout: bool = False
+    """If True, keep rolling after the limits until all bets are resolved."""
+    rules: Rules | None = None
+    """Rules for the table; defaults to ClassicRules."""
+    settings: Mapping[str, Any] = field(default_factory=dict)
+    """Overrides applied on top of the default table settings."""
+    seed_root: int = 0
+    """Root of the per-session seeds."""
+    dice_probabilities: tuple[float, ...] | None = None
+    """For importance sampling, the probability of each of the 36 ordered dice
+    outcomes to roll from (see :class:`~crapssim.dice.TiltedDice`), with each
+    session weighted by its likelihood ratio; fair dice if None."""
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the canonical, versioned form of the experiment.
+
+        Strategies and rules are encoded with
+        :func:`crapssim.strategy.serialize.encode`, so equally configured
+        experiments have the same form, which is plain JSON.
+
+        Raises:
+            TypeError: If a strategy cannot be serialized.
+        """
+        form = {
+            "format": serialize.FORMAT_VERSION,
+            "strategies": [
+                [name, serialize.encode(strategy)]
+                for name, strategy in self.strategies.items()
+            ],
+            "bankroll": serialize.encode(self.bankroll),
+            "max_rolls": serialize.encode(self.max_rolls),
+            "max_shooter": serialize.encode(self.max_shooter),
+            "runout": self.runout,
+            "rules": serialize.encode(self.rules),
+            "settings": serialize.encode(dict(self.settings)),
+            "seed_root": self.seed_root,
+        }
+        # Only tilted experiments carry the key, so fair experiments keep the
+        # form (and hash) they had before importance sampling existed
+        if self.dice_probabilities is not None:
+            form["dice_probabilities"] = serialize.encode(list(self.dice_probabilities))
+        return form
+
+    @classmethod
+    def from_dict(
+        cls, data: dict[str, Any], *, allow_import: bool = False
+    ) -> "Experiment":
+        """Rebuild an experiment from the form returned by :meth:`to_dict`.
+
+        Args:
+            data: The encoded experiment.
+            allow_import: Whether unregistered classes may be imported by path.
+
+        Raises:
+            ValueError: If the format version is unsupported or a class is
+                unknown.
+        """
+        if data.get("format") != serialize.FORMAT_VERSION:
+            raise ValueError(f"Unsupported experiment format: {data.get('format')!r}")
+
+        def decode(value: Any) -> Any:
+            return serialize.decode(value, allow_import=allow_import)
+
+        return cls(
+            strategies={
+                name: decode(strategy) for name, strategy in data["strategies"]
+            },
+            bankroll=decode(data["bankroll"]),
+            max_rolls=decode(data["max_rolls"]),
+            max_shooter=decode(data["max_shooter"]),
+            runout=data["runout"],
+            rules=decode(data["rules"]),
+            settings=decode(data["settings"]),
+            seed_root=data["seed_root"],
+            dice_probabilities=(
+                tuple(decode(data["dice_probabilities"]))
+                if "dice_probabilities" in data
+                else None
+            ),
+        )
+
+    def build_table(self) -> Table:
+        """Create a table with this experiment's rules, settings, and players.
+
+        Returns:
+            Table: A table ready for :func:`run_session`.
+        """
+        table = Table(rules=self.rules)
+        if self.dice_probabilities is not None:
+            table.dice = TiltedDice(self.dice_probabilities)
+        table.settings.update(copy.deepcopy(dict(self.settings)))  # type: ignore[typeddict-item]
+        for name, strategy in self.strategies.items():
+            table.add_player(self.bankroll, strategy, name=name)
+        return table
+
+
+@dataclass(slots=True, frozen=True)
+class PlayerOutcome:
+    """Result of one player in one session."""
+
+    name: str
+    """Player (strategy) name."""
+    start: float
+    """Bankroll at the start of the session."""
+    bankroll: float
+    """Bankroll at the end of the session."""
+    on_table: float
+    """Amount still wagered on the layout at the end of the session."""
+    wagered: float = 0.0
+    """Total amount of the bets that won or lost during the session."""
+    completed: bool = False
+    """Whether the strategy reported itself completed at the end of the session
+    (e.g. the player could no longer afford its bets)."""
+    action: Mapping[str, float] = field(default_factory=dict)
+    """Amount of the bets that won or lost during the session, by bet type."""
+    controls: Mapping[str, float] = field(default_factory=dict)
+    """If requested from :func:`run_session`, the net win of each bet type's
+    decisions minus its exact expectation roll by roll (see
+    :attr:`~crapssim.table.Player.expected_by_type`). Each has mean zero, so
+    they are control variates of :attr:`net`."""
+
+    @property
+    def final(self) -> float:
+        """Cash at the end of the session, counting bets still on the layout."""
+        return self.bankroll + self.on_table
+
+    @property
+    def net(self) -> float:
+        """Net win for the session, counting bets still on the layout."""
+        return self.final - self.start
+
+
+@dataclass(slots=True, frozen=True)
+class SessionResult:
+    """Result of one session of an :class:`Experiment`."""
+
+    index: int
+    """Session index."""
+    n_rolls: int
+    """Number of rolls in the session."""
+    n_shooters: int
+    """Number of shooters in the session."""
+    players: tuple[PlayerOutcome, ...]
+    """Outcome of each player, in seating order."""
+    paths: tuple[tuple[float, ...], ...] | None = None
+    """If requested from :func:`run_session`, each player's wealth (bankroll plus
+    bets on the layout) at the start and after every roll, in seating order."""
+    shooters: tuple[int, ...] | None = None
+    """If paths were requested, the shooter number of every roll."""
+    weight: float = 1.0
+    """Likelihood ratio of the session's dice, fair over tilted, if the
+    experiment rolls tilted dice; 1 otherwise."""
+
+
+def session_seed(seed_root: int, index: int) -> int:
+    """Return the dice seed for session ``index`` of an experiment.
+
+    Seeds are derived with :class:`numpy.random.SeedSequence`, so the sessions
+    of an experiment have independent dice streams and any session can be
+    replayed without running the ones before it.
+
+    Args:
+        seed_root: Root seed of the experiment.
+        index: Session index.
+
+    Returns:
+        int: A 128-bit seed for :class:`~crapssim.dice.Dice`.
+    """
+    state = np.random.SeedSequence(seed_root, spawn_key=(index,)).generate_state(
+        2, np.uint64
+    )
+    return int(state[0]) | (int(state[1]) << 64)
+
+
+def run_session(
+    table: Table,
+    experiment: Experiment,
+    index: int,
+    *,
+    paths: bool = False,
+    controls: bool = False,
+) -> SessionResult:
+    """Play session ``index`` of ``experiment`` on ``table``.
+
+    The table is reset first (see :meth:`~crapssim.table.Table.reset`), so the
+    same table can be reused for every session of a batch.
+
+    Args:
+        table: Table built by :meth:`Experiment.build_table`.
+        experiment: Experiment being run.
+        index: Session index.
+        paths: If True, also record each player's wealth after every roll in
+            :attr:`SessionResult.paths`, and the shooter of every roll in
+            :attr:`SessionResult.shooters`.
+        controls: If True, also record each player's
+            :attr:`PlayerOutcome.controls`, installing a
+            :class:`~crapssim.analysis.RollModel` on players without a
+            :attr:`~crapssim.table.Player.roll_model`.
+
+    Returns:
+        SessionResult: The outcome of the session.
+    """
+    table.reset(seed=session_seed(experiment.seed_root, index))
+    for player in table.players:
+        player.record_by_type = True
+    if controls and any(player.roll_model is None for player in table.players):
+        model = RollModel(table.rules, table.settings)
+        for player in table.players:
+            if player.roll_model is None:
+                player.roll_model = model
+    limits: dict[str, Any] = {
+        "max_rolls": experiment.max_rolls,
+        "max_shooter": experiment.max_shooter,
+        "verbose": False,
+        "runout": experiment.runout,
+    }
+    wealth: list[list[float]] | None = None
+    shooters: list[int] | None = None
+    if paths:
+        wealth = [
+            [player.bankroll + player.total_bet_amount] for player in table.players
+        ]
+        shooters = []
+        fields = ("bankrolls", "bet_totals", "shooter")
+        for record in table.iter_run(**limits, fields=fields):
+            for path, bankroll, on_table in zip(
+                wealth, record.bankrolls, record.bet_totals  # type: ignore[arg-type]
+            ):
+                path.append(bankroll + on_table)
+            shooters.append(record.shooter)  # type: ignore[arg-type]
+    else:
+        table.run(**limits)
+    return SessionResult(
+        index=index,
+        n_rolls=table.dice.n_rolls,
+        n_shooters=table.n_shooters,
+        players=tuple(
+            PlayerOutcome(
+                name=player.name,
+                start=experiment.bankroll,
+                bankroll=player.bankroll,
+                on_table=player.total_bet_amount,
+                wagered=player.wagered,
+                completed=player.strategy.completed(player),
+                action=dict(player.action),
+                controls=(
+                    {
+                        bet_type: player.net_by_type.get(bet_type, 0.0) - expected
+                        for bet_type, expected in player.expected_by_type.items()
+                    }
+                    if controls
+                    else {}
+                ),
+            )
+            for player in table.players
+        ),
+        paths=None if wealth is None else tuple(tuple(path) for path in wealth),
+        shooters=None if shooters is None else tuple(shooters),
+        weight=table.dice.weight if isinstance(table.dice, TiltedDice) else 1.0,
+    )
@@ -0,0 +1,161 @@
+"""Streaming quantile bands of wealth over roll or shooter number."""
+
+from typing import Iterable, Literal
+
+import numpy as np
+
+from crapssim.batch.experiment import SessionResult
+from crapssim.batch.stats import QuantileSketch
+
+__all__ = ["BANDS", "FanChart"]
+
+BANDS = (0.05, 0.25, 0.5, 0.75, 0.95)
+"""Default quantiles of a fan chart."""
+
+Axis = Literal["roll", "shooter"]
+
+
+def _shooter_series(path: np.ndarray, shooters: np.ndarray) -> np.ndarray:
+    """Wealth at the start and at the end of each shooter's turn."""
+    if not len(shooters):
+        return path[:1]
+    last_rolls = np.flatnonzero(np.diff(shooters, append=shooters[-1] + 1))
+    return np.concatenate((path[:1], path[last_rolls + 1]))
+
+
+class FanChart:
+    """Aggregate of wealth quantiles at every roll (or shooter) number.
+
+    For each strategy and each step ``t = 0, ..., horizon`` (0 being the start
+    of the session), a :class:`~crapssim.batch.stats.QuantileSketch` tracks
+    the distribution of wealth (bankroll plus bets on the layout) across
+    sessions, together with its mean. A session that ends before ``t``, e.g.
+    because the strategy was ruined or completed, counts with its final
+    wealth, as a player who left the table keeps what they left with;
+    :attr:`active` counts the sessions still playing at each step. Steps after
+    ``horizon`` are ignored, so memory is proportional to ``horizon``, not to
+    the number of sessions.
+
+    Values are buffered and added to the sketches a column at a time, every
+    ``buffer_size`` sessions. Use it as the aggregate of
+    :func:`~crapssim.batch.runner.run_batch`, e.g.
+    ``aggregate=functools.partial(FanChart, horizon=500)``.
+
+    Args:
+        horizon: Last roll (or shooter) number tracked.
+        axis: ``"roll"`` for wealth after each roll, ``"shooter"`` for wealth
+            at the end of each shooter's turn.
+        k: Size of each quantile sketch.
+        buffer_size: Number of sessions buffered between sketch updates.
+    """
+
+    needs_paths = True
+    """Tells the batch runner to record per-roll wealth paths."""
+
+    def __init__(
+        self,
+        horizon: int = 200,
+        axis: Axis = "roll",
+        k: int = 200,
+        buffer_size: int = 256,
+    ) -> None:
+        if axis not in ("roll", "shooter"):
+            raise ValueError(f"Unknown axis: {axis!r}")
+        self.horizon = horizon
+        self.axis = axis
+        self.k = k
+        self.buffer_size = buffer_size
+        self.sessions = 0
+        self.active = np.zeros(horizon + 1, dtype=np.int64)
+        """Number of sessions still playing at each step."""
+        self.sketches: dict[str, list[QuantileSketch]] = {}
+        """Quantile sketch of wealth at each step, for each strategy."""
+        self.sums: dict[str, np.ndarray] = {}
+        """Sum of wealth over sessions at each step, for each strategy."""
+        self._buffer: dict[str, list[np.ndarray]] = {}
+
+    def _series(self, path: np.ndarray, shooters: np.ndarray) -> np.ndarray:
+        if self.axis == "shooter":
+            path = _shooter_series(path, shooters)
+        series = np.full(self.horizon + 1, path[-1])
+        length = min(len(path), self.horizon + 1)
+        series[:length] = path[:length]
+        return series
+
+    def _strategy(self, name: str) -> list[np.ndarray]:
+        if name not in self._buffer:
+            self.sketches[name] = [
+                QuantileSketch(k=self.k) for _ in range(self.horizon + 1)
+            ]
+            self.sums[name] = np.zeros(self.horizon + 1)
+            self._buffer[name] = []
+        return self._buffer[name]
+
+    def update(self, session: SessionResult) -> None:
+        """Add one session, which must have been run with paths recorded.
+
+        Raises:
+            ValueError: If the session has no paths.
+        """
+        if session.paths is None or session.shooters is None:
+            raise ValueError("FanChart needs sessions run with paths")
+        self.sessions += 1
+        shooters = np.asarray(session.shooters)
+        steps = session.n_rolls if self.axis == "roll" else len(np.unique(shooters))
+        self.active[: min(steps, self.horizon) + 1] += 1
+        for player, path in zip(session.players, session.paths):
+            buffer = self._strategy(player.name)
+            buffer.append(self._series(np.asarray(path, dtype=float), shooters))
+            if len(buffer) >= self.buffer_size:
+                self._flush(player.name)
+
+    def _flush(self, name: str) -> None:
+        buffer = self._buffer[name]
+        if not buffer:
+            return
+        block = np.stack(buffer)
+        self.sums[name] += block.sum(axis=0)
+        for sketch, column in zip(self.sketches[name], block.T):
+            sketch.extend(column.tolist())
+        buffer.clear()
+
+    def merge(self, other: "FanChart") -> None:
+        """Add the sessions of ``other``, which must have the same horizon and
+        axis."""
+        if (other.horizon, other.axis) != (self.horizon, self.axis):
+            raise ValueError("Cannot merge fan charts with different horizons")
+        self.sessions += other.sessions
+        self.active += other.active
+        for name in other.sketches:
+            self._strategy(name)
+            self._flush(name)
+            self.sums[name] += other.sums[name]
+            for sketch, other_sketch in zip(self.sketches[name], other.sketches[name]):
+                sketch.merge(other_sketch)
+            self._buffer[name].extend(other._buffer[name])
+            if len(self._buffer[name]) >= self.buffer_size:
+                self._flush(name)
+
+    @property
+    def names(self) -> list[str]:
+        """Strategy names."""
+        return list(self.sketches)
+
+    def bands(self, name: str, qs: Iterable[float] = BANDS) -> np.ndarray:
+        """Quantiles of strategy ``name``'s wealth at each step.
+
+        Args:
+            name: Strategy name.
+            qs: Quantiles to compute.
+
+        Returns:
+            np.ndarray: Array of shape ``(len(qs), horizon + 1)``.
+        """
+        self._flush(name)
+        qs = list(qs)
+        return np.array([sketch.quantiles(qs) for sketch in self.sketches[name]]).T
+
+    def mean(self, name: str) -> np.ndarray:
+        """Mean wealth of strategy ``name`` at each step."""
+        self._flush(name)
+        return self.sums[name] / max(self.sessions, 1)
@@ -0,0 +1,162 @@
+"""Importance-weighted aggregates of sessions rolled with tilted dice."""
+
+import math
+from dataclasses import dataclass, field
+from typing import Iterator, Literal
+
+from crapssim.batch.experiment import PlayerOutcome, SessionResult
+from crapssim.batch.stats import Moments
+
+__all__ = ["Event", "WeightedStats", "ImportanceSummary"]
+
+Event = Literal["ruin", "target", "final"]
+"""Estimated quantities of a strategy: the probability of ruin, the
+probability of reaching the target, or the mean final bankroll."""
+
+
+@dataclass
+class WeightedStats:
+    """Importance-weighted statistics of one strategy's session outcomes.
+
+    Each session's outcome is multiplied by the session's likelihood ratio
+    (see :attr:`~crapssim.batch.experiment.SessionResult.weight`), so the
+    means are unbiased estimates under fair dice, and the standard errors are
+    those of the weighted values. Ruin and the target are counted as in
+    :class:`~crapssim.batch.summary.StrategyStats`.
+    """
+
+    target: float = 2.0
+    """Multiple of the starting bankroll that counts as reaching the target."""
+    start: float = math.nan
+    """Starting bankroll of the sessions."""
+    ruin: Moments = field(default_factory=Moments)
+    """Moments of the weighted ruin indicator."""
+    reached: Moments = field(default_factory=Moments)
+    """Moments of the weighted target indicator."""
+    final: Moments = field(default_factory=Moments)
+    """Moments of the weighted final bankroll (counting bets on the layout)."""
+
+    def add(self, outcome: PlayerOutcome, weight: float) -> None:
+        """Add one session's outcome with the session's weight."""
+        final = outcome.final
+        self.start = outcome.start
+        self.ruin.add(weight * (outcome.completed and final < outcome.start))
+        self.reached.add(weight * (final >= self.target * outcome.start))
+        self.final.add(weight * final)
+
+    def merge(self, other: "WeightedStats") -> None:
+        """Add the sessions counted by ``other``."""
+        if other.final.count:
+            self.start = other.start
+        self.ruin.merge(other.ruin)
+        self.reached.merge(other.reached)
+        self.final.merge(other.final)
+
+    @property
+    def count(self) -> int:
+        """Number of sessions."""
+        return self.final.count
+
+    def _moments(self, event: Event) -> Moments:
+        if event == "ruin":
+            return self.ruin
+        if event == "target":
+            return self.reached
+        if event == "final":
+            return self.final
+        raise ValueError(f"Unknown event: {event!r}")
+
+    def estimate(self, event: Event = "target") -> tuple[float, float]:
+        """Return an unbiased estimate of ``event`` under fair dice and its
+        standard error.
+
+        Raises:
+            ValueError: If the event is unknown.
+        """
+        moments = self._moments(event)
+        return moments.mean, moments.stderr
+
+    def variance_reduction(self, event: Event = "target") -> float:
+        """Estimated variance per session of a plain simulation of a
+        probability, ``p (1 - p)``, over that of the weighted estimate. Above 1,
+        the tilt needs fewer sessions than fair dice for the same precision.
+
+        Raises:
+            ValueError: If the event is not a probability.
+        """
+        if event == "final":
+            raise ValueError("Only probabilities have a plain-simulation variance")
+        moments = self._moments(event)
+        p = moments.mean
+        return p * (1 - p) / moments.variance if moments.variance else math.nan
+
+
+@dataclass
+class ImportanceSummary:
+    """Importance-weighted statistics of each strategy, with diagnostics of the
+    session weights.
+
+    Use it as the aggregate of :func:`~crapssim.batch.runner.run_batch` for an
+    experiment with
+    :attr:`~crapssim.batch.experiment.Experiment.dice_probabilities`, tilted
+    so that the event of interest is common. A tilt far from fair dice makes
+    a few sessions carry most of the weight; :attr:`effective_sessions` falling
+    far below :attr:`sessions`, or :attr:`mean_weight` drifting from 1, are
+    signs that the estimates are unreliable.
+    """
+
+    target: float = 2.0
+    """Multiple of the starting bankroll that counts as reaching the target."""
+    sessions: int = 0
+    """Number of sessions aggregated."""
+    weights: Moments = field(default_factory=Moments)
+    """Likelihood ratios of the sessions."""
+    strategies: dict[str, WeightedStats] = field(default_factory=dict)
+    """Statistics of each strategy, keyed by strategy name."""
+
+    def _stats(self, name: str) -> WeightedStats:
+        if name not in self.strategies:
+            self.strategies[name] = WeightedStats(target=self.target)
+        return self.strategies[name]
+
+    def update(self, session: SessionResult) -> None:
+        """Add one session to the summary."""
+        self.sessions += 1
+        self.weights.add(session.weight)
+        for player in session.players:
+            self._stats(player.name).add(player, session.weight)
+
+    def merge(self, other: "ImportanceSummary") -> None:
+        """Add the sessions of ``other`` to this summary, in place."""
+        self.sessions += other.sessions
+        self.weights.merge(other.weights)
+        for name, stats in other.strategies.items():
+            self._stats(name).merge(stats)
+
+    @property
+    def mean_weight(self) -> float:
+        """Mean session weight, which is 1 in expectation."""
+        return self.weights.mean
+
+    @property
+    def effective_sessions(self) -> float:
+        """Kish's effective sample size of the weights, ``(sum w)^2 / sum w^2``:
+        the number of fair sessions the weighted sessions are worth for
+        estimating a typical quantity."""
+        n, mean = self.weights.count, self.weights.mean
+        if not n:
+            return 0.0
+        return (n * mean) ** 2 / (self.weights.m2 + n * mean**2)
+
+    @property
+    def max_weight_share(self) -> float:
+        """Largest share of the total weight carried by a single session."""
+        if not self.weights.count:
+            return math.nan
+        return self.weights.maximum / (self.weights.count * self.weights.mean)
+
+    def __getitem__(self, name: str) -> WeightedStats:
+        return self.strategies[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.strategies)
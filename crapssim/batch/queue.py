@@ -0,0 +1,311 @@
+"""File-system work queue for running an experiment on several hosts.
+
+A coordinator splits the sessions of an experiment into shards with
+:func:`submit_shards`, writing one descriptor file per shard into a queue
+directory on a filesystem shared by the hosts. Workers on any host run
+:func:`work` (or ``python -m crapssim.batch work DIR``), which claims
+shards by atomically renaming their descriptors, runs them, writes a result
+file, and releases the claim. :func:`merge_results` then combines the shard
+aggregates. No network service is needed, only atomic renames within the
+queue directory.
+
+Queue directory layout::
+
+    manifest.pkl          experiment, session range, and aggregate type
+    pending/shard-*.pkl   shards waiting for a worker
+    claimed/shard-*.pkl   shards being run, tagged with their claim
+    results/shard-*.pkl   aggregates of finished shards
+"""
+
+import os
+import pickle
+import tempfile
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from crapssim.batch.experiment import Experiment
+from crapssim.batch.runner import BatchResult, run_range
+from crapssim.batch.summary import Aggregate, Summary
+
+__all__ = [
+    "Shard",
+    "QueueStatus",
+    "submit_shards",
+    "claim_shard",
+    "work",
+    "requeue_stale",
+    "queue_status",
+    "merge_results",
+]
+
+_QUEUE_VERSION = 1
+"""Version of the files written to the queue directory."""
+
+_MANIFEST = "manifest.pkl"
+_PENDING = "pending"
+_CLAIMED = "claimed"
+_RESULTS = "results"
+
+
+@dataclass(frozen=True)
+class Shard:
+    """Descriptor of one shard: a session range of an experiment."""
+
+    experiment: Experiment
+    """Experiment the shard belongs to (including its seed root)."""
+    start: int
+    """First session index."""
+    stop: int
+    """One past the last session index."""
+    aggregate: Callable[[], Aggregate] = Summary
+    """Factory for the empty aggregate to update."""
+
+    @property
+    def seed_root(self) -> int:
+        """Seed root of the experiment."""
+        return self.experiment.seed_root
+
+    @property
+    def file_name(self) -> str:
+        """Name of the shard's descriptor and result files."""
+        return f"shard-{self.start:012d}-{self.stop:012d}.pkl"
+
+
+@dataclass(frozen=True)
+class QueueStatus:
+    """Number of shards in each state of a queue."""
+
+    pending: int
+    claimed: int
+    done: int
+
+    @property
+    def finished(self) -> bool:
+        """Whether every shard has a result."""
+        return self.pending == 0 and self.claimed == 0
+
+
+def _write(path: Path, payload: Any) -> None:
+    """Atomically write ``payload`` to ``path`` as a versioned pickle."""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump((_QUEUE_VERSION, payload), f)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+def _read(path: Path) -> Any:
+    """Read a versioned pickle written by :func:`_write`."""
+    with open(path, "rb") as f:
+        version, payload = pickle.load(f)
+    if version != _QUEUE_VERSION:
+        raise ValueError(f"Unsupported queue file version {version}: {path}")
+    return payload
+
+
+def _claimed_name(name: str) -> str:
+    """Name of a shard descriptor claimed by this call, unique to the claim."""
+    stem, suffix = name.split(".", 1)
+    return f"{stem}.{uuid.uuid4().hex}.{suffix}"
+
+
+def _pending_name(claimed: Path) -> str:
+    """Name of the pending descriptor a claimed descriptor came from."""
+    return claimed.name.split(".", 1)[0] + ".pkl"
+
+
+def _release(claimed: Path, destination: Path | None = None) -> None:
+    """Release a claim by moving its descriptor to ``destination`` (or deleting it).
+
+    The claim may already be gone if :func:`requeue_stale` judged it stale;
+    as each claim has its own file name, a shard claimed again by another
+    worker since then is left alone.
+    """
+    try:
+        if destination is None:
+            os.unlink(claimed)
+        else:
+            os.rename(claimed, destination)
+    except FileNotFoundError:
+        pass
+
+
+def _shard_files(directory: Path) -> list[Path]:
+    return sorted(directory.glob("shard-*.pkl"))
+
+
+def submit_shards(
+    queue_dir: str | os.PathLike[str],
+    experiment: Experiment,
+    n_sessions: int,
+    shard_size: int,
+    *,
+    start: int = 0,
+    aggregate: Callable[[], Aggregate] = Summary,
+) -> list[Shard]:
+    """Split sessions of ``experiment`` into shards and queue them.
+
+    Args:
+        queue_dir: Queue directory, created if needed. It must not already
+            hold a queue.
+        experiment: Experiment to run.
+        n_sessions: Number of sessions.
+        shard_size: Number of sessions per shard.
+        start: First session index.
+        aggregate: Factory for the empty aggregate of each shard.
+
+    Returns:
+        list[Shard]: The queued shards.
+
+    Raises:
+        FileExistsError: If ``queue_dir`` already holds a queue.
+    """
+    if shard_size < 1:
+        raise ValueError("shard_size must be positive")
+    root = Path(queue_dir)
+    if (root / _MANIFEST).exists():
+        raise FileExistsError(f"{root} already holds a queue")
+    for name in (_PENDING, _CLAIMED, _RESULTS):
+        (root / name).mkdir(parents=True, exist_ok=True)
+
+    stop = start + n_sessions
+    shards = [
+        Shard(experiment, shard_start, min(shard_start + shard_size, stop), aggregate)
+        for shard_start in range(start, stop, shard_size)
+    ]
+    for shard in shards:
+        _write(root / _PENDING / shard.file_name, shard)
+    # The manifest is written last, marking the queue as fully submitted
+    _write(root / _MANIFEST, (experiment, start, stop, aggregate))
+    return shards
+
+
+def claim_shard(queue_dir: str | os.PathLike[str]) -> tuple[Shard, Path] | None:
+    """Claim the next pending shard.
+
+    A shard is claimed by renaming its descriptor from ``pending/`` to
+    ``claimed/``, under a name unique to the claim, which succeeds for
+    exactly one worker.
+
+    Args:
+        queue_dir: Queue directory.
+
+    Returns:
+        The shard and the path of its claimed descriptor, or None when no
+        shard is pending.
+    """
+    root = Path(queue_dir)
+    for path in _shard_files(root / _PENDING):
+        claimed = root / _CLAIMED / _claimed_name(path.name)
+        try:
+            # Start the clock for requeue_stale before the claim is visible,
+            # so it never sees the enqueue time of a fresh claim
+            os.utime(path)
+            os.rename(path, claimed)
+            return _read(claimed), claimed
+        except FileNotFoundError:
+            continue  # Another worker claimed it first, or the claim was lost
+    return None
+
+
+def work(queue_dir: str | os.PathLike[str], max_shards: int | None = None) -> int:
+    """Claim and run shards until the queue is empty.
+
+    If running a shard fails, the shard is returned to the queue before the
+    error is raised.
+
+    Args:
+        queue_dir: Queue directory.
+        max_shards: Optional maximum number of shards to run.
+
+    Returns:
+        int: Number of shards run.
+    """
+    root = Path(queue_dir)
+    n_run = 0
+    while max_shards is None or n_run < max_shards:
+        claim = claim_shard(root)
+        if claim is None:
+            break
+        shard, claimed = claim
+        try:
+            result = run_range(
+                shard.experiment, shard.start, shard.stop, shard.aggregate
+            )
+        except BaseException:
+            _release(claimed, root / _PENDING / _pending_name(claimed))
+            raise
+        _write(root / _RESULTS / shard.file_name, (shard, result))
+        _release(claimed)
+        n_run += 1
+    return n_run
+
+
+def requeue_stale(queue_dir: str | os.PathLike[str], older_than: float) -> int:
+    """Return shards claimed more than ``older_than`` seconds ago to the queue.
+
+    Use this to recover shards from workers that died. A shard whose worker
+    is only slow may then be run twice, which is harmless: both runs write the
+    same result file.
+
+    Args:
+        queue_dir: Queue directory.
+        older_than: Age of a claim, in seconds, after which it is stale.
+
+    Returns:
+        int: Number of shards returned to the queue.
+    """
+    root = Path(queue_dir)
+    n_requeued = 0
+    cutoff = time.time() - older_than
+    for path in _shard_files(root / _CLAIMED):
+        try:
+            if path.stat().st_mtime > cutoff:
+                continue
+            os.rename(path, root / _PENDING / _pending_name(path))
+        except FileNotFoundError:
+            continue  # Finished or requeued meanwhile
+        n_requeued += 1
+    return n_requeued
+
+
+def queue_status(queue_dir: str | os.PathLike[str]) -> QueueStatus:
+    """Count the shards in each state of a queue."""
+    root = Path(queue_dir)
+    return QueueStatus(
+        pending=len(_shard_files(root / _PENDING)),
+        claimed=len(_shard_files(root / _CLAIMED)),
+        done=len(_shard_files(root / _RESULTS)),
+    )
+
+
+def merge_results(queue_dir: str | os.PathLike[str]) -> BatchResult:
+    """Merge the shard results of a finished queue, in session order.
+
+    Returns:
+        BatchResult: Aggregate of all sessions of the queue.
+
+    Raises:
+        ValueError: If some sessions of the queue have no result yet.
+    """
+    root = Path(queue_dir)
+    experiment, start, stop, aggregate = _read(root / _MANIFEST)
+    merged = aggregate()
+    next_index = start
+    for path in _shard_files(root / _RESULTS):
+        shard, result = _read(path)
+        if shard.start != next_index:
+            break
+        merged.merge(result)
+        next_index = shard.stop
+    if next_index != stop:
+        raise ValueError(
+            f"Queue {root} has no result for sessions starting at {next_index}"
+        )
+    return BatchResult(experiment, start, stop, merged)
@@ -0,0 +1,171 @@
+"""Bounded-memory samples of full session trajectories."""
+
+import bisect
+import hashlib
+import heapq
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from crapssim.batch.experiment import SessionResult
+
+__all__ = ["SessionPath", "TrajectoryReservoir"]
+
+
+def _session_key(seed: int, index: int) -> float:
+    """Uniform pseudo-random key of a session, independent of how sessions are
+    split into chunks."""
+    digest = hashlib.blake2b(f"{seed}:{index}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little") / 2**64
+
+
+@dataclass(frozen=True, eq=False)
+class SessionPath:
+    """Wealth path of one strategy in one session."""
+
+    index: int
+    """Session index."""
+    wealth: np.ndarray
+    """Bankroll plus bets on the layout at the start and after every roll."""
+
+    @property
+    def n_rolls(self) -> int:
+        """Number of rolls in the session."""
+        return len(self.wealth) - 1
+
+    @property
+    def final(self) -> float:
+        """Wealth at the end of the session."""
+        return float(self.wealth[-1])
+
+    @property
+    def max_drawdown(self) -> float:
+        """Largest drop in wealth from a previous peak."""
+        return float((np.maximum.accumulate(self.wealth) - self.wealth).max())
+
+
+@dataclass
+class _Extremes:
+    """The ``n`` paths with the smallest ``(value, index)`` sort keys."""
+
+    n: int
+    entries: list[tuple[float, int, SessionPath]] = field(default_factory=list)
+
+    def add(self, value: float, path: SessionPath) -> None:
+        if len(self.entries) == self.n and (value, path.index) >= self.entries[-1][:2]:
+            return
+        bisect.insort(self.entries, (value, path.index, path), key=lambda e: e[:2])
+        del self.entries[self.n :]
+
+    def merge(self, other: "_Extremes") -> None:
+        for value, _, path in other.entries:
+            self.add(value, path)
+
+    @property
+    def paths(self) -> list[SessionPath]:
+        return [path for _, _, path in self.entries]
+
+
+class TrajectoryReservoir:
+    """Aggregate keeping a uniform random sample of full session trajectories.
+
+    Every session gets a pseudo-random key derived from ``seed`` and its index,
+    and the ``k`` sessions with the smallest keys are kept (bottom-k sampling).
+    This is a uniform sample without replacement of all sessions seen, and
+    since the keys do not depend on the order sessions arrive in, merging the
+    reservoirs of any split of a run gives the same sample as one reservoir.
+    The sample holds the same sessions for every strategy, so sampled paths of
+    different strategies share their dice.
+
+    For each strategy, the ``n_extremes`` paths with the lowest and highest
+    final wealth and with the largest drawdown are also kept. Memory is
+    O(``k`` + ``n_extremes``) paths, whatever the number of sessions.
+
+    Use it as the aggregate of :func:`~crapssim.batch.runner.run_batch`, e.g.
+    ``aggregate=functools.partial(TrajectoryReservoir, k=300)``.
+
+    Args:
+        k: Number of sampled sessions.
+        n_extremes: Number of extreme paths kept per strategy and criterion.
+        seed: Seed of the session keys.
+    """
+
+    needs_paths = True
+    """Tells the batch runner to record per-roll wealth paths."""
+
+    def __init__(self, k: int = 200, n_extremes: int = 5, seed: int = 0) -> None:
+        self.k = k
+        self.n_extremes = n_extremes
+        self.seed = seed
+        self.sessions = 0
+        self.names: tuple[str, ...] = ()
+        self._sample: list[tuple[float, int, tuple[np.ndarray, ...]]] = []
+        self._lowest: dict[str, _Extremes] = {}
+        self._highest: dict[str, _Extremes] = {}
+        self._deepest: dict[str, _Extremes] = {}
+
+    def _add_sample(self, key: float, index: int, paths: tuple[np.ndarray, ...]):
+        # Max-heap on (key, index) of the k smallest keys seen
+        entry = (-key, -index, paths)
+        if len(self._sample) < self.k:
+            heapq.heappush(self._sample, entry)
+        elif entry[:2] > self._sample[0][:2]:
+            heapq.heapreplace(self._sample, entry)
+
+    def _extremes(self, name: str) -> tuple[_Extremes, _Extremes, _Extremes]:
+        if name not in self._lowest:
+            self._lowest[name] = _Extremes(self.n_extremes)
+            self._highest[name] = _Extremes(self.n_extremes)
+            self._deepest[name] = _Extremes(self.n_extremes)
+        return self._lowest[name], self._highest[name], self._deepest[name]
+
+    def update(self, session: SessionResult) -> None:
+        """Add one session, which must have been run with paths recorded.
+
+        Raises:
+            ValueError: If the session has no paths.
+        """
+        if session.paths is None:
+            raise ValueError("TrajectoryReservoir needs sessions run with paths")
+        self.sessions += 1
+        self.names = tuple(player.name for player in session.players)
+        wealth = tuple(np.array(path) for path in session.paths)
+        for name, path in zip(self.names, wealth):
+            session_path = SessionPath(session.index, path)
+            lowest, highest, deepest = self._extremes(name)
+            lowest.add(session_path.final, session_path)
+            highest.add(-session_path.final, session_path)
+            deepest.add(-session_path.max_drawdown, session_path)
+        self._add_sample(_session_key(self.seed, session.index), session.index, wealth)
+
+    def merge(self, other: "TrajectoryReservoir") -> None:
+        """Add the sessions of ``other``, which must use the same ``k`` and seed."""
+        if (other.k, other.seed) != (self.k, self.seed):
+            raise ValueError("Cannot merge reservoirs with different k or seed")
+        self.sessions += other.sessions
+        self.names = self.names or other.names
+        for neg_key, neg_index, paths in other._sample:
+            self._add_sample(-neg_key, -neg_index, paths)
+        for name in other._lowest:
+            lowest, highest, deepest = self._extremes(name)
+            lowest.merge(other._lowest[name])
+            highest.merge(other._highest[name])
+            deepest.merge(other._deepest[name])
+
+    def sample(self, name: str) -> list[SessionPath]:
+        """Sampled paths of strategy ``name``, in session order."""
+        column = self.names.index(name)
+        entries = sorted((-neg_index, paths) for _, neg_index, paths in self._sample)
+        return [SessionPath(index, paths[column]) for index, paths in entries]
+
+    def lowest(self, name: str) -> list[SessionPath]:
+        """Paths of strategy ``name`` with the lowest final wealth, lowest first."""
+        return self._lowest[name].paths
+
+    def highest(self, name: str) -> list[SessionPath]:
+        """Paths of strategy ``name`` with the highest final wealth, highest first."""
+        return self._highest[name].paths
+
+    def deepest(self, name: str) -> list[SessionPath]:
+        """Paths of strategy ``name`` with the largest drawdown, largest first."""
+        return self._deepest[name].paths
@@ -0,0 +1,211 @@
+"""Run many sessions of an experiment, optionally in parallel and resumably."""
+
+import hashlib
+import os
+import pickle
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from crapssim.batch.checkpoint import Checkpoint
+from crapssim.batch.experiment import Experiment, run_session
+from crapssim.batch.summary import Aggregate, Summary
+from crapssim.strategy import serialize
+
+__all__ = ["BatchResult", "run_range", "run_fingerprint", "run_batch"]
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """Aggregate of the sessions ``[start, stop)`` of an experiment."""
+
+    experiment: Experiment
+    """Experiment that was run."""
+    start: int
+    """First session index."""
+    stop: int
+    """One past the last session index."""
+    aggregate: Any
+    """Aggregate of the sessions (a :class:`~crapssim.batch.summary.Summary`
+    unless another aggregate was requested)."""
+
+    @property
+    def n_sessions(self) -> int:
+        """Number of sessions run."""
+        return self.stop - self.start
+
+
+def run_range(
+    experiment: Experiment,
+    start: int,
+    stop: int,
+    aggregate: Callable[[], Aggregate] = Summary,
+) -> Aggregate:
+    """Run the sessions ``[start, stop)`` of ``experiment`` on one table.
+
+    Args:
+        experiment: Experiment to run.
+        start: First session index.
+        stop: One past the last session index.
+        aggregate: Factory for the empty aggregate to update.
+
+    Returns:
+        The aggregate of the sessions.
+    """
+    table = experiment.build_table()
+    result = aggregate()
+    paths = getattr(result, "needs_paths", False)
+    controls = getattr(result, "needs_controls", False)
+    for index in range(start, stop):
+        result.update(
+            run_session(table, experiment, index, paths=paths, controls=controls)
+        )
+    return result
+
+
+def run_fingerprint(
+    experiment: Experiment,
+    start: int,
+    stop: int,
+    chunk_size: int,
+    aggregate: Callable[[], Aggregate],
+) -> str:
+    """Return an identity for a batch run, used to match it to its checkpoint.
+
+    Returns:
+        str: Hex digest over the canonical form of the experiment (see
+        :meth:`~crapssim.batch.experiment.Experiment.to_dict`), the session
+        range, the chunking, and the aggregate type.
+    """
+    content = [experiment.to_dict(), start, stop, chunk_size]
+    digest = hashlib.sha256(serialize.canonical_json(content).encode())
+    digest.update(pickle.dumps(aggregate))
+    return digest.hexdigest()
+
+
+def run_batch(
+    experiment: Experiment,
+    n_sessions: int,
+    *,
+    start: int = 0,
+    chunk_size: int = 1000,
+    workers: int = 1,
+    aggregate: Callable[[], Aggregate] = Summary,
+    checkpoint_dir: str | os.PathLike[str] | None = None,
+    checkpoint_every: float = 60.0,
+    progress: Callable[[int, int], None] | None = None,
+    executor: Executor | None = None,
+) -> BatchResult:
+    """Run ``n_sessions`` sessions of ``experiment``.
+
+    Sessions are split into chunks of ``chunk_size``, run on ``workers``
+    processes, and the chunk aggregates are merged in session order. The
+    result therefore depends only on the experiment, the session range, and
+    the chunk size, not on the number of workers or the order chunks finish.
+
+    With a ``checkpoint_dir``, progress is saved there at most every
+    ``checkpoint_every`` seconds and when the run finishes. Calling
+    ``run_batch`` again with the same arguments resumes from the checkpoint,
+    running only the chunks that were not completed, and gives the same
+    result as an uninterrupted run.
+
+    Args:
+        experiment: Experiment to run.
+        n_sessions: Number of sessions.
+        start: First session index.
+        chunk_size: Number of sessions per chunk.
+        workers: Number of worker processes; 1 runs in this process.
+        aggregate: Factory for the empty aggregate to update.
+        checkpoint_dir: Optional directory for checkpoints.
+        checkpoint_every: Minimum number of seconds between checkpoints.
+        progress: Optional callback, called after each chunk with the number
+            of completed sessions and the total number of sessions.
+        executor: Optional executor to run the chunks on instead of a pool
+            of ``workers`` processes started for this call. It is left
+            running, so callers running many batches can start their worker
+            processes once.
+
+    Returns:
+        BatchResult: The aggregate of the sessions.
+
+    Raises:
+        ValueError: If ``checkpoint_dir`` holds a checkpoint of a different run.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    stop = start + n_sessions
+    fingerprint = ""
+
+    checkpoint = None
+    if checkpoint_dir is not None:
+        fingerprint = run_fingerprint(experiment, start, stop, chunk_size, aggregate)
+        checkpoint = Checkpoint.load(checkpoint_dir)
+        if checkpoint is not None and checkpoint.fingerprint != fingerprint:
+            raise ValueError(
+                f"Checkpoint in {checkpoint_dir} belongs to a different run"
+            )
+    if checkpoint is None:
+        checkpoint = Checkpoint(
+            fingerprint=fingerprint,
+            start=start,
+            stop=stop,
+            chunk_size=chunk_size,
+            next_index=start,
+            aggregate=aggregate(),
+        )
+
+    completed = sum(b - a for a, b in checkpoint.completed_ranges)
+    chunks = [
+        (chunk_start, min(chunk_start + chunk_size, stop))
+        for chunk_start in range(checkpoint.next_index, stop, chunk_size)
+        if chunk_start not in checkpoint.pending
+    ]
+    last_save = time.monotonic()
+
+    def finish_chunk(chunk_start: int, chunk_stop: int, result: Aggregate) -> None:
+        nonlocal completed, last_save
+        checkpoint.add_chunk(chunk_start, chunk_stop, result)
+        completed += chunk_stop - chunk_start
+        if checkpoint_dir is not None:
+            now = time.monotonic()
+            if now - last_save >= checkpoint_every:
+                checkpoint.save(checkpoint_dir)
+                last_save = now
+        if progress is not None:
+            progress(completed, n_sessions)
+
+    if executor is None and workers <= 1:
+        for chunk_start, chunk_stop in chunks:
+            result = run_range(experiment, chunk_start, chunk_stop, aggregate)
+            finish_chunk(chunk_start, chunk_stop, result)
+    else:
+        owned = executor is None
+        if executor is None:
+            executor = ProcessPoolExecutor(max_workers=workers)
+        futures: dict[Future[Aggregate], tuple[int, int]] = {}
+        try:
+            for a, b in chunks:
+                future = executor.submit(run_range, experiment, a, b, aggregate)
+                futures[future] = (a, b)
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=lambda f: futures[f]):
+                    chunk_start, chunk_stop = futures.pop(future)
+                    finish_chunk(chunk_start, chunk_stop, future.result())
+        finally:
+            if owned:
+                executor.shutdown(cancel_futures=True)
+            else:
+                for future in futures:
+                    future.cancel()
+
+    if checkpoint_dir is not None:
+        checkpoint.save(checkpoint_dir)
+    return BatchResult(experiment, start, stop, checkpoint.aggregate)
@@ -0,0 +1,193 @@
+"""Sequential batch runs that stop once estimates reach a target precision."""
+
+import math
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from statistics import NormalDist
+from typing import Callable, Iterable, Literal
+
+from crapssim.batch.experiment import Experiment
+from crapssim.batch.runner import BatchResult, run_batch
+from crapssim.batch.summary import Metric, Summary
+
+__all__ = ["Estimate", "PrecisionResult", "run_until_precise"]
+
+StopReason = Literal["precision", "sessions", "rolls", "time"]
+
+
+@dataclass(slots=True, frozen=True)
+class Estimate:
+    """Estimate of a metric with a symmetric confidence interval."""
+
+    value: float
+    """Point estimate."""
+    half_width: float
+    """Half-width of the confidence interval."""
+
+    @property
+    def low(self) -> float:
+        """Lower end of the confidence interval."""
+        return self.value - self.half_width
+
+    @property
+    def high(self) -> float:
+        """Upper end of the confidence interval."""
+        return self.value + self.half_width
+
+
+@dataclass(frozen=True)
+class PrecisionResult:
+    """Outcome of :func:`run_until_precise`."""
+
+    batch: BatchResult
+    """All sessions run, as one batch starting at session 0."""
+    metric: Metric
+    """Metric that was estimated."""
+    confidence: float
+    """Confidence level of the intervals."""
+    target: float
+    """Requested half-width."""
+    estimates: dict[str, Estimate]
+    """Estimate of the metric for each strategy."""
+    reason: StopReason
+    """Why the run stopped: the target was met, or a budget ran out."""
+    seconds: float
+    """Wall-clock time spent."""
+
+    @property
+    def reached(self) -> bool:
+        """Whether every estimate reached the target precision."""
+        return self.reason == "precision"
+
+    @property
+    def achieved(self) -> float:
+        """Largest half-width among the strategies."""
+        return max(e.half_width for e in self.estimates.values())
+
+
+def _estimates(
+    summary: Summary, names: Iterable[str], metric: Metric, z: float
+) -> dict[str, Estimate]:
+    estimates = {}
+    for name in names:
+        value, stderr = summary[name].estimate(metric)
+        half_width = z * stderr if not math.isnan(stderr) else math.inf
+        estimates[name] = Estimate(value, half_width)
+    return estimates
+
+
+def run_until_precise(
+    experiment: Experiment,
+    half_width: float,
+    *,
+    metric: Metric = "net",
+    strategies: Iterable[str] | None = None,
+    confidence: float = 0.95,
+    batch_size: int = 1000,
+    max_sessions: int | None = None,
+    max_rolls: float | None = None,
+    max_seconds: float | None = None,
+    chunk_size: int | None = None,
+    workers: int = 1,
+    aggregate: Callable[[], Summary] = Summary,
+    progress: Callable[[dict[str, Estimate]], None] | None = None,
+) -> PrecisionResult:
+    """Run batches of sessions until the confidence interval is narrow enough.
+
+    Sessions ``0, 1, 2, ...`` of ``experiment`` are run in batches of
+    ``batch_size`` (on ``workers`` processes, started once for the whole
+    run, see :func:`~crapssim.batch.runner.run_batch`). After each batch the
+    metric is estimated for every strategy, with a normal-approximation
+    confidence interval, and the run stops once every half-width is at most
+    ``half_width`` or a session, roll, or time budget runs out. Easy
+    estimates therefore stop early, while noisy ones get more sessions.
+
+    Args:
+        experiment: Experiment to run.
+        half_width: Target half-width of the confidence intervals, in the
+            units of the metric (dollars per session for ``"net"``, dollars
+            per dollar wagered for ``"net_per_wagered"``).
+        metric: Metric to estimate.
+        strategies: Strategies whose estimates must reach the target;
+            defaults to all of them.
+        confidence: Confidence level of the intervals.
+        batch_size: Number of sessions between precision checks.
+        max_sessions: Optional budget of sessions.
+        max_rolls: Optional budget of table rolls.
+        max_seconds: Optional budget of wall-clock seconds.
+        chunk_size: Sessions per worker chunk; defaults to an even split of
+            each batch over the workers.
+        workers: Number of worker processes.
+        aggregate: Factory for the :class:`~crapssim.batch.summary.Summary`
+            aggregate to update.
+        progress: Optional callback, called with the estimates after each
+            batch.
+
+    Returns:
+        PrecisionResult: The estimates, achieved precision, and stop reason.
+
+    Raises:
+        ValueError: If ``half_width``, ``batch_size`` or ``max_sessions`` is
+            not positive.
+    """
+    if half_width <= 0:
+        raise ValueError("half_width must be positive")
+    if batch_size < 1:
+        raise ValueError("batch_size must be positive")
+    if max_sessions is not None and max_sessions < 1:
+        raise ValueError("max_sessions must be positive")
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    names = list(experiment.strategies if strategies is None else strategies)
+    if chunk_size is None:
+        chunk_size = max(1, math.ceil(batch_size / workers))
+
+    started = time.monotonic()
+    summary = aggregate()
+    n_sessions = 0
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        while True:
+            size = batch_size
+            if max_sessions is not None:
+                size = min(size, max_sessions - n_sessions)
+            batch = run_batch(
+                experiment,
+                size,
+                start=n_sessions,
+                chunk_size=chunk_size,
+                workers=workers,
+                aggregate=aggregate,
+            )
+            summary.merge(batch.aggregate)
+            n_sessions += size
+
+            estimates = _estimates(summary, names, metric, z)
+            if progress is not None:
+                progress(estimates)
+
+            reason: StopReason | None = None
+            if all(e.half_width <= half_width for e in estimates.values()):
+                reason = "precision"
+            elif max_sessions is not None and n_sessions >= max_sessions:
+                reason = "sessions"
+            elif (
+                max_rolls is not None
+                and summary.rolls.count * summary.rolls.mean >= max_rolls
+            ):
+                reason = "rolls"
+            elif max_seconds is not None and time.monotonic() - started >= max_seconds:
+                reason = "time"
+            if reason is not None:
+                return PrecisionResult(
+                    batch=BatchResult(experiment, 0, n_sessions, summary),
+                    metric=metric,
+                    confidence=confidence,
+                    target=half_width,
+                    estimates=estimates,
+                    reason=reason,
+                    seconds=time.monotonic() - started,
+                )
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
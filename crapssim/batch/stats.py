@@ -0,0 +1,340 @@
+"""Constant-memory, mergeable statistics of a stream of values."""
+
+import math
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from itertools import accumulate
+from typing import Iterable
+
+import numpy as np
+
+__all__ = ["Moments", "Comoments", "CovarianceMatrix", "QuantileSketch"]
+
+
+@dataclass(slots=True)
+class Moments:
+    """Count, mean, variance, skewness, and extremes of a stream of values.
+
+    Values are added with Welford's update and aggregates are combined with
+    the pairwise formulas of Chan et al. and Pébay, which stay accurate for
+    long streams where sums of squares would cancel.
+    """
+
+    count: int = 0
+    mean: float = math.nan
+    """Mean of the values, or NaN when empty."""
+    m2: float = 0.0
+    """Sum of squared deviations from the mean."""
+    m3: float = 0.0
+    """Sum of cubed deviations from the mean."""
+    minimum: float = math.inf
+    maximum: float = -math.inf
+
+    def add(self, value: float) -> None:
+        """Add one value."""
+        n1 = self.count
+        self.count = n = n1 + 1
+        if n1 == 0:
+            self.mean = value
+        else:
+            delta = value - self.mean
+            delta_n = delta / n
+            term = delta * delta_n * n1
+            self.mean += delta_n
+            self.m3 += term * delta_n * (n - 2) - 3 * delta_n * self.m2
+            self.m2 += term
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+
+    def merge(self, other: "Moments") -> None:
+        """Add the values counted by ``other``."""
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean = other.count, other.mean
+            self.m2, self.m3 = other.m2, other.m3
+            self.minimum, self.maximum = other.minimum, other.maximum
+            return
+        na, nb = self.count, other.count
+        n = na + nb
+        delta = other.mean - self.mean
+        self.m3 += (
+            other.m3
+            + delta**3 * na * nb * (na - nb) / n**2
+            + 3 * delta * (na * other.m2 - nb * self.m2) / n
+        )
+        self.m2 += other.m2 + delta**2 * na * nb / n
+        self.mean += delta * nb / n
+        self.count = n
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+
+    @property
+    def variance(self) -> float:
+        """Sample variance of the values, or NaN with fewer than two values."""
+        if self.count < 2:
+            return math.nan
+        return self.m2 / (self.count - 1)
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation of the values."""
+        return math.sqrt(self.variance)
+
+    @property
+    def stderr(self) -> float:
+        """Standard error of the mean."""
+        return self.std / math.sqrt(self.count) if self.count else math.nan
+
+    @property
+    def skewness(self) -> float:
+        """Skewness of the values (population estimate), or NaN if undefined."""
+        if self.count < 2 or self.m2 == 0:
+            return math.nan
+        return math.sqrt(self.count) * self.m3 / self.m2**1.5
+
+
+@dataclass(slots=True)
+class Comoments:
+    """Means, variances, and covariance of a stream of value pairs ``(x, y)``.
+
+    Used for ratio estimates such as net win per dollar wagered, whose standard
+    error depends on the covariance of the numerator and denominator.
+    """
+
+    count: int = 0
+    mean_x: float = 0.0
+    mean_y: float = 0.0
+    m2_x: float = 0.0
+    """Sum of squared deviations of ``x``."""
+    m2_y: float = 0.0
+    """Sum of squared deviations of ``y``."""
+    c_xy: float = 0.0
+    """Sum of products of the deviations of ``x`` and ``y``."""
+
+    def add(self, x: float, y: float) -> None:
+        """Add one pair."""
+        self.count += 1
+        n = self.count
+        dx = x - self.mean_x
+        dy = y - self.mean_y
+        self.mean_x += dx / n
+        self.mean_y += dy / n
+        self.m2_x += dx * (x - self.mean_x)
+        self.m2_y += dy * (y - self.mean_y)
+        self.c_xy += dx * (y - self.mean_y)
+
+    def merge(self, other: "Comoments") -> None:
+        """Add the pairs counted by ``other``."""
+        if other.count == 0:
+            return
+        na, nb = self.count, other.count
+        n = na + nb
+        dx = other.mean_x - self.mean_x
+        dy = other.mean_y - self.mean_y
+        factor = na * nb / n
+        self.m2_x += other.m2_x + dx * dx * factor
+        self.m2_y += other.m2_y + dy * dy * factor
+        self.c_xy += other.c_xy + dx * dy * factor
+        self.mean_x += dx * nb / n
+        self.mean_y += dy * nb / n
+        self.count = n
+
+    @property
+    def covariance(self) -> float:
+        """Sample covariance of ``x`` and ``y``."""
+        return self.c_xy / (self.count - 1) if self.count > 1 else math.nan
+
+    @property
+    def ratio(self) -> float:
+        """Ratio of the means, ``mean(x) / mean(y)``."""
+        return self.mean_x / self.mean_y if self.mean_y else math.nan
+
+    @property
+    def ratio_stderr(self) -> float:
+        """Standard error of :attr:`ratio`, by the delta method."""
+        if self.count < 2 or not self.mean_y:
+            return math.nan
+        r = self.ratio
+        n = self.count
+        var = (self.m2_x - 2 * r * self.c_xy + r * r * self.m2_y) / (n - 1)
+        return math.sqrt(max(var, 0.0) / n) / abs(self.mean_y)
+
+
+class CovarianceMatrix:
+    """Mean vector and covariance matrix of a stream of equal-length vectors.
+
+    The vector form of :class:`Moments`, for comparing several quantities
+    measured on the same sessions (e.g. strategies on common dice), where the
+    variance of a difference depends on the covariances.
+
+    Args:
+        size: Length of the vectors.
+    """
+
+    def __init__(self, size: int) -> None:
+        self.count = 0
+        self.mean = np.zeros(size)
+        self.m2 = np.zeros((size, size))
+        """Sums of products of deviations from the mean."""
+
+    def add(self, values: Iterable[float]) -> None:
+        """Add one vector."""
+        x = np.asarray(values, dtype=np.float64)
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += np.outer(delta, x - self.mean)
+
+    def merge(self, other: "CovarianceMatrix") -> None:
+        """Add the vectors counted by ``other``."""
+        if other.count == 0:
+            return
+        na, nb = self.count, other.count
+        n = na + nb
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + np.outer(delta, delta) * (na * nb / n)
+        self.mean += delta * (nb / n)
+        self.count = n
+
+    def subset(self, indices: Iterable[int]) -> "CovarianceMatrix":
+        """Return the statistics of the selected vector components."""
+        indices = list(indices)
+        result = CovarianceMatrix(len(indices))
+        result.count = self.count
+        result.mean = self.mean[indices].copy()
+        result.m2 = self.m2[np.ix_(indices, indices)].copy()
+        return result
+
+    @property
+    def covariance(self) -> np.ndarray:
+        """Sample covariance matrix."""
+        if self.count < 2:
+            return np.full_like(self.m2, math.nan)
+        return self.m2 / (self.count - 1)
+
+    def difference_stderr(self, i: int, j: int) -> float:
+        """Standard error of ``mean[i] - mean[j]``."""
+        if self.count < 2:
+            return math.nan
+        cov = self.covariance
+        var = cov[i, i] + cov[j, j] - 2 * cov[i, j]
+        return math.sqrt(max(var, 0.0) / self.count)
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, CovarianceMatrix)
+            and self.count == other.count
+            and np.array_equal(self.mean, other.mean)
+            and np.array_equal(self.m2, other.m2)
+        )
+
+
+@dataclass
+class QuantileSketch:
+    """Mergeable KLL sketch for approximate quantiles of a stream of values.
+
+    The sketch keeps a hierarchy of compactors whose capacities shrink
+    geometrically with depth; when the sketch is full, a compactor sorts its
+    items and promotes every other one to the level above, where each item
+    stands for twice as many values. Memory is ``O(k)`` regardless of the
+    number of values, the rank error is about ``1.7 / k`` of the count, and
+    quantiles are exact until the first compaction.
+
+    The random choice of which half to keep comes from a small generator
+    stored in the sketch, so updates and merges are reproducible.
+    """
+
+    k: int = 200
+    """Size of the largest compactor; larger is more accurate."""
+    levels: list[list[float]] = field(default_factory=lambda: [[]])
+    """Items of each compactor; an item at level ``h`` has weight ``2**h``."""
+    count: int = 0
+    """Number of values added."""
+    rng_state: int = 0x2545F4914F6CDD1D
+    """State of the generator deciding which half a compaction keeps."""
+
+    _C = 2.0 / 3.0
+    """Ratio of the capacities of successive compactors."""
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return int(math.ceil(self._C**depth * self.k)) + 1
+
+    def _coin(self) -> int:
+        # 64-bit linear congruential generator; the top bit is the coin
+        self.rng_state = (
+            self.rng_state * 6364136223846793005 + 1442695040888963407
+        ) % 2**64
+        return self.rng_state >> 63
+
+    def _size(self) -> int:
+        return sum(len(items) for items in self.levels)
+
+    def _max_size(self) -> int:
+        return sum(self._capacity(level) for level in range(len(self.levels)))
+
+    def _compress(self) -> None:
+        """Compact full compactors until the sketch fits its capacity."""
+        while self._size() >= self._max_size():
+            for level, items in enumerate(self.levels):
+                if len(items) >= self._capacity(level):
+                    if level + 1 == len(self.levels):
+                        self.levels.append([])
+                    items.sort()
+                    # With an odd count, the largest item stays at this level
+                    n_pairs = len(items) // 2
+                    kept = items[self._coin() : 2 * n_pairs : 2]
+                    self.levels[level + 1].extend(kept)
+                    del items[: 2 * n_pairs]
+                    break
+
+    def add(self, value: float) -> None:
+        """Add one value."""
+        self.levels[0].append(value)
+        self.count += 1
+        self._compress()
+
+    def extend(self, values: Iterable[float]) -> None:
+        """Add several values."""
+        for value in values:
+            self.add(value)
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Add the values summarized by ``other``."""
+        while len(self.levels) < len(other.levels):
+            self.levels.append([])
+        for items, other_items in zip(self.levels, other.levels):
+            items.extend(other_items)
+        self.count += other.count
+        self._compress()
+
+    def quantiles(self, qs: Iterable[float]) -> list[float]:
+        """Return the approximate ``q``-quantile for each ``q`` in ``qs``.
+
+        The ``q``-quantile is the smallest value whose rank is at least
+        ``q`` times the number of values.
+
+        Raises:
+            ValueError: If the sketch is empty or a ``q`` is outside [0, 1].
+        """
+        weighted = sorted(
+            (item, 1 << level)
+            for level, items in enumerate(self.levels)
+            for item in items
+        )
+        if not weighted:
+            raise ValueError("Quantile of an empty sketch")
+        items = [item for item, _ in weighted]
+        ranks = list(accumulate(weight for _, weight in weighted))
+        result = []
+        for q in qs:
+            if not 0 <= q <= 1:
+                raise ValueError(f"Quantile must be in [0, 1], got {q}")
+            index = bisect_left(ranks, q * ranks[-1])
+            result.append(items[min(index, len(items) - 1)])
+        return result
+
+    def quantile(self, q: float) -> float:
+        """Return the approximate ``q``-quantile (see :meth:`quantiles`)."""
+        return self.quantiles([q])[0]
@@ -0,0 +1,173 @@
+"""Mergeable per-strategy aggregates of session outcomes."""
+
+import math
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, Literal, Protocol
+
+from crapssim.batch.experiment import PlayerOutcome, SessionResult
+from crapssim.batch.stats import Comoments, Moments, QuantileSketch
+
+__all__ = ["Aggregate", "Metric", "StrategyStats", "Summary"]
+
+Metric = Literal["net", "net_per_wagered"]
+"""Estimated quantities of a strategy: mean net win per session, or net win
+per dollar wagered."""
+
+
+class Aggregate(Protocol):
+    """Running aggregate of session results used by the batch runner.
+
+    Aggregates are created empty, updated with each session, and merged with
+    the aggregates of other session ranges (from other chunks, workers, or
+    shards). They must be picklable so they can be checkpointed and sent
+    between processes.
+
+    An aggregate that needs per-roll wealth paths (see
+    :attr:`~crapssim.batch.experiment.SessionResult.paths`) sets a true
+    ``needs_paths`` attribute; paths are not recorded otherwise. Likewise, an
+    aggregate that needs control variates (see
+    :attr:`~crapssim.batch.experiment.PlayerOutcome.controls`) sets a true
+    ``needs_controls`` attribute.
+    """
+
+    def update(self, session: SessionResult) -> None:
+        """Add one session to the aggregate."""
+        ...
+
+    def merge(self, other: "Aggregate") -> None:
+        """Add the sessions of ``other`` to this aggregate, in place."""
+        ...
+
+
+@dataclass
+class StrategyStats:
+    """Streaming statistics of one strategy's session outcomes.
+
+    Memory is constant in the number of sessions: the final bankroll is
+    summarized by its moments and a quantile sketch, and ruin and doubling
+    are counted.
+    """
+
+    target: float = 2.0
+    """Multiple of the starting bankroll that counts as reaching the target."""
+    start: float = math.nan
+    """Starting bankroll of the sessions."""
+    final: Moments = field(default_factory=Moments)
+    """Moments of the final bankroll (counting bets on the layout)."""
+    sketch: QuantileSketch = field(default_factory=QuantileSketch)
+    """Quantile sketch of the final bankroll."""
+    net_wagered: Comoments = field(default_factory=Comoments)
+    """Joint moments of the net win and the amount wagered per session."""
+    n_ruined: int = 0
+    """Sessions where the strategy stopped, completed, with less than it started with."""
+    n_target: int = 0
+    """Sessions that ended with at least ``target`` times the starting bankroll."""
+
+    def add(self, outcome: PlayerOutcome) -> None:
+        """Add one session's outcome."""
+        final = outcome.final
+        self.start = outcome.start
+        self.final.add(final)
+        self.sketch.add(final)
+        self.net_wagered.add(outcome.net, outcome.wagered)
+        self.n_ruined += outcome.completed and final < outcome.start
+        self.n_target += final >= self.target * outcome.start
+
+    def merge(self, other: "StrategyStats") -> None:
+        """Add the sessions counted by ``other``."""
+        if other.final.count:
+            self.start = other.start
+        self.final.merge(other.final)
+        self.sketch.merge(other.sketch)
+        self.net_wagered.merge(other.net_wagered)
+        self.n_ruined += other.n_ruined
+        self.n_target += other.n_target
+
+    @property
+    def count(self) -> int:
+        """Number of sessions."""
+        return self.final.count
+
+    @property
+    def net(self) -> float:
+        """Mean net win per session."""
+        return self.final.mean - self.start
+
+    @property
+    def p_ruin(self) -> float:
+        """Fraction of sessions ending in ruin."""
+        return self.n_ruined / self.count if self.count else math.nan
+
+    @property
+    def p_target(self) -> float:
+        """Fraction of sessions reaching the target (by default, doubling)."""
+        return self.n_target / self.count if self.count else math.nan
+
+    @property
+    def net_per_wagered(self) -> float:
+        """Net win per dollar wagered (negative of the realized house edge)."""
+        return self.net_wagered.ratio
+
+    def quantiles(self, qs: Iterable[float]) -> list[float]:
+        """Approximate quantiles of the final bankroll."""
+        return self.sketch.quantiles(qs)
+
+    def estimate(self, metric: Metric = "net") -> tuple[float, float]:
+        """Return an estimate of ``metric`` and its standard error.
+
+        Raises:
+            ValueError: If the metric is unknown.
+        """
+        if metric == "net":
+            return self.net, self.final.stderr
+        if metric == "net_per_wagered":
+            return self.net_per_wagered, self.net_wagered.ratio_stderr
+        raise ValueError(f"Unknown metric: {metric!r}")
+
+
+@dataclass
+class Summary:
+    """Streaming statistics of the final bankroll of each strategy.
+
+    This is the default aggregate of :func:`~crapssim.batch.runner.run_batch`.
+    To change the doubling target or the sketch size, pass e.g.
+    ``functools.partial(Summary, target=3.0)`` as the aggregate factory.
+    """
+
+    target: float = 2.0
+    """Multiple of the starting bankroll that counts as reaching the target."""
+    k: int = 200
+    """Size of the quantile sketches."""
+    sessions: int = 0
+    """Number of sessions aggregated."""
+    rolls: Moments = field(default_factory=Moments)
+    """Rolls per session."""
+    strategies: dict[str, StrategyStats] = field(default_factory=dict)
+    """Statistics of each strategy, keyed by strategy name."""
+
+    def _stats(self, name: str) -> StrategyStats:
+        if name not in self.strategies:
+            self.strategies[name] = StrategyStats(
+                target=self.target, sketch=QuantileSketch(k=self.k)
+            )
+        return self.strategies[name]
+
+    def update(self, session: SessionResult) -> None:
+        """Add one session to the summary."""
+        self.sessions += 1
+        self.rolls.add(session.n_rolls)
+        for player in session.players:
+            self._stats(player.name).add(player)
+
+    def merge(self, other: "Summary") -> None:
+        """Add the sessions of ``other`` to this summary, in place."""
+        self.sessions += other.sessions
+        self.rolls.merge(other.rolls)
+        for name, stats in other.strategies.items():
+            self._stats(name).merge(stats)
+
+    def __getitem__(self, name: str) -> StrategyStats:
+        return self.strategies[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.strategies)
@@ -0,0 +1,328 @@
+"""Parameter sweeps over strategy constructors, bankrolls, rules, and settings."""
+
+import csv
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Mapping, Protocol, Sequence
+
+import numpy as np
+
+from crapssim.batch.experiment import Experiment
+from crapssim.batch.runner import run_range
+from crapssim.batch.summary import Summary
+from crapssim.rules import Rules
+from crapssim.strategy import Strategy
+
+__all__ = ["ResultStore", "SweepPoint", "Sweep", "SweepResult", "run_sweep"]
+
+QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+"""Quantiles of the final bankroll reported for each configuration."""
+
+_RESULT_COLUMNS = (
+    "sessions",
+    "cached",
+    "net",
+    "net_stderr",
+    "net_per_wagered",
+    "std",
+    "p_ruin",
+    "p_target",
+    "rolls",
+    *(f"q{round(q * 100):02d}" for q in QUANTILES),
+)
+"""Statistics columns of a result row, after the configuration columns."""
+
+Values = Sequence[Any] | Callable[[np.random.Generator], Any]
+"""Values of one sweep dimension: a sequence to choose from, or (for random
+designs only) a function drawing a value from a numpy random generator."""
+
+
+class ResultStore(Protocol):
+    """Store of previously computed results, used to skip cached configurations.
+
+    See :class:`~crapssim.batch.cache.ResultCache` for the on-disk implementation.
+    """
+
+    def get(self, experiment: Experiment, start: int, stop: int) -> Summary | None:
+        """Return the summary of sessions ``[start, stop)``, or None if unknown."""
+        ...
+
+    def put(
+        self, experiment: Experiment, start: int, stop: int, summary: Summary
+    ) -> None:
+        """Store the summary of sessions ``[start, stop)``."""
+        ...
+
+
+@dataclass(frozen=True)
+class SweepPoint:
+    """One configuration of a sweep.
+
+    Raises:
+        ValueError: If a strategy parameter or table setting has the name of
+            another column of the result table (e.g. ``"bankroll"`` or
+            ``"net"``), which it would overwrite.
+    """
+
+    params: dict[str, Any]
+    """Keyword arguments of the strategy constructor."""
+    bankroll: float
+    """Starting bankroll."""
+    settings: dict[str, Any] = field(default_factory=dict)
+    """Table settings overrides."""
+    rules: Rules | None = None
+    """Table rules; None for ClassicRules."""
+
+    def __post_init__(self) -> None:
+        reserved = {"bankroll", "rules", *_RESULT_COLUMNS}
+        for name in self.params:
+            if name in reserved or name in self.settings:
+                raise ValueError(f"Parameter {name!r} clashes with a result column")
+        for name in self.settings:
+            if name in reserved:
+                raise ValueError(f"Setting {name!r} clashes with a result column")
+
+    def columns(self) -> dict[str, Any]:
+        """The configuration as flat columns for a result table."""
+        rules = "ClassicRules" if self.rules is None else type(self.rules).__name__
+        return {
+            **self.params,
+            "bankroll": self.bankroll,
+            **self.settings,
+            "rules": rules,
+        }
+
+
+@dataclass(frozen=True)
+class Sweep:
+    """Declarative sweep over a strategy constructor and table configurations.
+
+    Every dimension is a sequence of values: ``params`` maps keyword arguments
+    of ``strategy`` to values, ``settings`` maps table setting names to
+    values, and ``bankroll`` and ``rules`` list bankrolls and rule sets. All
+    configurations share ``seed_root``, so session ``i`` has the same dice in
+    every configuration.
+
+    Example::
+
+        sweep = Sweep(
+            IronCross,
+            params={"base_amount": [5, 10, 15]},
+            bankroll=[200, 500],
+            settings={"field_payouts": [{2: 2, 12: 2}, {2: 2, 12: 3}]},
+        )
+        result = run_sweep(sweep, n_sessions=10_000, workers=8)
+    """
+
+    strategy: Callable[..., Strategy]
+    """Strategy constructor (a Strategy class or factory function)."""
+    params: Mapping[str, Values] = field(default_factory=dict)
+    """Values of the constructor's keyword arguments."""
+    bankroll: Values = (300,)
+    """Starting bankrolls."""
+    settings: Mapping[str, Values] = field(default_factory=dict)
+    """Values of table settings."""
+    rules: Values = (None,)
+    """Rule sets; None for ClassicRules."""
+    max_rolls: float = float("inf")
+    """Maximum number of rolls per session."""
+    max_shooter: float = 10
+    """Maximum number of shooters per session."""
+    runout: bool = False
+    """If True, keep rolling after the limits until all bets are resolved."""
+    seed_root: int = 0
+    """Root of the per-session seeds, shared by all configurations."""
+
+    def _dimensions(self) -> list[tuple[str, str, Values]]:
+        dimensions = [("params", name, values) for name, values in self.params.items()]
+        dimensions.append(("bankroll", "bankroll", self.bankroll))
+        dimensions += [("settings", name, v) for name, v in self.settings.items()]
+        dimensions.append(("rules", "rules", self.rules))
+        return dimensions
+
+    @staticmethod
+    def _point(choices: Iterable[tuple[str, str, Any]]) -> SweepPoint:
+        params: dict[str, Any] = {}
+        settings: dict[str, Any] = {}
+        bankroll: float = 0
+        rules = None
+        for kind, name, value in choices:
+            if kind == "params":
+                params[name] = value
+            elif kind == "settings":
+                settings[name] = value
+            elif kind == "bankroll":
+                bankroll = value
+            else:
+                rules = value
+        return SweepPoint(params, bankroll, settings, rules)
+
+    def grid(self) -> list[SweepPoint]:
+        """Return every combination of the dimension values.
+
+        Raises:
+            TypeError: If a dimension is a function rather than a sequence.
+        """
+        dimensions = self._dimensions()
+        for _, name, values in dimensions:
+            if callable(values):
+                raise TypeError(f"Grid dimension {name!r} must be a sequence")
+        return [
+            self._point(
+                (kind, name, value)
+                for (kind, name, _), value in zip(dimensions, combination)
+            )
+            for combination in itertools.product(*(v for _, _, v in dimensions))
+        ]
+
+    def random(self, n: int, seed: int = 0) -> list[SweepPoint]:
+        """Return ``n`` configurations with each dimension drawn independently.
+
+        Sequence dimensions are sampled uniformly; function dimensions are
+        called with a numpy random generator.
+
+        Args:
+            n: Number of configurations.
+            seed: Seed of the design (independent of the dice seeds).
+        """
+        rng = np.random.default_rng(seed)
+        dimensions = self._dimensions()
+        points = []
+        for _ in range(n):
+            choices = []
+            for kind, name, values in dimensions:
+                if callable(values):
+                    value = values(rng)
+                else:
+                    value = values[int(rng.integers(len(values)))]
+                choices.append((kind, name, value))
+            points.append(self._point(choices))
+        return points
+
+    def experiment(self, point: SweepPoint) -> Experiment:
+        """Return the experiment for one configuration."""
+        name = getattr(self.strategy, "__name__", "strategy")
+        args = ", ".join(f"{k}={v!r}" for k, v in point.params.items())
+        return Experiment(
+            {f"{name}({args})": self.strategy(**point.params)},
+            bankroll=point.bankroll,
+            max_rolls=self.max_rolls,
+            max_shooter=self.max_shooter,
+            runout=self.runout,
+            rules=point.rules,
+            settings=point.settings,
+            seed_root=self.seed_root,
+        )
+
+
+@dataclass(frozen=True)
+class SweepResult:
+    """Tidy table of sweep results, one row per configuration."""
+
+    rows: list[dict[str, Any]]
+    """One dict per configuration: configuration columns, then statistics."""
+
+    @property
+    def columns(self) -> list[str]:
+        """Column names, in order of first appearance."""
+        return list(dict.fromkeys(name for row in self.rows for name in row))
+
+    def to_csv(self, path: str | os.PathLike[str]) -> None:
+        """Write the table to a CSV file."""
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=self.columns)
+            writer.writeheader()
+            writer.writerows(self.rows)
+
+
+def _row(point: SweepPoint, summary: Summary, cached: bool) -> dict[str, Any]:
+    (stats,) = summary.strategies.values()
+    net, net_stderr = stats.estimate("net")
+    row = point.columns()
+    row.update(
+        sessions=summary.sessions,
+        cached=cached,
+        net=net,
+        net_stderr=net_stderr,
+        net_per_wagered=stats.net_per_wagered,
+        std=stats.final.std,
+        p_ruin=stats.p_ruin,
+        p_target=stats.p_target,
+        rolls=summary.rolls.mean,
+    )
+    for q, value in zip(QUANTILES, stats.quantiles(QUANTILES)):
+        row[f"q{round(q * 100):02d}"] = value
+    return row
+
+
+def run_sweep(
+    sweep: Sweep,
+    n_sessions: int,
+    points: Sequence[SweepPoint] | None = None,
+    *,
+    chunk_size: int = 1000,
+    workers: int = 1,
+    cache: ResultStore | None = None,
+) -> SweepResult:
+    """Run ``n_sessions`` sessions of every configuration of ``sweep``.
+
+    The chunks of all configurations not found in ``cache`` are scheduled
+    together on ``workers`` processes, and the chunk summaries of each
+    configuration are merged in session order. New results are stored in
+    ``cache``.
+
+    Args:
+        sweep: Sweep to run.
+        n_sessions: Sessions per configuration.
+        points: Configurations to run, e.g. from :meth:`Sweep.random`;
+            defaults to :meth:`Sweep.grid`.
+        chunk_size: Sessions per chunk.
+        workers: Number of worker processes; 1 runs in this process.
+        cache: Optional store used to skip configurations already run.
+
+    Returns:
+        SweepResult: One row per configuration, in the order of ``points``.
+    """
+    if n_sessions < 1:
+        raise ValueError("n_sessions must be positive")
+    if points is None:
+        points = sweep.grid()
+    experiments = [sweep.experiment(point) for point in points]
+    summaries: list[Summary | None] = [None] * len(points)
+    cached = [False] * len(points)
+    if cache is not None:
+        for i, experiment in enumerate(experiments):
+            summaries[i] = cache.get(experiment, 0, n_sessions)
+            cached[i] = summaries[i] is not None
+
+    tasks = [
+        (i, start, min(start + chunk_size, n_sessions))
+        for i in range(len(points))
+        if not cached[i]
+        for start in range(0, n_sessions, chunk_size)
+    ]
+    if workers <= 1:
+        chunk_results = [run_range(experiments[i], a, b) for i, a, b in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(run_range, experiments[i], a, b) for i, a, b in tasks
+            ]
+            chunk_results = [future.result() for future in futures]
+
+    for (i, _, _), result in zip(tasks, chunk_results):
+        if summaries[i] is None:
+            summaries[i] = Summary()
+        summaries[i].merge(result)  # type: ignore[union-attr]
+    if cache is not None:
+        for i, experiment in enumerate(experiments):
+            if not cached[i]:
+                cache.put(experiment, 0, n_sessions, summaries[i])  # type: ignore[arg-type]
+
+    rows = [
+        _row(point, summary, was_cached)  # type: ignore[arg-type]
+        for point, summary, was_cached in zip(points, summaries, cached)
+    ]
+    return SweepResult(rows)
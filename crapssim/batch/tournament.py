@@ -0,0 +1,233 @@
+"""Racing tournaments that rank many strategies on common dice."""
+
+import dataclasses
+import functools
+import math
+from dataclasses import dataclass
+from statistics import NormalDist
+from typing import Callable
+
+from crapssim.batch.experiment import Experiment, SessionResult
+from crapssim.batch.runner import run_batch
+from crapssim.batch.stats import CovarianceMatrix
+
+__all__ = ["PairedNet", "Standing", "TournamentResult", "run_tournament"]
+
+
+class PairedNet:
+    """Aggregate of the net win of several strategies on the same sessions.
+
+    Keeps the mean net win of each strategy and their covariance, so that
+    differences between strategies are judged on paired sessions.
+
+    Args:
+        names: Strategy names, in seating order.
+    """
+
+    def __init__(self, names: tuple[str, ...]) -> None:
+        self.names = names
+        self.moments = CovarianceMatrix(len(names))
+
+    def update(self, session: SessionResult) -> None:
+        """Add one session."""
+        self.moments.add([player.net for player in session.players])
+
+    def merge(self, other: "PairedNet") -> None:
+        """Add the sessions of ``other``, which must have the same names."""
+        if other.names != self.names:
+            raise ValueError("Cannot merge aggregates of different strategies")
+        self.moments.merge(other.moments)
+
+    def subset(self, names: tuple[str, ...]) -> "PairedNet":
+        """Return the aggregate restricted to ``names``."""
+        result = PairedNet(names)
+        result.moments = self.moments.subset(self.names.index(n) for n in names)
+        return result
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, PairedNet)
+            and self.names == other.names
+            and self.moments == other.moments
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class Standing:
+    """Final standing of one candidate of a tournament."""
+
+    name: str
+    """Candidate name."""
+    net: float
+    """Mean net win per session."""
+    half_width: float
+    """Half-width of the confidence interval of ``net``."""
+    sessions: int
+    """Number of sessions the candidate played."""
+    eliminated: int | None
+    """Round in which the candidate was eliminated, or None for survivors."""
+
+    @property
+    def low(self) -> float:
+        """Lower end of the confidence interval."""
+        return self.net - self.half_width
+
+    @property
+    def high(self) -> float:
+        """Upper end of the confidence interval."""
+        return self.net + self.half_width
+
+
+@dataclass(frozen=True)
+class TournamentResult:
+    """Outcome of :func:`run_tournament`."""
+
+    ranking: list[Standing]
+    """Candidates from best to worst: survivors by mean net win, then the
+    eliminated candidates, latest eliminations first."""
+    rounds: int
+    """Number of rounds played."""
+    round_size: int
+    """Sessions per round."""
+
+    @property
+    def survivors(self) -> list[str]:
+        """Names of the candidates that were never eliminated."""
+        return [s.name for s in self.ranking if s.eliminated is None]
+
+    @property
+    def candidate_sessions(self) -> int:
+        """Sessions played, summed over candidates."""
+        return sum(s.sessions for s in self.ranking)
+
+    @property
+    def uniform_sessions(self) -> int:
+        """Candidate-sessions a uniform allocation with the same depth would use."""
+        return len(self.ranking) * self.rounds * self.round_size
+
+    @property
+    def saved(self) -> float:
+        """Fraction of the uniform allocation's compute that was saved."""
+        return 1 - self.candidate_sessions / self.uniform_sessions
+
+
+def run_tournament(
+    experiment: Experiment,
+    round_size: int = 500,
+    *,
+    max_rounds: int = 20,
+    confidence: float = 0.95,
+    halving: bool = False,
+    n_survivors: int = 1,
+    chunk_size: int | None = None,
+    workers: int = 1,
+    progress: Callable[[int, list[str]], None] | None = None,
+) -> TournamentResult:
+    """Rank the strategies of ``experiment`` by net win, racing them on common dice.
+
+    Every round runs the next ``round_size`` sessions with all remaining
+    candidates at the same table, so they face the same dice. After each
+    round the leader (highest mean net win so far) is compared with every
+    other candidate on their paired per-session differences, and candidates
+    the leader beats with the given confidence (Bonferroni-adjusted over the
+    comparisons) are eliminated. With ``halving``, only the better half of the
+    remaining candidates by mean (but at least ``n_survivors``) continue to
+    the next round, as in successive halving. The tournament ends when
+    ``n_survivors`` or fewer candidates remain, or after ``max_rounds``.
+
+    Args:
+        experiment: Experiment whose strategies are the candidates.
+        round_size: Sessions per round.
+        max_rounds: Maximum number of rounds.
+        confidence: Confidence level for eliminating a candidate.
+        halving: If True, also keep only the better half each round.
+        n_survivors: Stop once this many candidates remain.
+        chunk_size: Sessions per worker chunk; defaults to an even split of
+            each round over the workers.
+        workers: Number of worker processes.
+        progress: Optional callback, called after each round with the round
+            number and the remaining candidates.
+
+    Returns:
+        TournamentResult: The ranking and the compute used.
+
+    Raises:
+        ValueError: If ``round_size``, ``max_rounds`` or ``n_survivors`` is
+            not positive, or ``confidence`` is not between 0 and 1.
+    """
+    if round_size < 1:
+        raise ValueError("round_size must be positive")
+    if max_rounds < 1:
+        raise ValueError("max_rounds must be positive")
+    if n_survivors < 1:
+        raise ValueError("n_survivors must be positive")
+    if not 0 < confidence < 1:
+        raise ValueError("confidence must be between 0 and 1")
+    if chunk_size is None:
+        chunk_size = max(1, math.ceil(round_size / workers))
+    alive = tuple(experiment.strategies)
+    stats = PairedNet(alive)
+    eliminated: dict[str, tuple[int, float, float, int]] = {}
+
+    def standing(stats: PairedNet, index: int, z: float) -> tuple[float, float]:
+        moments = stats.moments
+        se = math.sqrt(moments.covariance[index, index] / moments.count)
+        return float(moments.mean[index]), z * se
+
+    n_rounds = 0
+    for n_round in range(1, max_rounds + 1):
+        n_rounds = n_round
+        round_experiment = dataclasses.replace(
+            experiment, strategies={n: experiment.strategies[n] for n in alive}
+        )
+        batch = run_batch(
+            round_experiment,
+            round_size,
+            start=(n_round - 1) * round_size,
+            chunk_size=chunk_size,
+            workers=workers,
+            aggregate=functools.partial(PairedNet, alive),
+        )
+        stats.merge(batch.aggregate)
+
+        means = stats.moments.mean
+        leader = int(means.argmax())
+        n_comparisons = max(len(alive) - 1, 1)
+        z_drop = NormalDist().inv_cdf(1 - (1 - confidence) / (2 * n_comparisons))
+        z_interval = NormalDist().inv_cdf((1 + confidence) / 2)
+
+        dropped = set()
+        for index in range(len(alive)):
+            if index == leader:
+                continue
+            gap = means[leader] - means[index]
+            se = stats.moments.difference_stderr(leader, index)
+            if gap - z_drop * se > 0:
+                dropped.add(index)
+        if halving:
+            order = sorted(range(len(alive)), key=lambda i: -means[i])
+            kept = max(n_survivors, math.ceil(len(alive) / 2))
+            dropped.update(order[kept:])
+
+        for index in dropped:
+            net, half_width = standing(stats, index, z_interval)
+            eliminated[alive[index]] = (n_round, net, half_width, stats.moments.count)
+        alive = tuple(n for i, n in enumerate(alive) if i not in dropped)
+        stats = stats.subset(alive)
+        if progress is not None:
+            progress(n_round, list(alive))
+        if len(alive) <= n_survivors:
+            break
+
+    z_interval = NormalDist().inv_cdf((1 + confidence) / 2)
+    survivors = [
+        Standing(name, *standing(stats, i, z_interval), stats.moments.count, None)
+        for i, name in enumerate(alive)
+    ]
+    survivors.sort(key=lambda s: -s.net)
+    losers = [
+        Standing(name, net, half_width, sessions, n_round)
+        for name, (n_round, net, half_width, sessions) in eliminated.items()
+    ]
+    losers.sort(key=lambda s: (-(s.eliminated or 0), -s.net))
+    return TournamentResult(survivors + losers, n_rounds, round_size)
@@ -167,6 +167,14 @@ class BetResult:
         """Returns True if the bet tied (zero amount)."""
         return self.amount == self.bet_amount
 
+    @property
+    def net(self) -> float:
+        """Net win of the decision: the profit of a win, minus the cost of a
+        loss, and zero for a push or no action."""
+        if self.won:
+            return self.amount - self.bet_amount
+        return min(self.amount, 0)
+
     @property
     def bankroll_change(self) -> float:
         """Cash credited to the bankroll for this result.
@@ -262,6 +270,12 @@ class Bet(ABC, metaclass=_MetaBetABC):
         new_bet = self.__class__(self.amount)
         return new_bet
 
+    def __copy__(self) -> "Bet":
+        # Shallow copy of the attributes, bypassing any custom pickling in __reduce__
+        new_bet = self.__class__.__new__(self.__class__)
+        new_bet.__dict__.update(self.__dict__)
+        return new_bet
+
     @property
     def _placed_key(self) -> Hashable:
         return type(self)
@@ -893,6 +907,15 @@ class _BoxNumberBet(_SimpleBet, ABC):
             always_working=self.always_working,
         )
 
+    def __reduce__(self) -> tuple:
+        # Pickle as constructor arguments, since the payout and winning/losing
+        # numbers are derived from the number by _set_payout().
+        derived = {"number", "amount", "always_working", "payout_ratio"}
+        derived.update({"winning_numbers", "losing_numbers"})
+        state = {k: v for k, v in self.__dict__.items() if k not in derived}
+        args = (self.number, self.amount, self.always_working)
+        return self.__class__, args, state or None
+
     @property
     def _placed_key(self) -> Hashable:
         return type(self), self.number
@@ -1535,6 +1558,12 @@ class Fire(Bet):
         self.points_made: set[int] = set()
         self.ended: bool = False
 
+    def __copy__(self) -> "Fire":
+        # Copy the points made so a copy tracks its progress independently
+        new_bet = cast(Fire, super().__copy__())
+        new_bet.points_made = set(self.points_made)
+        return new_bet
+
     def get_result(self, table: Table) -> BetResult:
 
         if table.point.status == "Off":
@@ -1589,6 +1618,12 @@ class _ATSBet(Bet):
         super().__init__(amount)
         self.rolled_numbers: set[int] = set()
 
+    def __copy__(self) -> "_ATSBet":
+        # Copy the rolled numbers so a copy tracks its progress independently
+        new_bet = cast(_ATSBet, super().__copy__())
+        new_bet.rolled_numbers = set(self.rolled_numbers)
+        return new_bet
+
     def get_result(self, table: Table) -> BetResult:
 
         if table.dice.total in self.numbers:
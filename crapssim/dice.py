@@ -5,7 +5,7 @@ internally, but advanced users may access it (through the Table, as table.dice)
 for new bets or strategies as needed.
 """
 
-from typing import Generator, Iterable, TypeAlias
+from typing import Any, Generator, Iterable, TypeAlias
 
 import numpy as np
 
@@ -15,6 +15,9 @@ DicePair: TypeAlias = tuple[int, int]
 DicePairInput: TypeAlias = Iterable[int]
 """Pair of dice represented as an iterable of two integers."""
 
+_PICKLE_VERSION = 1
+"""Version of the serialized form returned by ``Dice.__getstate__``."""
+
 
 class Dice:
     """
@@ -31,6 +34,38 @@ class Dice:
         self.rng: Generator = np.random.default_rng(seed)
         """Random number generated used when rolling"""
 
+    def reset(self, seed=None) -> None:
+        """
+        Restore the dice to their freshly constructed state
+
+        Clears the latest result and roll count and re-seeds the random number
+        generator, so the dice roll the same sequence as ``Dice(seed)``.
+
+        Args:
+            seed (int): The seed passed to the random number generator.
+        """
+        self._result = None
+        self.n_rolls = 0
+        self.rng = np.random.default_rng(seed)
+
+    def __getstate__(self) -> tuple[int, int, DicePair | None, dict[str, Any]]:
+        # Store the generator as its plain bit generator state, which is compact
+        # and does not depend on numpy's internal pickling helpers.
+        result = tuple(self._result) if self._result is not None else None
+        return _PICKLE_VERSION, self.n_rolls, result, self.rng.bit_generator.state
+
+    def __setstate__(
+        self, state: tuple[int, int, DicePair | None, dict[str, Any]]
+    ) -> None:
+        version, n_rolls, result, rng_state = state
+        if version != _PICKLE_VERSION:
+            raise ValueError(f"Unsupported Dice pickle version: {version}")
+        self._result = result
+        self.n_rolls = n_rolls
+        bit_generator = getattr(np.random, rng_state["bit_generator"])()
+        bit_generator.state = rng_state
+        self.rng = np.random.Generator(bit_generator)
+
     @property
     def total(self) -> int | None:
         """Sum of dice outcome, e.g. 8 for (2, 6)"""
@@ -72,3 +107,88 @@ class Dice:
         """
         self.n_rolls += 1
         self._result = outcome
+
+
+class TiltedDice(Dice):
+    """
+    Dice rolled from a non-uniform distribution over the 36 ordered outcomes,
+    for importance sampling.
+
+    Each random roll multiplies :attr:`weight`, the likelihood ratio of the
+    rolls so far, by the fair probability of the outcome (1/36) over its tilted
+    probability. Averaging a quantity times the weight of the rolls that
+    produced it gives an unbiased estimate of its mean under fair dice, which
+    can have a much smaller variance for rare events that the tilt makes
+    common. Fixed rolls do not change the weight.
+
+    Args:
+        probabilities (Iterable[float]): Relative probability of each ordered
+            outcome, in the order (1, 1), (1, 2), ..., (6, 6), or as a 6 by 6
+            array indexed by the two dice; normalized to sum to one. Every
+            outcome must be possible.
+        seed (int): The seed passed to the random number generator.
+    """
+
+    def __init__(self, probabilities: Iterable[float], seed=None) -> None:
+        super().__init__(seed)
+        self._set_probabilities(probabilities)
+        self.log_weight: float = 0.0
+        """Log of the likelihood ratio of the rolls so far."""
+
+    @classmethod
+    def from_totals(cls, factors: dict[int, float], seed=None) -> "TiltedDice":
+        """
+        Tilt fair dice by multiplying the probability of each total in
+        ``factors`` (e.g. ``{7: 0.5}`` to halve the chance of a seven).
+
+        Args:
+            factors (dict[int, float]): Factor of each total; others are 1.
+            seed (int): The seed passed to the random number generator.
+        """
+        return cls(
+            [factors.get(a + b, 1.0) for a in range(1, 7) for b in range(1, 7)],
+            seed,
+        )
+
+    def _set_probabilities(self, probabilities: Iterable[float]) -> None:
+        p = np.asarray(list(probabilities), dtype=float).ravel()
+        if p.shape != (36,) or not np.all(p > 0) or not np.all(np.isfinite(p)):
+            raise ValueError("Need a positive probability for each of 36 outcomes")
+        self.probabilities: np.ndarray = p / p.sum()
+        """Probability of each ordered outcome."""
+        self._log_ratios = -np.log(36 * self.probabilities)
+        self._cdf = np.cumsum(self.probabilities)
+
+    @property
+    def weight(self) -> float:
+        """Likelihood ratio of the rolls so far, fair over tilted."""
+        return float(np.exp(self.log_weight))
+
+    def reset(self, seed=None) -> None:
+        """
+        Restore the dice to their freshly constructed state, with a weight
+        of 1
+
+        Args:
+            seed (int): The seed passed to the random number generator.
+        """
+        super().reset(seed)
+        self.log_weight = 0.0
+
+    def __getstate__(self) -> tuple[Any, ...]:  # type: ignore[override]
+        return super().__getstate__(), tuple(self.probabilities), self.log_weight
+
+    def __setstate__(self, state: tuple[Any, ...]) -> None:  # type: ignore[override]
+        dice_state, probabilities, log_weight = state
+        super().__setstate__(dice_state)
+        self._set_probabilities(probabilities)
+        self.log_weight = log_weight
+
+    def roll(self) -> None:
+        """
+        Randomly roll the dice from the tilted distribution
+        """
+        self.n_rolls += 1
+        i = min(int(np.searchsorted(self._cdf, self.rng.random(), side="right")), 35)
+        self._result = [i // 6 + 1, i % 6 + 1]
+        self.log_weight += self._log_ratios[i]
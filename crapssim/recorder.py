@@ -0,0 +1,269 @@
+"""
+Columnar recording of per-roll table state into preallocated NumPy arrays.
+
+A :class:`TrajectoryRecorder` attached to a table (``table.recorder = recorder``)
+records, after every roll, the dice, the point, and each player's bankroll and
+number of bets. Columns use compact dtypes and grow geometrically, so recording
+millions of rolls takes a few bytes per roll and player instead of a Python
+object per value. Each :meth:`~crapssim.table.Table.reset` starts a new session,
+and :meth:`TrajectoryRecorder.session` returns zero-copy views of a session's
+rows. Completed sessions can be spilled to ``.npy`` files in chunks to bound
+memory.
+"""
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from crapssim.table import Table
+
+__all__ = ["Trajectory", "TrajectoryRecorder", "load_chunk"]
+
+_COLUMNS = ("dice", "point", "bankroll", "n_bets", "starts")
+"""Arrays written for each spilled chunk; ``starts`` holds session row offsets."""
+
+
+@dataclass(slots=True, frozen=True)
+class Trajectory:
+    """Per-roll columns of one session, one row per roll."""
+
+    dice: np.ndarray
+    """Dice faces, int8 of shape (n_rolls, 2)."""
+    point: np.ndarray
+    """Point after the roll, int8 of shape (n_rolls,); 0 when the point is off."""
+    bankroll: np.ndarray
+    """Bankroll of each player after the roll, shape (n_rolls, n_players);
+    float32 dollars or int32 cents depending on the recorder."""
+    n_bets: np.ndarray
+    """Number of bets each player has on the layout, uint16 of shape
+    (n_rolls, n_players)."""
+
+    @property
+    def n_rolls(self) -> int:
+        """Number of rolls in the session."""
+        return len(self.point)
+
+    @property
+    def total(self) -> np.ndarray:
+        """Dice totals, int8 of shape (n_rolls,)."""
+        return self.dice.sum(axis=1, dtype=np.int8)
+
+    @property
+    def bankroll_dollars(self) -> np.ndarray:
+        """Bankrolls in dollars as float64 (a copy)."""
+        if self.bankroll.dtype.kind == "i":
+            return self.bankroll / 100.0
+        return self.bankroll.astype(np.float64)
+
+
+class TrajectoryRecorder:
+    """Record per-roll table state into growable, preallocated NumPy columns.
+
+    Args:
+        n_players: Number of players at the table being recorded.
+        capacity: Number of rows to preallocate; doubled whenever it fills up.
+        bankroll_dtype: ``"float32"`` to store bankrolls in dollars, or
+            ``"cents"`` to store them exactly as int32 cents.
+        spill_dir: Optional directory for spilled chunks (see :meth:`spill`).
+        spill_rows: With ``spill_dir``, completed sessions are spilled
+            automatically once at least this many rows are held in memory.
+    """
+
+    def __init__(
+        self,
+        n_players: int,
+        capacity: int = 4096,
+        bankroll_dtype: Literal["float32", "cents"] = "float32",
+        spill_dir: str | os.PathLike[str] | None = None,
+        spill_rows: int | None = None,
+    ) -> None:
+        if bankroll_dtype not in ("float32", "cents"):
+            raise ValueError(f"Unknown bankroll dtype: {bankroll_dtype!r}")
+        if spill_rows is not None and spill_dir is None:
+            raise ValueError("spill_rows requires a spill_dir")
+        self.n_players = n_players
+        self.cents = bankroll_dtype == "cents"
+        self.spill_dir = Path(spill_dir) if spill_dir is not None else None
+        self.spill_rows = spill_rows
+        capacity = max(capacity, 1)
+        self._dice = np.empty((capacity, 2), dtype=np.int8)
+        self._point = np.empty(capacity, dtype=np.int8)
+        self._bankroll = np.empty(
+            (capacity, n_players), dtype=np.int32 if self.cents else np.float32
+        )
+        self._n_bets = np.empty((capacity, n_players), dtype=np.uint16)
+        self._rows = 0
+        self._starts: list[int] = []
+        """Row offset of each session held in memory."""
+        self.n_spilled_sessions = 0
+        """Number of sessions written to spilled chunks."""
+        self.n_chunks = 0
+        """Number of chunks spilled."""
+
+    @property
+    def capacity(self) -> int:
+        """Number of rows currently allocated."""
+        return len(self._point)
+
+    @property
+    def n_rows(self) -> int:
+        """Number of rows held in memory."""
+        return self._rows
+
+    @property
+    def n_sessions(self) -> int:
+        """Number of sessions recorded, including spilled ones."""
+        return self.n_spilled_sessions + len(self._starts)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes allocated for the columns."""
+        return sum(
+            column.nbytes
+            for column in (self._dice, self._point, self._bankroll, self._n_bets)
+        )
+
+    def new_session(self) -> None:
+        """Start a new session; called by :meth:`~crapssim.table.Table.reset`.
+
+        If the recorder spills automatically and enough rows are held, the
+        sessions recorded so far are spilled first.
+        """
+        if (
+            self.spill_rows is not None
+            and self._starts
+            and self._rows >= self.spill_rows
+        ):
+            self.spill()
+        if self._starts and self._starts[-1] == self._rows:
+            return  # The current session is still empty
+        self._starts.append(self._rows)
+
+    def record(self, table: "Table") -> None:
+        """Append a row with the table's state after the latest roll."""
+        if not self._starts:
+            self._starts.append(self._rows)
+        if len(table.players) != self.n_players:
+            raise ValueError(
+                f"Recorder expects {self.n_players} players, "
+                f"table has {len(table.players)}"
+            )
+        row = self._rows
+        if row == self.capacity:
+            self._grow()
+        self._dice[row] = table.dice.result
+        self._point[row] = table.point.number or 0
+        for column, player in enumerate(table.players):
+            if self.cents:
+                self._bankroll[row, column] = round(player.bankroll * 100)
+            else:
+                self._bankroll[row, column] = player.bankroll
+            self._n_bets[row, column] = len(player.bets)
+        self._rows = row + 1
+
+    def _grow(self) -> None:
+        """Double the capacity of every column."""
+        capacity = 2 * self.capacity
+        for name in ("_dice", "_point", "_bankroll", "_n_bets"):
+            old = getattr(self, name)
+            new = np.empty((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[: self._rows] = old[: self._rows]
+            setattr(self, name, new)
+
+    def session(self, index: int) -> Trajectory:
+        """Return zero-copy views of the rows of session ``index``.
+
+        The views stay valid after more rows are recorded; they are not
+        affected by later growth or spilling.
+
+        Args:
+            index: Session number, counting spilled sessions; negative
+                indices count from the latest session.
+
+        Raises:
+            IndexError: If the session was spilled or does not exist.
+        """
+        if index < 0:
+            index += self.n_sessions
+        local = index - self.n_spilled_sessions
+        if local < 0:
+            raise IndexError(f"Session {index} was spilled; use load_chunk()")
+        if local >= len(self._starts):
+            raise IndexError(f"Session {index} has not been recorded")
+        start = self._starts[local]
+        stop = self._starts[local + 1] if local + 1 < len(self._starts) else self._rows
+        return Trajectory(
+            dice=self._dice[start:stop],
+            point=self._point[start:stop],
+            bankroll=self._bankroll[start:stop],
+            n_bets=self._n_bets[start:stop],
+        )
+
+    def spill(self) -> Path | None:
+        """Write the sessions held in memory to ``.npy`` files and drop them.
+
+        Each chunk is written as ``chunk-NNNNN.<column>.npy`` files in
+        ``spill_dir``; read it back with :func:`load_chunk`. The last session
+        is included, so call this between sessions.
+
+        Returns:
+            The chunk's path prefix, or None if there was nothing to spill.
+
+        Raises:
+            ValueError: If the recorder has no ``spill_dir``.
+        """
+        if self.spill_dir is None:
+            raise ValueError("Recorder has no spill_dir")
+        if self._rows == 0:
+            return None
+        self.spill_dir.mkdir(parents=True, exist_ok=True)
+        prefix = self.spill_dir / f"chunk-{self.n_chunks:05d}"
+        columns = {
+            "dice": self._dice[: self._rows],
+            "point": self._point[: self._rows],
+            "bankroll": self._bankroll[: self._rows],
+            "n_bets": self._n_bets[: self._rows],
+            "starts": np.asarray(self._starts, dtype=np.int64),
+        }
+        for name in _COLUMNS:
+            np.save(f"{prefix}.{name}.npy", columns[name])
+        self.n_chunks += 1
+        self.n_spilled_sessions += len(self._starts)
+        self._starts = []
+        self._rows = 0
+        # Views handed out earlier keep the old arrays alive, so start afresh
+        self._dice = np.empty_like(self._dice)
+        self._point = np.empty_like(self._point)
+        self._bankroll = np.empty_like(self._bankroll)
+        self._n_bets = np.empty_like(self._n_bets)
+        return prefix
+
+
+def load_chunk(prefix: str | os.PathLike[str], mmap: bool = True) -> list[Trajectory]:
+    """Load the sessions of a chunk written by :meth:`TrajectoryRecorder.spill`.
+
+    Args:
+        prefix: Path prefix returned by :meth:`TrajectoryRecorder.spill`.
+        mmap: If True, memory-map the files instead of reading them.
+
+    Returns:
+        list[Trajectory]: One trajectory per session in the chunk.
+    """
+    mode: Literal["r"] | None = "r" if mmap else None
+    columns = {
+        name: np.load(f"{prefix}.{name}.npy", mmap_mode=mode) for name in _COLUMNS
+    }
+    starts = [int(x) for x in columns["starts"]] + [len(columns["point"])]
+    return [
+        Trajectory(
+            dice=columns["dice"][start:stop],
+            point=columns["point"][start:stop],
+            bankroll=columns["bankroll"][start:stop],
+            n_bets=columns["n_bets"][start:stop],
+        )
+        for start, stop in zip(starts, starts[1:])
+    ]
@@ -27,4 +27,4 @@ from crapssim.strategy.tools import (
     Strategy,
 )
 
-from . import examples, odds
+from . import examples, odds, serialize
@@ -28,7 +28,6 @@ from crapssim.strategy.tools import (
     AddIfNotBet,
     AddIfPointOff,
     AddIfPointOn,
-    AddIfTrue,
     AggregateStrategy,
     CountStrategy,
     PlaceHitProgression,
@@ -428,6 +427,18 @@ class HammerLock(Strategy):
         """
         return player.bankroll < self.base_amount and len(player.bets) == 0
 
+    def reset(self) -> None:
+        """Clear the count of Place bet wins."""
+        self.place_win_count = 0
+
+    def snapshot(self) -> int:
+        """Return the count of Place bet wins."""
+        return self.place_win_count
+
+    def restore(self, state: int) -> None:
+        """Restore the count of Place bet wins."""
+        self.place_win_count = state
+
     def after_roll(self, player: Player) -> None:
         """Update the place_win_count based on how many Place bets are won. If table.point.status is
         On and the dice total is 7 (meaning the shooter sevens out) reset place_win_count to 0.
@@ -527,6 +538,18 @@ class Risk12(Strategy):
         """
         return player.bankroll < self.base_amount and len(player.bets) == 0
 
+    def reset(self) -> None:
+        """Restore the minimum bankroll to its starting value."""
+        self.min_bankroll = self.base_amount
+
+    def snapshot(self) -> float:
+        """Return the minimum bankroll for the current shooter."""
+        return self.min_bankroll
+
+    def restore(self, state: float) -> None:
+        """Restore the minimum bankroll for the current shooter."""
+        self.min_bankroll = state
+
     def point_off(self, player: Player) -> None:
         """Place a PassLine and Field bet for 5.
 
@@ -663,6 +686,19 @@ class Place68PR(Strategy):
         """
         return player.bankroll < self.starting_amount and len(player.bets) == 0
 
+    def reset(self) -> None:
+        """Clear the tracked Place 6 and Place 8 winnings."""
+        self.six_winnings = 0.0
+        self.eight_winnings = 0.0
+
+    def snapshot(self) -> tuple[float, float]:
+        """Return the tracked Place 6 and Place 8 winnings."""
+        return self.six_winnings, self.eight_winnings
+
+    def restore(self, state: tuple[float, float]) -> None:
+        """Restore the tracked Place 6 and Place 8 winnings."""
+        self.six_winnings, self.eight_winnings = state
+
     def after_roll(self, player: Player) -> None:
         """Get the winnings on the Place 6 and 8 bets to determine whether to press or regress.
 
@@ -769,10 +805,7 @@ class Place68DontCome2Odds(AggregateStrategy):
         self.dont_come_amount = float(dont_come_amount)
         super().__init__(
             BetPlace({6: six_eight_amount, 8: six_eight_amount}, skip_point=False),
-            AddIfTrue(
-                DontCome(dont_come_amount),
-                lambda p: len(p.get_bets_by_type((DontCome,))) == 0,
-            ),
+            CountStrategy(DontCome, 1, DontCome(dont_come_amount)),
             OddsMultiplier(DontCome, 2),
         )
 
@@ -0,0 +1,317 @@
+"""Canonical serialization of strategy configurations.
+
+A strategy is described by how it was constructed: its class and the arguments
+it was created with, recursively. Bets are described by their constructor
+arguments, bet types and enum members by name, and tuples, sets, dictionaries
+(with non-string keys), and non-finite floats by small tagged objects, so the
+result is plain JSON::
+
+    >>> to_dict(BetPassLine(5) + PassLineOddsMultiplier(2))
+    {'format': 1, 'strategy': {'object': 'AggregateStrategy', 'args': [...], ...}}
+
+The form is canonical: nested :class:`~crapssim.strategy.tools.AggregateStrategy`
+trees are flattened, whole floats are written as integers, and keyword arguments
+are sorted, so equally configured strategies have the same JSON and the same
+:func:`strategy_hash`. Dictionary order is kept, since it can change the order in
+which bets are placed.
+
+Classes are written by their registered name. Every bundled strategy, bet, and
+rule set is registered under its class name; user classes can be registered with
+:func:`register` so they can be decoded by name. Unregistered classes are written
+by their import path, which is enough for hashing but is only decoded with
+``allow_import=True``. Strategies built from arbitrary functions (e.g.
+:class:`~crapssim.strategy.tools.AddIfTrue` with a lambda key) cannot be
+serialized.
+"""
+
+import enum
+import hashlib
+import importlib
+import inspect
+import json
+import math
+from typing import Any, TypeVar
+
+import numpy as np
+
+from crapssim import bet, rules
+from crapssim.bet import Bet
+from crapssim.strategy import examples, odds, single_bet, tools
+from crapssim.strategy.tools import AggregateStrategy, Strategy
+
+__all__ = [
+    "FORMAT_VERSION",
+    "register",
+    "encode",
+    "decode",
+    "canonical_json",
+    "to_dict",
+    "from_dict",
+    "to_json",
+    "from_json",
+    "strategy_hash",
+]
+
+FORMAT_VERSION = 1
+"""Version of the serialized form, stored in the ``format`` field."""
+
+_T = TypeVar("_T", bound=type)
+
+_CLASSES: dict[str, type] = {}
+_NAMES: dict[type, str] = {}
+
+
+def register(cls: _T | None = None, *, name: str | None = None) -> Any:
+    """Register a class so it is serialized and decoded by name.
+
+    Can be used as a plain or parameterized class decorator::
+
+        @register
+        class MyStrategy(Strategy): ...
+
+        @register(name="my-strategy")
+        class MyOtherStrategy(Strategy): ...
+
+    Parameters
+    ----------
+    cls
+        The class to register.
+    name
+        Name to register the class under, by default ``module.QualifiedName``.
+
+    Returns
+    -------
+    The class, or a decorator if ``cls`` is not given.
+
+    Raises
+    ------
+    ValueError
+        If the name is already registered for another class.
+    """
+
+    def decorator(cls: _T) -> _T:
+        key = f"{cls.__module__}.{cls.__qualname__}" if name is None else name
+        if _CLASSES.get(key, cls) is not cls:
+            raise ValueError(f"{key!r} is already registered for {_CLASSES[key]}")
+        _CLASSES[key] = cls
+        _NAMES.setdefault(cls, key)
+        return cls
+
+    return decorator if cls is None else decorator(cls)
+
+
+def _register_module(module: Any, *bases: type) -> None:
+    for value in vars(module).values():
+        if (
+            isinstance(value, type)
+            and issubclass(value, bases)
+            and value.__module__ == module.__name__
+        ):
+            register(value, name=value.__name__)
+
+
+_register_module(bet, Bet)
+_register_module(rules, rules.AbstractRules)
+for _module in (tools, single_bet, odds, examples):
+    _register_module(_module, tools._RecordsArguments, enum.Enum)
+
+
+def _class_name(cls: type) -> str:
+    if cls in _NAMES:
+        return _NAMES[cls]
+    if "<locals>" in cls.__qualname__:
+        raise TypeError(f"Cannot serialize local class {cls.__qualname__}")
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def _class(name: str, allow_import: bool) -> type:
+    if name in _CLASSES:
+        return _CLASSES[name]
+    if allow_import and ":" in name:
+        module_name, _, qualname = name.partition(":")
+        value: Any = importlib.import_module(module_name)
+        for part in qualname.split("."):
+            value = getattr(value, part)
+        if isinstance(value, type):
+            return value
+    raise ValueError(f"Unknown class {name!r}; register it to decode it by name")
+
+
+def _bind(
+    cls: type, args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> tuple[tuple[Any, ...], dict[str, Any]]:
+    """Normalize constructor arguments: keyword arguments that can be given by
+    position are moved to ``args``, and omitted arguments are filled with their
+    defaults."""
+    try:
+        bound = inspect.signature(cls.__init__).bind(None, *args, **kwargs)
+    except (TypeError, ValueError):
+        return args, kwargs
+    bound.apply_defaults()
+    return bound.args[1:], bound.kwargs
+
+
+def _arguments(value: Any) -> tuple[tuple[Any, ...], dict[str, Any]]:
+    if isinstance(value, tools._RecordsArguments):
+        args, kwargs = _bind(type(value), *value._arguments)
+        if type(value) is AggregateStrategy:
+            flat: list[Any] = []
+            for strategy in args:
+                if type(strategy) is AggregateStrategy:
+                    flat.extend(_arguments(strategy)[0])
+                else:
+                    flat.append(strategy)
+            args = tuple(flat)
+        return args, kwargs
+    if isinstance(value, Bet):
+        parameters = list(inspect.signature(type(value).__init__).parameters)
+        try:
+            return (), {name: getattr(value, name) for name in parameters[1:]}
+        except AttributeError:
+            raise TypeError(f"Cannot serialize bet {value!r}") from None
+    if getattr(value, "__dict__", None) == {}:
+        return (), {}
+    raise TypeError(f"Cannot serialize {value!r}")
+
+
+def encode(value: Any) -> Any:
+    """Return the canonical JSON-compatible form of a configuration value.
+
+    Parameters
+    ----------
+    value
+        A strategy, bet, bet type, rule set, enum member, or a number, string,
+        None, or (possibly nested) list, tuple, set, or dict of these.
+
+    Returns
+    -------
+    The value as nested JSON-compatible dicts, lists, and scalars.
+
+    Raises
+    ------
+    TypeError
+        If the value (or a part of it) cannot be serialized, e.g. a function.
+    """
+    if value is None or isinstance(value, (bool, str)):
+        return value
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    if isinstance(value, (float, np.floating)):
+        value = float(value)
+        if not math.isfinite(value):
+            return {"float": repr(value)}
+        return int(value) if value.is_integer() else value
+    if isinstance(value, list):
+        return [encode(item) for item in value]
+    if isinstance(value, tuple):
+        return {"tuple": [encode(item) for item in value]}
+    if isinstance(value, (set, frozenset)):
+        items = [encode(item) for item in value]
+        return {"set": sorted(items, key=canonical_json)}
+    if isinstance(value, dict):
+        return {"dict": [[encode(k), encode(v)] for k, v in value.items()]}
+    if isinstance(value, enum.Enum):
+        return {"enum": _class_name(type(value)), "member": value.name}
+    if isinstance(value, type):
+        return {"type": _class_name(value)}
+    if callable(value) and not isinstance(value, tools._Key):
+        raise TypeError(f"Cannot serialize function {value!r}")
+    args, kwargs = _arguments(value)
+    node: dict[str, Any] = {"object": _class_name(type(value))}
+    if args:
+        node["args"] = [encode(arg) for arg in args]
+    if kwargs:
+        node["kwargs"] = {name: encode(arg) for name, arg in kwargs.items()}
+    return node
+
+
+def decode(data: Any, *, allow_import: bool = False) -> Any:
+    """Rebuild a value from the form returned by :func:`encode`.
+
+    Parameters
+    ----------
+    data
+        The encoded value.
+    allow_import
+        Whether classes that are not registered may be imported by path.
+
+    Returns
+    -------
+    The decoded value, with objects constructed from their arguments.
+
+    Raises
+    ------
+    ValueError
+        If a class is unknown or the data is malformed.
+    """
+
+    def _decode(data: Any) -> Any:
+        return decode(data, allow_import=allow_import)
+
+    if isinstance(data, list):
+        return [_decode(item) for item in data]
+    if not isinstance(data, dict):
+        return data
+    if "float" in data:
+        return float(data["float"])
+    if "tuple" in data:
+        return tuple(_decode(item) for item in data["tuple"])
+    if "set" in data:
+        return {_decode(item) for item in data["set"]}
+    if "dict" in data:
+        return {_decode(k): _decode(v) for k, v in data["dict"]}
+    if "enum" in data:
+        return _class(data["enum"], allow_import)[data["member"]]
+    if "type" in data:
+        return _class(data["type"], allow_import)
+    if "object" in data:
+        cls = _class(data["object"], allow_import)
+        args = [_decode(arg) for arg in data.get("args", [])]
+        kwargs = {k: _decode(v) for k, v in data.get("kwargs", {}).items()}
+        return cls(*args, **kwargs)
+    raise ValueError(f"Malformed serialized value: {data!r}")
+
+
+def canonical_json(data: Any) -> str:
+    """Return the canonical JSON text of already encoded data (sorted keys, no
+    whitespace)."""
+    return json.dumps(data, sort_keys=True, separators=(",", ":"), allow_nan=False)
+
+
+def to_dict(strategy: Strategy) -> dict[str, Any]:
+    """Return the canonical, versioned form of ``strategy``.
+
+    Raises
+    ------
+    TypeError
+        If the strategy cannot be serialized.
+    """
+    return {"format": FORMAT_VERSION, "strategy": encode(strategy)}
+
+
+def from_dict(data: dict[str, Any], *, allow_import: bool = False) -> Strategy:
+    """Rebuild a strategy from the form returned by :func:`to_dict`.
+
+    Raises
+    ------
+    ValueError
+        If the format version is unsupported or a class is unknown.
+    """
+    if data.get("format") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported strategy format: {data.get('format')!r}")
+    return decode(data["strategy"], allow_import=allow_import)
+
+
+def to_json(strategy: Strategy) -> str:
+    """Return the canonical JSON text of ``strategy``."""
+    return canonical_json(to_dict(strategy))
+
+
+def from_json(text: str, *, allow_import: bool = False) -> Strategy:
+    """Rebuild a strategy from the text returned by :func:`to_json`."""
+    return from_dict(json.loads(text), allow_import=allow_import)
+
+
+def strategy_hash(strategy: Strategy) -> str:
+    """Return a stable hash of ``strategy``'s configuration (SHA-256 hex digest)."""
+    return hashlib.sha256(to_json(strategy).encode()).hexdigest()
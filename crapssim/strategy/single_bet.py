@@ -40,6 +40,7 @@ from crapssim.strategy.tools import (
     RemoveIfPointOff,
     RemoveIfTrue,
     Strategy,
+    _IsPlaceOnNumber,
 )
 
 __all__ = [
@@ -249,9 +250,7 @@ class BetPlace(Strategy):
             The player to check and see if they have the given bet.
         """
         point = player.table.point.number
-        RemoveIfTrue(
-            lambda b, p: isinstance(b, Place) and b.number == point
-        ).update_bets(player)
+        RemoveIfTrue(_IsPlaceOnNumber(point)).update_bets(player)
 
     def __repr__(self) -> str:
         return (
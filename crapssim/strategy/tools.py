@@ -4,7 +4,7 @@ to be used as building blocks when creating strategies."""
 
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
-from typing import Callable, Protocol, SupportsFloat
+from typing import Any, Callable, Protocol, SupportsFloat
 
 from crapssim.bet import Bet, HardWay, Hop, Place, TableSettings
 from crapssim.dice import Dice
@@ -68,7 +68,127 @@ class Player(Protocol):
         ...
 
 
-class Strategy(ABC):
+class _RecordsArguments:
+    """Base for objects that remember the arguments they were constructed with.
+
+    The arguments are used by :mod:`crapssim.strategy.serialize` to describe an object
+    by how it was created, rather than by its internal state.
+    """
+
+    _arguments: tuple[tuple[Any, ...], dict[str, Any]]
+
+    def __new__(cls, *args: Any, **kwargs: Any):
+        self = super().__new__(cls)
+        self._arguments = (args, kwargs)
+        return self
+
+
+class _Key(_RecordsArguments):
+    """Base for the keys used by the bundled :class:`AddIfTrue` and :class:`RemoveIfTrue`
+    strategies.
+
+    Unlike lambdas, keys are plain objects, so strategies using them can be pickled
+    (e.g. to send to another process) and have a stable repr and equality.
+    """
+
+    def _fields(self) -> dict[str, Any]:
+        return {k: v for k, v in vars(self).items() if k != "_arguments"}
+
+    def __eq__(self, other: object) -> bool:
+        if type(self) is not type(other):
+            return False
+        assert isinstance(other, _Key)
+        return self._fields() == other._fields()
+
+    def __hash__(self) -> int:
+        return hash((type(self), repr(self)))
+
+    def __repr__(self) -> str:
+        args = ", ".join(f"{name}={value!r}" for name, value in self._fields().items())
+        return f"{self.__class__.__name__}({args})"
+
+
+class _BetNotPlaced(_Key):
+    """Player key that is True if ``bet`` is not on the player's layout."""
+
+    def __init__(self, bet: Bet) -> None:
+        self.bet = bet
+
+    def __call__(self, player: "Player") -> bool:
+        return self.bet not in player.bets
+
+
+class _PointStatusBetNotPlaced(_Key):
+    """Player key that is True if the point has the given status ("On" or "Off") and
+    ``bet`` is not on the player's layout."""
+
+    def __init__(self, status: str, bet: Bet) -> None:
+        self.status = status
+        self.bet = bet
+
+    def __call__(self, player: "Player") -> bool:
+        return player.table.point.status == self.status and self.bet not in player.bets
+
+
+class _NewShooterBetNotPlaced(_Key):
+    """Player key that is True for a new shooter if ``bet`` is not on the player's
+    layout."""
+
+    def __init__(self, bet: Bet) -> None:
+        self.bet = bet
+
+    def __call__(self, player: "Player") -> bool:
+        return player.table.new_shooter and self.bet not in player.bets
+
+
+class _IsBetType(_Key):
+    """Bet key that is True for bets of the given type(s)."""
+
+    def __init__(self, bet_type: type[Bet] | tuple[type[Bet], ...]) -> None:
+        self.bet_type = bet_type
+
+    def __call__(self, bet: Bet, player: "Player") -> bool:
+        return isinstance(bet, self.bet_type)
+
+
+class _IsPlaceOnNumber(_Key):
+    """Bet key that is True for Place bets on the given number."""
+
+    def __init__(self, number: int | None) -> None:
+        self.number = number
+
+    def __call__(self, bet: Bet, player: "Player") -> bool:
+        return isinstance(bet, Place) and bet.number == self.number
+
+
+class _MatchesBetPointOff(_Key):
+    """Bet key that is True for bets matching ``bet`` while the point is Off.
+
+    Bets match on type, and also on number for Place and HardWay bets, or on
+    result for Hop bets. Bet amounts are not considered."""
+
+    def __init__(self, bet: Bet) -> None:
+        self.bet_type: type[Bet]
+        self.attribute: str | None = None
+        self.value: object = None
+        if isinstance(bet, Place):
+            self.bet_type, self.attribute, self.value = Place, "number", bet.number
+        elif isinstance(bet, HardWay):
+            self.bet_type, self.attribute, self.value = HardWay, "number", bet.number
+        elif isinstance(bet, Hop):
+            self.bet_type, self.attribute, self.value = Hop, "result", bet.result
+        else:
+            self.bet_type = type(bet)
+
+    def __call__(self, bet: Bet, player: "Player") -> bool:
+        return (
+            isinstance(bet, self.bet_type)
+            and (self.attribute is None or getattr(bet, self.attribute) == self.value)
+            and player.table.point.status == "Off"
+        )
+
+
+class Strategy(_RecordsArguments, ABC):
     """A Strategy is assigned to a player and determines what bets the player
     is going to make, remove, or change.
     """
@@ -107,6 +227,40 @@ class Strategy(ABC):
         and the table is updated. It triggers in :py:meth:`.table.TableUpdate.run_strategies`.
         """
 
+    def reset(self) -> None:
+        """
+        Restore any state the Strategy tracks between rolls to its initial value.
+
+        This is called by :meth:`~crapssim.table.Player.reset` so the same Strategy
+        object can be reused across sessions. Strategies that keep counters or
+        progressions (for example :class:`WinProgression`) override this, while
+        stateless strategies have nothing to do.
+        """
+
+    def snapshot(self) -> Any:
+        """
+        Return a copy of any state the Strategy tracks between rolls.
+
+        Used by :meth:`~crapssim.table.Table.snapshot`. Strategies that override
+        :meth:`reset` should also override this and :meth:`restore`. The returned
+        value must not be mutated by the Strategy afterwards.
+
+        Returns
+        -------
+        The Strategy's state, or None for a stateless Strategy.
+        """
+        return None
+
+    def restore(self, state: Any) -> None:
+        """
+        Restore state previously returned by :meth:`snapshot`.
+
+        Parameters
+        ----------
+        state
+            The value returned by :meth:`snapshot`.
+        """
+
     def __add__(self, other: "Strategy") -> "AggregateStrategy":
         return AggregateStrategy(self, other)
 
@@ -149,6 +303,20 @@ class AggregateStrategy(Strategy):
             if not strategy.completed(player):
                 strategy.after_roll(player)
 
+    def reset(self) -> None:
+        """Reset each of the combined strategies."""
+        for strategy in self.strategies:
+            strategy.reset()
+
+    def snapshot(self) -> tuple[Any, ...]:
+        """Return the state of each of the combined strategies."""
+        return tuple(strategy.snapshot() for strategy in self.strategies)
+
+    def restore(self, state: tuple[Any, ...]) -> None:
+        """Restore the state of each of the combined strategies."""
+        for strategy, strategy_state in zip(self.strategies, state):
+            strategy.restore(strategy_state)
+
     def update_bets(self, player: Player) -> None:
         """Go through each of the strategies and run its update_bets method if the strategy has
         not been completed.
@@ -354,7 +522,7 @@ class AddIfNotBet(AddIfTrue):
         bet
             The bet to add if it isn't already on the table.
         """
-        super().__init__(bet, lambda p: bet not in p.bets)
+        super().__init__(bet, _BetNotPlaced(bet))
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(bet={self.bet})"
@@ -374,9 +542,7 @@ class AddIfPointOff(AddIfTrue):
         bet
             The bet to add if the point is Off.
         """
-        super().__init__(
-            bet, lambda p: p.table.point.status == "Off" and bet not in p.bets
-        )
+        super().__init__(bet, _PointStatusBetNotPlaced("Off", bet))
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(bet={self.bet})"
@@ -395,9 +561,7 @@ class AddIfPointOn(AddIfTrue):
         bet
             The bet to add if the point is On.
         """
-        super().__init__(
-            bet, lambda p: p.table.point.status == "On" and bet not in p.bets
-        )
+        super().__init__(bet, _PointStatusBetNotPlaced("On", bet))
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(bet={self.bet})"
@@ -417,7 +581,7 @@ class AddIfNewShooter(AddIfTrue):
         bet
             The bet to add if the point is On.
         """
-        super().__init__(bet, lambda p: p.table.new_shooter and bet not in p.bets)
+        super().__init__(bet, _NewShooterBetNotPlaced(bet))
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(bet={self.bet})"
@@ -474,33 +638,7 @@ class RemoveIfPointOff(RemoveIfTrue):
             bet: Bet instance describing which wagers to remove when the point is off.
         """
         self.bet = bet
-        key: Callable[[Bet, Player], bool]
-        if isinstance(bet, Place):
-            number = bet.number
-            key = (
-                lambda b, p: isinstance(b, Place)
-                and b.number == number
-                and p.table.point.status == "Off"
-            )
-        elif isinstance(bet, HardWay):
-            number = bet.number
-            key = (
-                lambda b, p: isinstance(b, HardWay)
-                and b.number == number
-                and p.table.point.status == "Off"
-            )
-        elif isinstance(bet, Hop):
-            result = bet.result
-            key = (
-                lambda b, p: isinstance(b, Hop)
-                and b.result == result
-                and p.table.point.status == "Off"
-            )
-        else:
-            bet_type = type(bet)
-            key = lambda b, p: isinstance(b, bet_type) and p.table.point.status == "Off"
-
-        super().__init__(key)
+        super().__init__(_MatchesBetPointOff(bet))
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(bet={self.bet})"
@@ -511,7 +649,7 @@ class RemoveByType(RemoveIfTrue):
 
     def __init__(self, bet_type: type[Bet] | tuple[type[Bet], ...]) -> None:
         """Remove all bets matching ``bet_type``."""
-        super().__init__(lambda b, p: isinstance(b, bet_type))
+        super().__init__(_IsBetType(bet_type))
 
 
 class WinProgression(Strategy):
@@ -534,6 +672,18 @@ class WinProgression(Strategy):
         if hasattr(self.bet, "always_working") and self.bet.always_working is None:
             self.bet.always_working = True
 
+    def reset(self) -> None:
+        """Restart the progression at the first multiplier."""
+        self.current_progression = 0
+
+    def snapshot(self) -> int:
+        """Return the current position in the progression."""
+        return self.current_progression
+
+    def restore(self, state: int) -> None:
+        """Restore the position in the progression."""
+        self.current_progression = state
+
     def completed(self, player: Player) -> bool:
         """Return True when bankroll is below minimum multiplier and no bets remain."""
         return (
@@ -644,6 +794,19 @@ class PlaceHitProgression(Strategy):
         self.hit_count: int = 0
         self._seven_out: bool = False
 
+    def reset(self) -> None:
+        """Restart the progression at ``stages[0]``."""
+        self.hit_count = 0
+        self._seven_out = False
+
+    def snapshot(self) -> tuple[int, bool]:
+        """Return the hit count and pending seven-out flag."""
+        return self.hit_count, self._seven_out
+
+    def restore(self, state: tuple[int, bool]) -> None:
+        """Restore the hit count and pending seven-out flag."""
+        self.hit_count, self._seven_out = state
+
     def _target(self) -> dict[int, float]:
         """Return the board that should be working at the current hit count."""
         index = min(self.hit_count, len(self.stages) - 1)
@@ -1,16 +1,31 @@
 """Table and player runtime state for craps simulations."""
 
 import copy
-from typing import Generator, Iterable, Literal, SupportsFloat, TypedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Generator, Iterable, Literal, SupportsFloat, TypedDict
 
-from crapssim.dice import Dice, DicePair
+from crapssim.dice import Dice, DicePair, TiltedDice
 
 from .bet import Bet, BetResult
 from .point import Point
+from .recorder import TrajectoryRecorder
 from .rules import ClassicRules, Rules
 from .strategy import BetPassLine, Strategy
 
-__all__ = ["TableUpdate", "TableSettings", "Table", "Player"]
+_PICKLE_VERSION = 1
+"""Version of the serialized form returned by ``Table.__getstate__`` and
+``Player.__getstate__``."""
+
+__all__ = [
+    "TableUpdate",
+    "TableSettings",
+    "TableSnapshot",
+    "PlayerSnapshot",
+    "RollRecord",
+    "ROLL_FIELDS",
+    "Table",
+    "Player",
+]
 
 
 class TableUpdate:
@@ -43,6 +58,7 @@ class TableUpdate:
         self.update_bets(table, verbose)
         self.set_new_shooter(table)
         self.update_numbers(table, verbose)
+        self.record(table)
 
     @staticmethod
     def run_strategies(
@@ -167,6 +183,12 @@ class TableUpdate:
         if verbose:
             print(f"Point is {table.point.status} ({table.point.number})")
 
+    @staticmethod
+    def record(table: "Table") -> None:
+        """Pass the state after the roll to the table's recorder, if any."""
+        if table.recorder is not None:
+            table.recorder.record(table)
+
 
 class TableSettings(TypedDict, total=False):
     """Simulation and payout policy toggles.
@@ -190,6 +212,89 @@ class TableSettings(TypedDict, total=False):
     come_out_working_policy: Literal["legacy", "real_casino"]
 
 
+@dataclass(slots=True, frozen=True)
+class PlayerSnapshot:
+    """Point-in-time copy of a player's mutable state (see :meth:`Player.snapshot`)."""
+
+    bankroll: float
+    """Bankroll at the time of the snapshot."""
+    bets: tuple[Bet, ...]
+    """Copies of the bets on the layout, in layout order."""
+    strategy_state: Any
+    """State returned by the strategy's :meth:`~crapssim.strategy.tools.Strategy.snapshot`."""
+    wagered: float = 0.0
+    """Amount wagered on decided bets at the time of the snapshot."""
+    by_type: tuple[dict[str, float], ...] = ()
+    """Copies of :attr:`Player.action`, :attr:`Player.net_by_type`, and
+    :attr:`Player.expected_by_type`."""
+
+
+@dataclass(slots=True, frozen=True)
+class TableSnapshot:
+    """Point-in-time copy of a table's mutable state (see :meth:`Table.snapshot`).
+
+    Only the state that changes while the table runs is captured: the random
+    number generator state, dice and point, table counters, and each player's
+    bankroll, bets, and strategy state. Configuration such as the rules,
+    settings, and the strategies themselves is shared with the table.
+    """
+
+    rng_state: dict[str, Any]
+    """State of the dice's numpy bit generator."""
+    n_rolls: int
+    """Number of rolls made by the dice."""
+    dice_result: DicePair | None
+    """Most recent dice outcome."""
+    point: int | None
+    """Point number, or None when the point is off."""
+    pass_rolls: int
+    """Rolls since the point last resolved."""
+    last_roll: int | None
+    """Total of the most recent roll."""
+    n_shooters: int
+    """Number of shooters so far."""
+    new_shooter: bool
+    """Whether the next roll starts a new shooter."""
+    players: tuple[PlayerSnapshot, ...]
+    """Snapshot of each seated player, in seating order."""
+    dice_log_weight: float = 0.0
+    """Log likelihood ratio of :class:`~crapssim.dice.TiltedDice`, or 0."""
+
+
+ROLL_FIELDS: tuple[str, ...] = (
+    "dice",
+    "point_before",
+    "point_after",
+    "shooter",
+    "bankrolls",
+    "bet_totals",
+)
+"""Optional fields of :class:`RollRecord` that :meth:`Table.iter_run` can fill in."""
+
+
+@dataclass(slots=True, frozen=True)
+class RollRecord:
+    """Per-roll state yielded by :meth:`Table.iter_run`.
+
+    Fields that were not requested from :meth:`Table.iter_run` are None.
+    """
+
+    roll: int
+    """Number of rolls made by the dice, including this one."""
+    dice: DicePair | None = None
+    """Dice outcome of the roll."""
+    point_before: int | None = None
+    """Point number before the roll, or None when the point was off."""
+    point_after: int | None = None
+    """Point number after the roll, or None when the point is off."""
+    shooter: int | None = None
+    """Number of the shooter who made the roll."""
+    bankrolls: tuple[float, ...] | None = None
+    """Bankroll of each player after the roll, in seating order."""
+    bet_totals: tuple[float, ...] | None = None
+    """Amount each player has on the layout after the roll, in seating order."""
+
+
 class Table:
     """Runtime state for a craps table simulation."""
 
@@ -221,6 +326,100 @@ class Table:
         self.last_roll: int | None = None
         self.n_shooters: int = 1
         self.new_shooter: bool = True
+        self.recorder: TrajectoryRecorder | None = None
+        """Optional recorder of per-roll state (see :mod:`crapssim.recorder`)."""
+
+    def reset(self, seed: int | None = None) -> None:
+        """Restore the table to its freshly constructed state, in place.
+
+        The dice are re-seeded, the point is turned off, the roll and shooter
+        counters are cleared, and every seated player is reset to their starting
+        bankroll with no bets (see :meth:`Player.reset`). The players, rules, and
+        settings are kept, so the same objects can be reused across many
+        sessions instead of building a new table for each one. An attached
+        recorder starts a new session.
+
+        Args:
+            seed: Optional random seed passed to Dice for reproducible runs.
+        """
+        self.seed = seed
+        self.dice.reset(seed)
+        self.point.number = None
+        self.pass_rolls = 0
+        self.last_roll = None
+        self.n_shooters = 1
+        self.new_shooter = True
+        for player in self.players:
+            player.reset()
+        if self.recorder is not None:
+            self.recorder.new_session()
+
+    def snapshot(self) -> TableSnapshot:
+        """Capture the table's current state so it can be restored later.
+
+        Restoring the snapshot (see :meth:`restore`) rewinds the dice, point,
+        counters, bankrolls, bets, and strategy state, so the table replays the
+        same future dice. This allows branching "what-if" analysis from a
+        decision point without deep-copying the table.
+
+        Returns:
+            TableSnapshot: The captured state.
+        """
+        result = self.dice._result
+        return TableSnapshot(
+            rng_state=self.dice.rng.bit_generator.state,
+            n_rolls=self.dice.n_rolls,
+            dice_result=tuple(result) if result is not None else None,
+            point=self.point.number,
+            pass_rolls=self.pass_rolls,
+            last_roll=self.last_roll,
+            n_shooters=self.n_shooters,
+            new_shooter=self.new_shooter,
+            players=tuple(player.snapshot() for player in self.players),
+            dice_log_weight=getattr(self.dice, "log_weight", 0.0),
+        )
+
+    def restore(self, snapshot: TableSnapshot) -> None:
+        """Return the table to the state captured by :meth:`snapshot`.
+
+        The same snapshot can be restored any number of times.
+
+        Args:
+            snapshot: A snapshot taken from this table (or one seated with
+                the same number of players and the same strategies).
+
+        Raises:
+            ValueError: If the snapshot has a different number of players.
+        """
+        if len(snapshot.players) != len(self.players):
+            raise ValueError(
+                f"Snapshot has {len(snapshot.players)} players, "
+                f"table has {len(self.players)}"
+            )
+        self.dice.rng.bit_generator.state = snapshot.rng_state
+        self.dice.n_rolls = snapshot.n_rolls
+        self.dice._result = snapshot.dice_result
+        if isinstance(self.dice, TiltedDice):
+            self.dice.log_weight = snapshot.dice_log_weight
+        self.point.number = snapshot.point
+        self.pass_rolls = snapshot.pass_rolls
+        self.last_roll = snapshot.last_roll
+        self.n_shooters = snapshot.n_shooters
+        self.new_shooter = snapshot.new_shooter
+        for player, player_snapshot in zip(self.players, snapshot.players):
+            player.restore(player_snapshot)
+
+    def __getstate__(self) -> tuple[int, dict[str, Any]]:
+        return _PICKLE_VERSION, self.__dict__.copy()
+
+    def __setstate__(self, state: tuple[int, dict[str, Any]]) -> None:
+        version, attributes = state
+        if version != _PICKLE_VERSION:
+            raise ValueError(f"Unsupported Table pickle version: {version}")
+        self.__dict__.update(attributes)
+        # Players are pickled without their table, so re-seat them here
+        for player in self.players:
+            player._table = self
 
     def yield_player_bets(self) -> Generator[tuple["Player", "Bet"], None, None]:
         """Yield `(player, bet)` pairs for all active bets on the table."""
@@ -288,6 +487,61 @@ class Table:
         Returns:
             None: Always returns ``None``.
         """
+        for _ in self.iter_run(max_rolls, max_shooter, verbose, runout, fields=()):
+            pass
+
+    def iter_run(
+        self,
+        max_rolls: float | int,
+        max_shooter: float | int = float("inf"),
+        verbose: bool = False,
+        runout: bool = False,
+        fields: Iterable[str] | None = None,
+    ) -> Generator[RollRecord, None, None]:
+        """Simulate the table like :meth:`run`, yielding a record after each roll.
+
+        The simulation advances lazily, one roll per record, so trajectories can
+        be streamed, filtered, or downsampled without building lists. Only the
+        requested ``fields`` are computed; the others are left as None, so asking
+        for a few fields (or none) costs little over :meth:`run`. If the caller
+        stops iterating early, the table stays at the last roll and can keep
+        running.
+
+        Args:
+            max_rolls: Maximum number of rolls to process.
+            max_shooter: Maximum number of shooters to process.
+            verbose: If True, print updates during execution.
+            runout: If True, continue resolving remaining bets after hitting limits.
+            fields: Names of the :class:`RollRecord` fields to fill in (see
+                :data:`ROLL_FIELDS`); defaults to all of them.
+
+        Returns:
+            Generator[RollRecord, None, None]: One record per roll.
+
+        Raises:
+            ValueError: If ``fields`` contains an unknown field name.
+        """
+        wanted = ROLL_FIELDS if fields is None else tuple(fields)
+        unknown = set(wanted) - set(ROLL_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown roll record fields: {sorted(unknown)}")
+        return self._iter_run(max_rolls, max_shooter, verbose, runout, set(wanted))
+
+    def _iter_run(
+        self,
+        max_rolls: float | int,
+        max_shooter: float | int,
+        verbose: bool,
+        runout: bool,
+        wanted: set[str],
+    ) -> Generator[RollRecord, None, None]:
+        """Generator behind :meth:`iter_run`, after its arguments are checked."""
+        want_dice = "dice" in wanted
+        want_point_before = "point_before" in wanted
+        want_point_after = "point_after" in wanted
+        want_shooter = "shooter" in wanted
+        want_bankrolls = "bankrolls" in wanted
+        want_bet_totals = "bet_totals" in wanted
 
         self._setup_run(verbose)
         n_rolls_start = self.dice.n_rolls
@@ -297,6 +551,8 @@ class Table:
         run_complete = False
         continue_rolling = True
         while continue_rolling:
+            point_before = self.point.number
+            shooter = self.n_shooters
             TableUpdate().run(self, run_complete=run_complete, verbose=verbose)
 
             run_complete = self.is_run_complete(
@@ -307,6 +563,22 @@ class Table:
                 self.n_shooters -= 1  # count was added but this shooter never rolled
                 TableUpdate().print_player_summary(self, verbose=verbose)
 
+            yield RollRecord(
+                roll=self.dice.n_rolls,
+                dice=self.dice.result if want_dice else None,
+                point_before=point_before if want_point_before else None,
+                point_after=self.point.number if want_point_after else None,
+                shooter=shooter if want_shooter else None,
+                bankrolls=(
+                    tuple(p.bankroll for p in self.players) if want_bankrolls else None
+                ),
+                bet_totals=(
+                    tuple(p.total_bet_amount for p in self.players)
+                    if want_bet_totals
+                    else None
+                ),
+            )
+
     def fixed_run(
         self, dice_outcomes: Iterable[DicePair], verbose: bool = False
     ) -> None:
@@ -394,6 +666,106 @@ class Player:
         self.name: str = name
         self.bets: list[Bet] = []
         self._table: Table = table
+        self._starting_bankroll: float = self.bankroll
+        self.wagered: float = 0.0
+        """Total amount of the bets that won or lost (the player's action)."""
+        self.record_by_type: bool = False
+        """If True, :attr:`action` and :attr:`net_by_type` are kept up to date
+        for every bet settled. Off by default, to keep the bookkeeping off the
+        main path; batch sessions (see :func:`crapssim.batch.run_session`) turn
+        it on."""
+        self.action: dict[str, float] = {}
+        """Amount of the bets that won or lost, by bet type (class name), when
+        :attr:`record_by_type` is set."""
+        self.net_by_type: dict[str, float] = {}
+        """Net win of the bets' decisions (see :attr:`~crapssim.bet.BetResult.net`),
+        by bet type, when :attr:`record_by_type` is set."""
+        self.roll_model: Callable[[Bet, Table], float] | None = None
+        """Optional exact expected :attr:`~crapssim.bet.BetResult.net` of a bet
+        on the coming roll (see :class:`crapssim.analysis.RollModel`). When
+        set, it is added up in :attr:`expected_by_type` for every bet settled."""
+        self.expected_by_type: dict[str, float] = {}
+        """Sum of :attr:`roll_model` over the bets settled, by bet type. Minus
+        :attr:`net_by_type`, it has mean zero, whatever the strategy, which
+        makes it a control variate of the player's net win."""
+
+    def reset(self, bankroll: SupportsFloat | None = None) -> None:
+        """Restore the player to the start of a session, in place.
+
+        Clears all bets and the :attr:`wagered` total, restores the bankroll,
+        and resets the strategy's internal state (see
+        :meth:`~crapssim.strategy.tools.Strategy.reset`).
+
+        Args:
+            bankroll: Bankroll to start the session with. Defaults to the
+                bankroll the player was created with.
+        """
+        if bankroll is None:
+            self.bankroll = self._starting_bankroll
+        else:
+            self.bankroll = float(bankroll)
+        self.wagered = 0.0
+        self.action.clear()
+        self.net_by_type.clear()
+        self.expected_by_type.clear()
+        self.bets.clear()
+        if self.strategy is not None:
+            self.strategy.reset()
+
+    def snapshot(self) -> PlayerSnapshot:
+        """Capture the player's bankroll, bets, and strategy state.
+
+        Returns:
+            PlayerSnapshot: The captured state.
+        """
+        return PlayerSnapshot(
+            bankroll=self.bankroll,
+            bets=tuple(copy.copy(bet) for bet in self.bets),
+            strategy_state=(
+                self.strategy.snapshot() if self.strategy is not None else None
+            ),
+            wagered=self.wagered,
+            by_type=(
+                dict(self.action),
+                dict(self.net_by_type),
+                dict(self.expected_by_type),
+            ),
+        )
+
+    def restore(self, snapshot: PlayerSnapshot) -> None:
+        """Return the player to the state captured by :meth:`snapshot`.
+
+        Args:
+            snapshot: A snapshot taken from this player.
+        """
+        self.bankroll = snapshot.bankroll
+        self.wagered = snapshot.wagered
+        action, net, expected = snapshot.by_type or ({}, {}, {})
+        self.action, self.net_by_type = dict(action), dict(net)
+        self.expected_by_type = dict(expected)
+        self.bets[:] = [copy.copy(bet) for bet in snapshot.bets]
+        if self.strategy is not None:
+            self.strategy.restore(snapshot.strategy_state)
+
+    def __getstate__(self) -> tuple[int, dict[str, Any]]:
+        # Drop the back-reference to the table: a table re-seats its players when
+        # it is unpickled, while a player pickled on its own is detached.
+        attributes = self.__dict__.copy()
+        del attributes["_table"]
+        return _PICKLE_VERSION, attributes
+
+    def __setstate__(self, state: tuple[int, dict[str, Any]]) -> None:
+        version, attributes = state
+        if version != _PICKLE_VERSION:
+            raise ValueError(f"Unsupported Player pickle version: {version}")
+        self.__dict__.update(attributes)
+        self._table = None
+
+    def __copy__(self) -> "Player":
+        # Keep the table for shallow copies, which would otherwise be detached
+        new_player = self.__class__.__new__(self.__class__)
+        new_player.__dict__.update(self.__dict__)
+        return new_player
 
     @property
     def total_bet_amount(self) -> float:
@@ -496,12 +868,32 @@ class Player:
     def update_bet(self, verbose: bool = False) -> None:
         """Resolve outstanding bets against the latest roll.
 
+        The amount of every bet that wins or loses is added to
+        :attr:`wagered` and, if :attr:`record_by_type` is set, by bet type to
+        :attr:`action`, and its net win to :attr:`net_by_type`; pushes and bets
+        with no decision are not counted.
+
         Returns:
             None: Always returns ``None``.
         """
+        model = self.roll_model
+        by_type = self.record_by_type
         for bet in self.bets[:]:
+            if model is not None:
+                bet_type = type(bet).__name__
+                expected = self.expected_by_type
+                expected[bet_type] = expected.get(bet_type, 0.0) + model(
+                    bet, self.table
+                )
             result: BetResult = bet.get_result(self.table)
             self.bankroll += result.bankroll_change
+            if result.won or result.lost:
+                self.wagered += bet.amount
+                if by_type:
+                    bet_type = type(bet).__name__
+                    action, net = self.action, self.net_by_type
+                    action[bet_type] = action.get(bet_type, 0.0) + bet.amount
+                    net[bet_type] = net.get(bet_type, 0.0) + result.net
 
             if verbose:
                 self.print_bet_update(bet, result)
@@ -0,0 +1,11 @@
+"""
+Array engines that settle bets for many sessions at once. Dice outcomes come
+from tapes of shape ``(n_sessions, n_rolls, 2)``, which can be drawn to match
+the rolls of seeded :class:`~crapssim.dice.Dice`, and payouts are tabulated
+from the bets' own payout logic, so the engines agree with
+:class:`~crapssim.table.Table` roll for roll.
+"""
+
+from crapssim.vectorized.props import ONE_ROLL_BETS, PropPlan
+from crapssim.vectorized.table import TableBatch
+from crapssim.vectorized.tape import dice_tape, outcome_index
@@ -0,0 +1,162 @@
+"""Vectorized settlement of one-roll proposition bets."""
+
+import copy
+from typing import Any, Iterable, Mapping
+
+import numpy as np
+
+from crapssim.analysis.bets import DICE_OUTCOMES
+from crapssim.bet import (
+    Any7,
+    AnyCraps,
+    Bet,
+    Boxcars,
+    CAndE,
+    Field,
+    Hop,
+    Horn,
+    Three,
+    Two,
+    World,
+    Yo,
+)
+from crapssim.rules import Rules
+from crapssim.strategy.tools import AddIfNotBet, AggregateStrategy, Strategy
+from crapssim.table import Table
+from crapssim.vectorized.tape import outcome_index
+
+__all__ = ["ONE_ROLL_BETS", "PropPlan"]
+
+ONE_ROLL_BETS: tuple[type[Bet], ...] = (
+    Field,
+    Any7,
+    Two,
+    Three,
+    Yo,
+    Boxcars,
+    AnyCraps,
+    Horn,
+    World,
+    CAndE,
+    Hop,
+)
+"""Bets that settle on the roll after they are placed, whatever the point."""
+
+
+class PropPlan:
+    """One-roll bets placed, in order, before every roll.
+
+    The cash each bet returns on each of the 36 dice outcomes is tabulated
+    once by settling the bet on a real :class:`~crapssim.table.Table` with the
+    given rules and settings, so payouts (e.g. ``"field_payouts"`` and
+    ``"hop_payouts"``) are those of the object model. Settling a tape is then
+    a table lookup: :meth:`deltas` is a single gather for an unlimited
+    bankroll, and :meth:`bankrolls` adds the bankroll check of
+    :meth:`~crapssim.table.Player.add_bet`, vectorized across sessions.
+
+    The plan plays like :meth:`strategy`, which places each bet with
+    :class:`~crapssim.strategy.tools.AddIfNotBet`.
+
+    Args:
+        bets: One-roll bets (see :data:`ONE_ROLL_BETS`), in placement order.
+        rules: Table rules; defaults to ClassicRules.
+        settings: Overrides applied on top of the default table settings.
+
+    Raises:
+        TypeError: If a bet is not a one-roll bet.
+        ValueError: If two bets would be placed as one (e.g. two Field
+            bets), or a bet does not settle on every outcome.
+    """
+
+    def __init__(
+        self,
+        bets: Iterable[Bet],
+        rules: Rules | None = None,
+        settings: Mapping[str, Any] | None = None,
+    ) -> None:
+        self.bets: tuple[Bet, ...] = tuple(bets)
+        """Bets placed before every roll, in order."""
+        keys = set()
+        for bet in self.bets:
+            if not isinstance(bet, ONE_ROLL_BETS):
+                raise TypeError(f"{bet!r} is not a one-roll bet")
+            if bet._placed_key in keys:
+                raise ValueError(f"{bet!r} would be placed with an earlier bet")
+            keys.add(bet._placed_key)
+
+        table = Table(rules=rules)
+        table.settings.update(copy.deepcopy(dict(settings or {})))  # type: ignore[typeddict-item]
+        self.costs = np.array([bet.cost(table) for bet in self.bets], dtype=float)
+        """Cash needed to place each bet."""
+        self.returns = np.zeros((len(self.bets), len(DICE_OUTCOMES)))
+        """Cash each bet returns to the bankroll on each ordered outcome (see
+        :func:`~crapssim.vectorized.outcome_index`), 0 for a loss."""
+        for i, bet in enumerate(self.bets):
+            for j, outcome in enumerate(DICE_OUTCOMES):
+                table.dice.fixed_roll(outcome)
+                result = copy.copy(bet).get_result(table)  # type: ignore[arg-type]
+                if not result.remove:
+                    raise ValueError(f"{bet!r} does not settle on {outcome}")
+                self.returns[i, j] = result.bankroll_change
+        self.net = (self.returns - self.costs[:, np.newaxis]).sum(axis=0)
+        """Net win of the whole plan on each ordered outcome."""
+
+    def deltas(self, dice: np.ndarray) -> np.ndarray:
+        """Net win of every roll of a tape, with a bankroll that always covers
+        the bets.
+
+        Args:
+            dice: Dice faces, of shape ``(..., 2)``.
+
+        Returns:
+            np.ndarray: Net win of each roll, of shape ``dice.shape[:-1]``.
+        """
+        return self.net[outcome_index(dice)]
+
+    def bankrolls(self, dice: np.ndarray, bankroll: float | np.ndarray) -> np.ndarray:
+        """Bankroll after every roll of a tape, placing each bet only if the
+        bankroll left covers it, as :meth:`~crapssim.table.Player.add_bet`
+        does.
+
+        A bet that costs more than the bankroll while nothing is on the layout
+        is skipped even within ``add_bet``'s rounding tolerance, as
+        :class:`~crapssim.strategy.tools.AggregateStrategy` skips a completed
+        :class:`~crapssim.strategy.tools.AddIfNotBet`.
+
+        The arithmetic is done in the order of the object model (bets taken
+        from the bankroll in placement order, then returns added in the same
+        order), so the bankrolls match a table's to the last bit.
+
+        Args:
+            dice: Dice faces, of shape ``(n_sessions, n_rolls, 2)``.
+            bankroll: Starting bankroll, for all sessions or each session.
+
+        Returns:
+            np.ndarray: Bankroll after each roll, of shape
+            ``(n_sessions, n_rolls)``.
+        """
+        index = outcome_index(dice)
+        n_sessions, n_rolls = index.shape
+        current = np.broadcast_to(np.asarray(bankroll, dtype=float), n_sessions).copy()
+        result = np.empty((n_sessions, n_rolls))
+        placed = np.empty((len(self.bets), n_sessions), dtype=bool)
+        for roll in range(n_rolls):
+            empty = np.ones(n_sessions, dtype=bool)
+            for i, cost in enumerate(self.costs):
+                completed = empty & (cost > current)
+                placed[i] = ~completed & (cost <= current + 1e-9)
+                current[placed[i]] -= cost
+                empty &= ~placed[i]
+            outcome = index[:, roll]
+            for i, returns in enumerate(self.returns):
+                current[placed[i]] += returns[outcome[placed[i]]]
+            result[:, roll] = current
+        return result
+
+    def strategy(self) -> Strategy:
+        """Return the strategy the plan plays: every bet added, in order,
+        whenever it is not on the layout."""
+        return AggregateStrategy(*(AddIfNotBet(bet) for bet in self.bets))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self.bets)!r})"
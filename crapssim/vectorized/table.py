@@ -0,0 +1,737 @@
+"""Vectorized tables playing line bets with odds and box-number bets."""
+
+import copy
+from typing import Any, Mapping, SupportsFloat
+
+import numpy as np
+
+from crapssim.bet import CLASSIC_POINTS, Buy, Lay, Odds, Place, Put, _BoxNumberBet
+from crapssim.rules import Rules
+from crapssim.strategy.odds import (
+    ComeOddsMultiplier,
+    DontComeOddsMultiplier,
+    DontPassOddsMultiplier,
+    MultiplierDict,
+    PassLineOddsMultiplier,
+    _expand_multiplier_dict,
+)
+from crapssim.strategy.single_bet import (
+    BetBuy,
+    BetCome,
+    BetDontCome,
+    BetDontPass,
+    BetLay,
+    BetPassLine,
+    BetPlace,
+    BetPut,
+    StrategyMode,
+)
+from crapssim.strategy.tools import AggregateStrategy, Strategy
+from crapssim.table import Table
+
+__all__ = ["TableBatch"]
+
+_BOXES = 13
+"""Length of the arrays indexed by dice total."""
+
+_UNPLACED = np.iinfo(np.int64).max
+"""Placement order of an empty slot, after every placed bet."""
+
+_LAYOUT = (
+    "pass_line",
+    "dont_pass",
+    "pass_line_odds",
+    "dont_pass_odds",
+    "come",
+    "dont_come",
+    "come_odds",
+    "dont_come_odds",
+    "place",
+    "buy",
+    "lay",
+    "put",
+)
+"""Bet arrays of a table's layout."""
+
+_LIGHT_RATIOS = np.array([Odds.light_ratios.get(n, 0.0) for n in range(_BOXES)])
+_DARK_RATIOS = np.array([Odds.dark_ratios.get(n, 0.0) for n in range(_BOXES)])
+
+
+def _mask(numbers) -> np.ndarray:
+    """Boolean array indexed by dice total, True for ``numbers``."""
+    mask = np.zeros(_BOXES, dtype=bool)
+    mask[list(numbers)] = True
+    return mask
+
+
+class _OddsPlan:
+    """Amount and table limit of the odds a multiplier strategy lays behind a
+    base bet of ``base`` on each number."""
+
+    def __init__(
+        self,
+        multiplier: MultiplierDict,
+        base: float,
+        numbers: list[int],
+        max_odds: Mapping[int, float],
+    ) -> None:
+        self.amounts = np.zeros(_BOXES)
+        """Odds amount on each number, as the strategy computes it."""
+        self.limits = np.zeros(_BOXES)
+        """Table maximum odds multiple of each number."""
+        self.numbers = _mask(n for n in multiplier if n in numbers)
+        """Numbers the strategy lays odds on."""
+        for n in np.flatnonzero(self.numbers):
+            self.amounts[n] = float(base * multiplier[n])
+            self.limits[n] = max_odds[n]
+        self.stops = _mask(n for n in range(_BOXES) if n not in multiplier)
+        """Numbers at which the strategy stops looking at further base bets."""
+
+
+_BOX_BETS: dict[str, type[_BoxNumberBet]] = {
+    "place": Place,
+    "buy": Buy,
+    "lay": Lay,
+    "put": Put,
+}
+"""Box-number bets, in the order the strategy places them."""
+
+_BOX_MODES = (StrategyMode.ADD_IF_NOT_BET, StrategyMode.BET_IF_POINT_ON)
+
+
+class _BoxPlan:
+    """Costs and payouts of box-number bets of one type, tabulated from the
+    bets' own :meth:`~crapssim.bet.Bet.cost` and
+    :meth:`~crapssim.bet.Bet.get_result` on ``table``, so the vig and
+    come-out working policies of the settings are those of the object
+    model."""
+
+    def __init__(
+        self,
+        bet_type: type[_BoxNumberBet],
+        amounts: Mapping[int, SupportsFloat],
+        always_working: bool | None,
+        table: Table,
+    ) -> None:
+        bets = [bet_type(n, amount, always_working) for n, amount in amounts.items()]
+        self.bets = {bet.number: bet.amount for bet in bets}
+        """Amount of the bet on each number, as given."""
+        numbers = table.rules.point_numbers()
+        self.amounts = {bet.number: bet.amount for bet in bets if bet.number in numbers}
+        """Amount of the bet on each number, in placement order, for the
+        numbers the rules allow."""
+        self.costs = np.zeros(_BOXES)
+        """Cash needed to place the bet on each number, vig included when
+        it is paid up front."""
+        self.returns = np.zeros((2, _BOXES, _BOXES))
+        """Cash the bet on each number returns to the bankroll, by point
+        status (1 for on), number and dice total."""
+        self.decided = np.zeros((2, _BOXES, _BOXES), dtype=bool)
+        """Whether the bet comes down, indexed as :attr:`returns`."""
+        for bet in bets:
+            if bet.number not in numbers:
+                continue
+            self.costs[bet.number] = bet.cost(table)  # type: ignore[arg-type]
+            for on, point in enumerate((None, CLASSIC_POINTS[0])):
+                table.point.number = point
+                for total in range(2, _BOXES):
+                    table.dice.fixed_roll((max(1, total - 6), min(6, total - 1)))
+                    result = copy.copy(bet).get_result(table)  # type: ignore[arg-type]
+                    self.returns[on, bet.number, total] = result.bankroll_change
+                    self.decided[on, bet.number, total] = result.remove
+        table.point.number = None
+
+
+class TableBatch:
+    """Many tables, each with one player, stepped together with array updates.
+
+    The state of each table is a row of NumPy arrays: the point (0 when off),
+    the bankroll, and the amount of each line bet and odds bet, where bets
+    that travel to a number (Come, Don't Come, and their odds) are indexed by
+    the number, with column 0 holding a Come or Don't Come bet that has not
+    moved yet. A roll is one masked update of all the tables.
+
+    Every table plays :meth:`strategy`: flat line bets, with odds laid by
+    multiplier strategies such as
+    :class:`~crapssim.strategy.odds.PassLineOddsMultiplier`, then Place, Buy,
+    Lay and Put bets (indexed by number as well) kept up by single-bet
+    strategies such as :class:`~crapssim.strategy.single_bet.BetBuy`. Their
+    payouts are tabulated from the bets' own results, so the vig and come-out
+    working policies of the settings apply unchanged. Bets follow the
+    object model's rules, limits, and bankroll check, and the order in which
+    the model places bets and pays them is kept, so bankrolls match a
+    :class:`~crapssim.table.Table` rolling the same dice to the last bit.
+
+    Args:
+        n_tables: Number of tables.
+        bankroll: Starting bankroll, for all tables or each table.
+        pass_line: Pass Line bet, 0 for none.
+        dont_pass: Don't Pass bet, 0 for none.
+        come: Come bet, 0 for none.
+        dont_come: Don't Come bet, 0 for none.
+        pass_line_odds: Odds multiplier of the Pass Line, as in
+            :class:`~crapssim.strategy.odds.PassLineOddsMultiplier`, or None
+            for no odds.
+        dont_pass_odds: Odds multiplier of the Don't Pass.
+        come_odds: Odds multiplier of the Come bets.
+        dont_come_odds: Odds multiplier of the Don't Come bets.
+        odds_working: Whether odds work when the point is off.
+        place: Amount of the Place bet on each number, in placement order.
+        buy: Amount of the Buy bet on each number.
+        lay: Amount of the Lay bet against each number.
+        put: Amount of the Put bet on each number.
+        box_working: ``always_working`` of the box-number bets, or None to
+            follow the ``"come_out_working_policy"`` setting.
+        box_mode: How the box-number bets are kept up:
+            ``StrategyMode.ADD_IF_NOT_BET`` (always) or
+            ``StrategyMode.BET_IF_POINT_ON`` (only while the point is on, as
+            :class:`~crapssim.strategy.examples.PlaceInside` does).
+        rules: Table rules; defaults to ClassicRules.
+        settings: Overrides applied on top of the default table settings
+            (e.g. the vig policy of ``"vig_rounding"``, ``"vig_floor"`` and
+            ``"vig_paid_on_win"``).
+
+    Raises:
+        ValueError: If ``box_mode`` is not one of the above, or a box-number
+            bet is on an invalid number.
+    """
+
+    def __init__(
+        self,
+        n_tables: int,
+        bankroll: float | np.ndarray,
+        *,
+        pass_line: SupportsFloat = 0,
+        dont_pass: SupportsFloat = 0,
+        come: SupportsFloat = 0,
+        dont_come: SupportsFloat = 0,
+        pass_line_odds: SupportsFloat | MultiplierDict | None = None,
+        dont_pass_odds: SupportsFloat | MultiplierDict | None = None,
+        come_odds: SupportsFloat | MultiplierDict | None = None,
+        dont_come_odds: SupportsFloat | MultiplierDict | None = None,
+        odds_working: bool = False,
+        place: Mapping[int, SupportsFloat] | None = None,
+        buy: Mapping[int, SupportsFloat] | None = None,
+        lay: Mapping[int, SupportsFloat] | None = None,
+        put: Mapping[int, SupportsFloat] | None = None,
+        box_working: bool | None = None,
+        box_mode: StrategyMode = StrategyMode.ADD_IF_NOT_BET,
+        rules: Rules | None = None,
+        settings: Mapping[str, Any] | None = None,
+    ) -> None:
+        table = Table(rules=rules)
+        table.settings.update(copy.deepcopy(dict(settings or {})))  # type: ignore[typeddict-item]
+        self.rules: Rules = table.rules
+        """Rules of the tables."""
+        self.settings = table.settings
+        """Settings of the tables."""
+        self.odds_working = odds_working
+        """Whether odds work when the point is off."""
+        if box_mode not in _BOX_MODES:
+            raise ValueError(f"Unsupported box_mode: {box_mode!r}")
+        self.box_working = box_working
+        """``always_working`` of the box-number bets."""
+        self.box_mode = box_mode
+        """How the box-number bets are kept up."""
+        boxes = {"place": place, "buy": buy, "lay": lay, "put": put}
+        self._boxes = {
+            name: _BoxPlan(_BOX_BETS[name], amounts, box_working, table)
+            for name, amounts in boxes.items()
+            if amounts
+        }
+        self._bets = {
+            "pass_line": float(pass_line),
+            "dont_pass": float(dont_pass),
+            "come": float(come),
+            "dont_come": float(dont_come),
+        }
+        multipliers = {
+            "pass_line": pass_line_odds,
+            "dont_pass": dont_pass_odds,
+            "come": come_odds,
+            "dont_come": dont_come_odds,
+        }
+        self._multipliers = {
+            name: _expand_multiplier_dict(value)
+            for name, value in multipliers.items()
+            if value is not None
+        }
+        numbers = self.rules.point_numbers()
+        self._odds = {
+            name: _OddsPlan(
+                multiplier,
+                self._bets[name],
+                numbers,
+                self.settings[
+                    "max_odds" if name in ("pass_line", "come") else "max_dont_odds"
+                ],
+            )
+            for name, multiplier in self._multipliers.items()
+        }
+        self._points = _mask(numbers)
+        self._dont_points = _mask(CLASSIC_POINTS)
+        self._winners = _mask(self.rules.come_out_winners())
+        self._losers = _mask(self.rules.come_out_losers())
+        self._allow_dont_pass = self.rules.allow_dont_pass()
+        self._allow_dont_come = self.rules.allow_dont_come()
+
+        self.point = np.zeros(n_tables, dtype=np.int8)
+        """Point of each table, 0 when the point is off."""
+        self.bankroll = np.broadcast_to(
+            np.asarray(bankroll, dtype=float), n_tables
+        ).copy()
+        """Bankroll of each table's player."""
+        self.pass_line = np.zeros(n_tables)
+        """Pass Line bet of each table."""
+        self.dont_pass = np.zeros(n_tables)
+        """Don't Pass bet of each table."""
+        self.come = np.zeros((n_tables, _BOXES))
+        """Come bets of each table by number, with the bet that has not moved
+        yet in column 0."""
+        self.dont_come = np.zeros((n_tables, _BOXES))
+        """Don't Come bets of each table by number, with the bet that has not
+        moved yet in column 0."""
+        self.pass_line_odds = np.zeros(n_tables)
+        """Odds on the Pass Line of each table."""
+        self.dont_pass_odds = np.zeros(n_tables)
+        """Odds on the Don't Pass of each table."""
+        self.come_odds = np.zeros((n_tables, _BOXES))
+        """Odds on the Come bets of each table, by number."""
+        self.dont_come_odds = np.zeros((n_tables, _BOXES))
+        """Odds on the Don't Come bets of each table, by number."""
+        self.place = np.zeros((n_tables, _BOXES))
+        """Place bets of each table, by number."""
+        self.buy = np.zeros((n_tables, _BOXES))
+        """Buy bets of each table, by number."""
+        self.lay = np.zeros((n_tables, _BOXES))
+        """Lay bets of each table, by number."""
+        self.put = np.zeros((n_tables, _BOXES))
+        """Put bets of each table, by number."""
+        allowed = {
+            "pass_line": True,
+            "dont_pass": self._allow_dont_pass,
+            "come": True,
+            "dont_come": self._allow_dont_come,
+        }
+        self._active: list[str] = []
+        """Bets in the order the strategy places them, each followed by its
+        odds."""
+        for name in allowed:
+            if self._bets[name] and allowed[name]:
+                self._active.append(name)
+                if name in self._odds:
+                    self._active.append(f"{name}_odds")
+        self._active.extend(name for name in self._boxes if self._boxes[name].amounts)
+        self._placed = {
+            name: np.full(getattr(self, name).shape, _UNPLACED, dtype=np.int64)
+            for name in self._active
+        }
+        """When each bet was placed, which orders the bets as on a player's
+        layout."""
+        self._waiting = {
+            name: np.zeros(n_tables, dtype=bool) for name in ("come", "dont_come")
+        }
+        """Tables that may have a Come or Don't Come bet without odds."""
+        self._clock = 0
+
+    @property
+    def n_tables(self) -> int:
+        """Number of tables."""
+        return len(self.bankroll)
+
+    @property
+    def bet_totals(self) -> np.ndarray:
+        """Total amount on the layout of each table."""
+        return self._totals(np.arange(self.n_tables))
+
+    def _totals(self, rows: np.ndarray) -> np.ndarray:
+        """Total amount on the layout of the tables ``rows``."""
+        total = np.zeros(len(rows))
+        for name in _LAYOUT:
+            total += getattr(self, name)[rows].reshape(len(rows), -1).sum(axis=1)
+        return total
+
+    def strategy(self) -> Strategy:
+        """Return the strategy every table plays: each line bet followed by
+        its odds multiplier, in the order Pass Line, Don't Pass, Come, Don't
+        Come, then the Place, Buy, Lay and Put bets."""
+        singles = {
+            "pass_line": (BetPassLine, PassLineOddsMultiplier),
+            "dont_pass": (BetDontPass, DontPassOddsMultiplier),
+            "come": (BetCome, ComeOddsMultiplier),
+            "dont_come": (BetDontCome, DontComeOddsMultiplier),
+        }
+        strategies: list[Strategy] = []
+        for name, (single, odds) in singles.items():
+            if self._bets[name]:
+                strategies.append(single(self._bets[name]))
+            if name in self._multipliers:
+                strategies.append(
+                    odds(self._multipliers[name], always_working=self.odds_working)
+                )
+        options = {"mode": self.box_mode, "always_working": self.box_working}
+        if "place" in self._boxes:
+            amounts = {n: float(a) for n, a in self._boxes["place"].bets.items()}
+            strategies.append(BetPlace(amounts, skip_point=False, **options))
+        singles = {"buy": BetBuy, "lay": BetLay, "put": BetPut}
+        for name, single in singles.items():
+            if name in self._boxes:
+                for number, amount in self._boxes[name].bets.items():
+                    strategies.append(single(number, amount, **options))
+        return AggregateStrategy(*strategies)
+
+    def _place(
+        self,
+        name: str,
+        rows: np.ndarray,
+        amount: float | np.ndarray,
+        number: np.ndarray | int | None = None,
+        cost: float | None = None,
+    ) -> None:
+        """Place bets of ``amount`` on the tables ``rows``, on the numbers
+        ``number`` for the bets indexed by number, taking ``cost`` (by
+        default the amount) from the bankrolls."""
+        self._clock += 1
+        index = rows if number is None else (rows, number)
+        getattr(self, name)[index] = amount
+        self._placed[name][index] = self._clock
+        self.bankroll[rows] -= amount if cost is None else cost
+
+    def _covers(
+        self, cost: float | np.ndarray, rows: np.ndarray | None = None
+    ) -> np.ndarray:
+        """Whether each bankroll (of the tables ``rows``, or all) covers
+        ``cost``, as in :meth:`~crapssim.table.Player.add_bet`."""
+        bankroll = self.bankroll if rows is None else self.bankroll[rows]
+        return cost <= bankroll + 1e-9
+
+    def _completed(self, amount: float) -> np.ndarray:
+        """Whether each table's single-bet strategy of ``amount`` is
+        completed: the bankroll is below the amount with nothing on the
+        layout. :class:`~crapssim.strategy.tools.AggregateStrategy` skips it
+        then, even when :meth:`_covers` would let the bet through."""
+        completed = self.bankroll < amount
+        rows = np.flatnonzero(completed)
+        if len(rows):
+            completed[rows] = self._totals(rows) == 0
+        return completed
+
+    def _lay_odds(self, name: str) -> None:
+        """Lay odds behind the numbered bets ``name`` of every table, looking
+        at the bets in the order they were placed, as
+        :class:`~crapssim.strategy.odds.OddsMultiplier` does: it stops at the
+        first bet on a number without a multiplier.
+
+        Args:
+            name: ``"come"`` or ``"dont_come"``.
+        """
+        plan = self._odds[name]
+        bets = getattr(self, name)
+        odds = getattr(self, f"{name}_odds")
+        # Only tables with a bet that has no odds yet can lay any
+        rows = np.flatnonzero(self._waiting[name])
+        if not len(rows):
+            return
+        moved = bets[rows, 1:] > 0
+        if name == "dont_come":
+            # Don't Come odds are limited by all the Don't Come bets that have
+            # moved, since all of them win on a 7
+            base = np.zeros(len(rows))
+            for column in moved.T:
+                base += np.where(column, self._bets[name], 0.0)
+        placed = np.where(moved, self._placed[name][rows, 1:], _UNPLACED)
+        order = np.argsort(placed, axis=1) + 1
+        stopped = np.zeros(len(rows), dtype=bool)
+        for number in order.T:
+            amount = bets[rows, number]
+            present = amount > 0
+            if not present.any():
+                break
+            stopped |= present & plan.stops[number]
+            limit = plan.limits[number] * (base if name == "dont_come" else amount)
+            mask = (
+                present
+                & ~stopped
+                & plan.numbers[number]
+                & (odds[rows, number] == 0)
+                & (plan.amounts[number] <= limit)
+                & self._covers(plan.amounts[number], rows)
+            )
+            number = number[mask]
+            self._place(f"{name}_odds", rows[mask], plan.amounts[number], number)
+        self._waiting[name][rows] = ((bets[rows, 1:] > 0) & (odds[rows, 1:] == 0)).any(
+            axis=1
+        )
+
+    def _take_down(self, name: str, rows: np.ndarray) -> None:
+        """Return the box-number bets ``name`` of the tables ``rows`` to the
+        bankrolls, in the order they were placed, as
+        :meth:`~crapssim.table.Player.remove_bet` does for each."""
+        bets, placed = getattr(self, name), self._placed[name]
+        rows = rows[(bets[rows] > 0).any(axis=1)]
+        if not len(rows):
+            return
+        costs = np.where(bets[rows] > 0, self._boxes[name].costs, 0.0)
+        order = np.argsort(placed[rows], axis=1)
+        for column in np.take_along_axis(costs, order, axis=1).T:
+            self.bankroll[rows] += column
+        bets[rows] = 0.0
+        placed[rows] = _UNPLACED
+
+    def _update_boxes(self, name: str, on: np.ndarray) -> None:
+        """Place (or take down) the box-number bets ``name``, as the
+        single-bet strategies of :meth:`strategy` do, one number at a time.
+
+        A completed strategy has nothing of its own on the layout, so
+        skipping it only skips its bets.
+        """
+        plan = self._boxes[name]
+        bets = getattr(self, name)
+        point_on = self.box_mode == StrategyMode.BET_IF_POINT_ON
+        if name == "place":
+            # BetPlace is one strategy, completed below its smallest bet
+            low = self.bankroll < min(plan.bets.values())
+            completed = low & ~(bets > 0).any(axis=1)
+        for number, amount in plan.amounts.items():
+            if name != "place":
+                completed = self._completed(amount)
+            # Put bets and bets only up with the point need the point on
+            mask = on if point_on or name == "put" else np.ones_like(on)
+            mask = mask & (bets[:, number] == 0) & self._covers(plan.costs[number])
+            rows = np.flatnonzero(mask & ~completed)
+            self._place(name, rows, amount, number, plan.costs[number])
+            if not point_on or name == "put":
+                # A Put bet is not allowed with the point off, so its
+                # strategy leaves it up
+                continue
+            if name == "place":
+                # Place bets come down one number at a time
+                rows = np.flatnonzero(~on & (bets[:, number] > 0))
+                self.bankroll[rows] += plan.costs[number]
+                bets[rows, number] = 0.0
+                self._placed[name][rows, number] = _UNPLACED
+            else:
+                # The first strategy takes down all the bets of its type
+                self._take_down(name, np.flatnonzero(~on))
+
+    def _update_bets(self, on: np.ndarray, point: np.ndarray) -> None:
+        """Place the bets of :meth:`strategy`, as before a roll.
+
+        Odds strategies are completed only when there is no base bet to lay
+        odds behind, so only the other strategies need :meth:`_completed`.
+        """
+        for name in self._active:
+            if name in ("pass_line", "dont_pass"):
+                amount = self._bets[name]
+                mask = ~on & (getattr(self, name) == 0) & self._covers(amount)
+                mask &= ~self._completed(amount)
+                self._place(name, np.flatnonzero(mask), amount)
+            elif name in ("pass_line_odds", "dont_pass_odds"):
+                base = name.removesuffix("_odds")
+                plan = self._odds[base]
+                amount = plan.amounts[point]
+                mask = (
+                    (getattr(self, base) > 0)
+                    & plan.numbers[point]
+                    & (getattr(self, name) == 0)
+                    & (amount <= plan.limits[point] * self._bets[base])
+                    & self._covers(amount)
+                )
+                rows = np.flatnonzero(mask)
+                self._place(name, rows, amount[rows])
+            elif name in ("come", "dont_come"):
+                amount = self._bets[name]
+                mask = on & (getattr(self, name)[:, 0] == 0) & self._covers(amount)
+                rows = np.flatnonzero(mask & ~self._completed(amount))
+                self._place(name, rows, amount, np.zeros_like(rows))
+            elif name in _BOX_BETS:
+                self._update_boxes(name, on)
+            else:
+                self._lay_odds(name.removesuffix("_odds"))
+
+    def _result(
+        self,
+        name: str,
+        bets: np.ndarray,
+        numbers: np.ndarray,
+        total: np.ndarray,
+        on: np.ndarray,
+        point: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Cash returned by bets on a roll, and which of them are decided.
+
+        Args:
+            name: The kind of bets.
+            bets: Amounts of the bets, of shape ``(n, k)``.
+            numbers: Number of each bet, 0 for a Come or Don't Come bet that
+                has not moved (ignored for bets without a number).
+            total: Dice total of each table, of shape ``(n,)``.
+            on: Whether each table's point is on.
+            point: Point of each table, 0 when off.
+        """
+        if name in _BOX_BETS:
+            plan = self._boxes[name]
+            index = (on.astype(np.intp)[:, np.newaxis], numbers, total[:, np.newaxis])
+            return np.where(bets > 0, plan.returns[index], 0.0), plan.decided[index]
+        seven = (total == 7)[:, np.newaxis]
+        total = total[:, np.newaxis]
+        on = on[:, np.newaxis]
+        point = point[:, np.newaxis]
+        if name in ("pass_line", "pass_line_odds"):
+            win = np.where(on, total == point, self._winners[total])
+            resolved = win | np.where(on, seven, self._losers[total])
+            push = None
+        elif name in ("dont_pass", "dont_pass_odds"):
+            win = np.where(on, seven, (total == 2) | (total == 3))
+            resolved = win | np.where(on, total == point, seven | (total == 11))
+            push = ~on & (total == 12)
+            resolved |= push
+        else:
+            # A bet on a number is decided by its number or a 7
+            hit = numbers == total
+            resolved = hit | seven
+            win = hit if name.startswith("come") else seven
+            pending = numbers == 0
+            push = None
+            if name == "come":
+                win = np.where(pending, self._winners[total], win)
+                decided = self._winners[total] | self._losers[total]
+                resolved = np.where(pending, decided, resolved)
+            elif name == "dont_come":
+                win = np.where(pending, (total == 2) | (total == 3), win)
+                resolved = np.where(pending, ~self._dont_points[total], resolved)
+                push = pending & (total == 12)
+
+        if not name.endswith("_odds"):
+            credit = np.where(win, bets + bets, 0.0)
+            if push is not None:
+                credit = np.where(push, bets, credit)
+            return credit, resolved
+        if name.startswith(("pass_line", "come")):
+            ratios = _LIGHT_RATIOS[point if name == "pass_line_odds" else numbers]
+        else:
+            ratios = _DARK_RATIOS[point if name == "dont_pass_odds" else numbers]
+        credit = np.where(win, ratios * bets + bets, 0.0)
+        if not self.odds_working:
+            # Odds that are off return the wager when their base bet is decided
+            credit = np.where(~on & resolved, bets, credit)
+        return credit, resolved
+
+    def _settle_rows(
+        self, rows: np.ndarray, numbers: np.ndarray, total: np.ndarray
+    ) -> None:
+        """Pay and remove the bets of the tables ``rows`` decided by a roll of
+        ``total``, in the order they were placed, looking only at the bets
+        on ``numbers`` (of shape ``(len(rows), k)``) of those indexed by
+        number."""
+        on = self.point[rows] != 0
+        point = self.point[rows].astype(np.intp)
+        flat = rows[:, np.newaxis] * _BOXES + numbers
+        credits = []
+        placed = []
+        for name in self._active:
+            bets = getattr(self, name).reshape(-1)
+            order = self._placed[name].reshape(-1)
+            index = rows[:, np.newaxis] if getattr(self, name).ndim == 1 else flat
+            credit, resolved = self._result(
+                name, bets[index], numbers, total, on, point
+            )
+            credits.append(credit)
+            placed.append(order[index])
+            decided = np.broadcast_to(index, resolved.shape)[resolved]
+            bets[decided] = 0.0
+            order[decided] = _UNPLACED
+        credit = np.concatenate(credits, axis=1)
+        paid = credit != 0
+        count = paid.sum(axis=1)
+        multiple = count > 1
+        self.bankroll[rows] += np.where(multiple, 0.0, credit.sum(axis=1))
+        if multiple.any():
+            # Several bets paid: credit them in the order the player's layout
+            # lists them, as rounding can depend on it
+            credit, paid = credit[multiple], paid[multiple]
+            placed = np.concatenate(placed, axis=1)[multiple]
+            placed = np.where(paid, placed, _UNPLACED)
+            credit = np.take_along_axis(credit, np.argsort(placed, axis=1), axis=1)
+            rows = rows[multiple]
+            for column in credit[:, : count.max()].T:
+                self.bankroll[rows] += column
+
+    def _settle(self, total: np.ndarray) -> None:
+        """Pay and remove the bets decided by a roll of ``total``.
+
+        Besides the line bets, a roll that is not a 7 can only decide the
+        bets on the number rolled and the bets that have not moved, so only
+        a 7 needs all the numbers.
+        """
+        if not self._active:
+            return
+        seven = total == 7
+        rows = np.flatnonzero(~seven)
+        numbers = np.stack([np.zeros_like(rows), total[rows]], axis=1)
+        self._settle_rows(rows, numbers, total[rows])
+        rows = np.flatnonzero(seven)
+        numbers = np.broadcast_to(np.arange(_BOXES), (len(rows), _BOXES))
+        self._settle_rows(rows, numbers, total[rows])
+
+    def _move(self, total: np.ndarray, on: np.ndarray) -> None:
+        """Move Come and Don't Come bets to the number rolled, then update the
+        point."""
+        for name, numbers in (("come", self._points), ("dont_come", self._dont_points)):
+            if name not in self._active:
+                continue
+            bets, placed = getattr(self, name), self._placed[name]
+            rows = np.flatnonzero((bets[:, 0] > 0) & numbers[total])
+            number = total[rows]
+            bets[rows, number] = bets[rows, 0]
+            placed[rows, number] = placed[rows, 0]
+            bets[rows, 0] = 0.0
+            placed[rows, 0] = _UNPLACED
+            self._waiting[name][rows] = True
+        sets = ~on & self._points[total]
+        self.point[sets] = total[sets]
+        self.point[on & ((total == 7) | (total == self.point))] = 0
+
+    def roll(self, dice: np.ndarray) -> None:
+        """Play one roll at every table: place the strategy's bets, then
+        settle them on ``dice`` and move the point.
+
+        Args:
+            dice: Dice faces of each table, of shape ``(n_tables, 2)``.
+
+        Raises:
+            ValueError: If the dice are not one pair per table.
+        """
+        dice = np.asarray(dice)
+        if dice.shape != (self.n_tables, 2):
+            raise ValueError(
+                f"Dice must have shape ({self.n_tables}, 2), not {dice.shape}"
+            )
+        total = dice.astype(np.intp).sum(axis=1)
+        on = self.point != 0
+        point = self.point.astype(np.intp)
+        self._update_bets(on, point)
+        self._settle(total)
+        self._move(total, on)
+
+    def run(self, dice: np.ndarray) -> np.ndarray:
+        """Play every roll of a tape.
+
+        Args:
+            dice: Dice faces, of shape ``(n_tables, n_rolls, 2)``.
+
+        Returns:
+            np.ndarray: Bankroll after each roll, of shape
+            ``(n_tables, n_rolls)``.
+        """
+        dice = np.asarray(dice)
+        result = np.empty(dice.shape[:2])
+        for roll in range(dice.shape[1]):
+            self.roll(dice[:, roll])
+            result[:, roll] = self.bankroll
+        return result
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(n_tables={self.n_tables}, {self.strategy()!r})"
+        )
@@ -0,0 +1,51 @@
+"""Tapes of dice outcomes shared by the vectorized engines and the table."""
+
+from typing import Iterable
+
+import numpy as np
+
+__all__ = ["dice_tape", "outcome_index"]
+
+
+def dice_tape(seeds: Iterable[int | None], n_rolls: int) -> np.ndarray:
+    """Draw the first ``n_rolls`` rolls of ``Dice(seed)`` for every seed.
+
+    :class:`~crapssim.dice.Dice` draws each roll with
+    ``rng.integers(1, 7, size=2)``, which takes the same values from the
+    generator as drawing all the rolls at once, so a table seeded with
+    ``seed`` rolls exactly the outcomes of its row of the tape.
+
+    Args:
+        seeds: Dice seed of each session.
+        n_rolls: Number of rolls per session.
+
+    Returns:
+        np.ndarray: Dice faces, of shape ``(n_sessions, n_rolls, 2)``.
+    """
+    return np.stack(
+        [
+            np.random.default_rng(seed).integers(1, 7, size=(n_rolls, 2))
+            for seed in seeds
+        ]
+    ).astype(np.int8)
+
+
+def outcome_index(dice: np.ndarray) -> np.ndarray:
+    """Index of each ordered outcome in
+    :data:`~crapssim.analysis.DICE_OUTCOMES`, ``6 * (die1 - 1) + die2 - 1``.
+
+    Args:
+        dice: Dice faces, of shape ``(..., 2)``.
+
+    Raises:
+        ValueError: If the last axis is not a pair, or a face is not 1 to 6.
+
+    Returns:
+        np.ndarray: Outcome indices from 0 to 35, of shape ``dice.shape[:-1]``.
+    """
+    dice = np.asarray(dice)
+    if dice.shape[-1:] != (2,):
+        raise ValueError(f"Dice must have a last axis of 2, not {dice.shape}")
+    if dice.size and (dice.min() < 1 or dice.max() > 6):
+        raise ValueError("Dice faces must be from 1 to 6")
+    return 6 * (dice[..., 0].astype(np.intp) - 1) + dice[..., 1] - 1
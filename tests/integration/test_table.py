@@ -1,11 +1,30 @@
 import os
+import pickle
 from unittest.mock import MagicMock
 
 import pytest
 
 from crapssim import Table
+from crapssim.bet import Place
 from crapssim.strategy.odds import PassLineOddsMultiplier
-from crapssim.strategy.single_bet import BetCome, BetPassLine, BetPlace
+from crapssim.strategy.examples import (
+    DiceDoctor,
+    DoubleTap,
+    HammerLock,
+    IronCross,
+    Knockout,
+    Pass2Come,
+    PassLinePlace68,
+    PassLinePlace68Move59,
+    Place68DontCome2Odds,
+    Place682Come,
+    Place68PR,
+    PlaceInside,
+    Risk12,
+    SqueezePlay,
+    ThreePointMolly,
+)
+from crapssim.strategy.single_bet import BetCome, BetFire, BetPassLine, BetPlace
 
 
 def test_table_print_output(capsys):
@@ -87,3 +106,120 @@ def test_table_total_player_cash():
 
     assert table.total_player_cash == 188.0
     assert table.total_player_cash == player0_final_br + player1_final_br
+
+
+def _reset_test_strategies():
+    return {
+        "ironcross": IronCross(5),
+        "hammerlock": HammerLock(5),
+        "risk12": Risk12(5),
+        "place68pr": Place68PR(6),
+        "dicedoctor": DiceDoctor(10),
+        "squeeze": SqueezePlay(),
+        "doubletap": DoubleTap(10),
+        "molly_fire": ThreePointMolly(5, odds_multiplier=2) + BetFire(1),
+    }
+
+
+def _session_results(table):
+    return (
+        table.dice.n_rolls,
+        table.n_shooters,
+        table.point.number,
+        [(p.bankroll, [repr(b) for b in p.bets]) for p in table.players],
+    )
+
+
+@pytest.mark.parametrize("seed", [3, 8, 42])
+def test_table_reset_matches_fresh_table(seed):
+    reused = Table(seed=0)
+    for name, strategy in _reset_test_strategies().items():
+        reused.add_player(bankroll=500, strategy=strategy, name=name)
+    # Stop mid-shooter so strategy progressions are left part way through
+    reused.run(max_rolls=37, verbose=False)
+
+    reused.reset(seed=seed)
+    reused.run(max_rolls=200, max_shooter=6, verbose=False)
+
+    fresh = Table(seed=seed)
+    for name, strategy in _reset_test_strategies().items():
+        fresh.add_player(bankroll=500, strategy=strategy, name=name)
+    fresh.run(max_rolls=200, max_shooter=6, verbose=False)
+
+    assert _session_results(reused) == _session_results(fresh)
+
+
+@pytest.mark.parametrize("seed", [3, 8, 42])
+def test_table_restore_replays_same_future(seed):
+    table = Table(seed=seed)
+    for name, strategy in _reset_test_strategies().items():
+        table.add_player(bankroll=500, strategy=strategy, name=name)
+    table.run(max_rolls=37, verbose=False)
+
+    snapshot = table.snapshot()
+    table.run(max_rolls=150, verbose=False)
+    first_branch = _session_results(table)
+
+    table.restore(snapshot)
+    table.run(max_rolls=150, verbose=False)
+    second_branch = _session_results(table)
+
+    assert first_branch == second_branch
+
+
+def test_table_restore_branches_on_same_dice():
+    table = Table(seed=5)
+    player = table.add_player(bankroll=500, strategy=BetPlace({6: 6, 8: 6}))
+    table.fixed_run([(2, 2)])
+    snapshot = table.snapshot()
+
+    table.run(max_rolls=30, verbose=False)
+    plain_rolls = [table.dice.n_rolls, table.n_shooters]
+
+    table.restore(snapshot)
+    player.add_bet(Place(6, 6))  # press the 6 in this branch
+    table.run(max_rolls=30, verbose=False)
+    pressed_rolls = [table.dice.n_rolls, table.n_shooters]
+
+    assert plain_rolls == pressed_rolls
+
+
+def _pickle_test_strategies():
+    return {
+        **_reset_test_strategies(),
+        "pass2come": Pass2Come(5),
+        "place68": PassLinePlace68(5),
+        "inside": PlaceInside(5),
+        "move59": PassLinePlace68Move59(5),
+        "place682come": Place682Come(),
+        "knockout": Knockout(5),
+        "dc2odds": Place68DontCome2Odds(),
+    }
+
+
+@pytest.mark.parametrize("seed", [3, 8])
+def test_table_pickle_resumes_identically(seed):
+    table = Table(seed=seed)
+    for name, strategy in _pickle_test_strategies().items():
+        table.add_player(bankroll=500, strategy=strategy, name=name)
+    table.run(max_rolls=37, verbose=False)
+
+    unpickled = pickle.loads(pickle.dumps(table))
+    assert all(p.table is unpickled for p in unpickled.players)
+
+    table.run(max_rolls=150, verbose=False)
+    unpickled.run(max_rolls=150, verbose=False)
+    assert _session_results(unpickled) == _session_results(table)
+
+
+def test_player_pickles_without_table():
+    table = Table()
+    player = table.add_player(strategy=IronCross(5))
+    table.fixed_run([(2, 2)])
+
+    unpickled = pickle.loads(pickle.dumps(player))
+
+    assert unpickled.table is None
+    assert unpickled.bankroll == player.bankroll
+    assert unpickled.bets == player.bets
+    assert len(pickle.dumps(player)) < len(pickle.dumps(table))
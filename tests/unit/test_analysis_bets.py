@@ -0,0 +1,153 @@
+import numpy as np
+import pytest
+
+import crapssim.bet
+from crapssim.analysis import RollModel, analyze_bet, bet_table
+from crapssim.bet import (
+    All,
+    Any7,
+    Bet,
+    BetResult,
+    Big6,
+    Buy,
+    Come,
+    DontPass,
+    Field,
+    Fire,
+    HardWay,
+    Lay,
+    Odds,
+    PassLine,
+    Place,
+    Put,
+)
+from crapssim.rules import CraplessRules
+from crapssim.table import Table
+
+
+@pytest.mark.parametrize(
+    "bet, point, edge",
+    [
+        (PassLine(5), None, 7 / 495),
+        (DontPass(5), None, 3 / 220),
+        (Come(5), 4, 7 / 495),
+        (Odds(PassLine, 4, 10), 4, 0.0),
+        (Odds(DontPass, 6, 12), 6, 0.0),
+        (Place(4, 5), None, 1 / 15),
+        (Place(5, 5), None, 1 / 25),
+        (Place(6, 6), None, 1 / 66),
+        (Put(6, 5), 6, 1 / 11),
+        (Field(5), None, 1 / 18),
+        (Any7(5), None, 1 / 6),
+        (Big6(5), None, 1 / 11),
+        (HardWay(4, 5), None, 1 / 9),
+        (HardWay(8, 5), None, 1 / 11),
+    ],
+)
+def test_known_house_edges(bet, point, edge):
+    assert analyze_bet(bet, point=point).house_edge == pytest.approx(edge, abs=1e-12)
+
+
+def test_pass_line_resolution_time():
+    analysis = analyze_bet(PassLine(5))
+    assert analysis.expected_rolls == pytest.approx(557 / 165)
+    assert analysis.edge_per_roll == pytest.approx((7 / 495) / (557 / 165))
+    pmf = analysis.resolution_pmf
+    assert pmf[0] == pytest.approx(12 / 36)
+    assert pmf.sum() == pytest.approx(1.0)
+    assert (np.arange(1, len(pmf) + 1) * pmf).sum() == pytest.approx(557 / 165)
+
+
+def test_dont_pass_pushes_on_12():
+    analysis = analyze_bet(DontPass(5))
+    assert analysis.p_push == pytest.approx(1 / 36)
+    assert analysis.edge_per_decision == pytest.approx(3 / 220 * 36 / 35)
+
+
+def test_settings_overrides():
+    triple = {2: 2, 3: 1, 4: 1, 9: 1, 10: 1, 11: 1, 12: 3}
+    analysis = analyze_bet(Field(5), settings={"field_payouts": triple})
+    assert analysis.house_edge == pytest.approx(1 / 36)
+
+    # $1 commission on a $20 Buy 4, paid upfront or on a win only
+    assert analyze_bet(Buy(4, 20)).house_edge == pytest.approx(1 / 21)
+    on_win = analyze_bet(Buy(4, 20), settings={"vig_paid_on_win": True})
+    assert on_win.house_edge == pytest.approx(1 / 60)
+    assert analyze_bet(Lay(4, 40)).cost == 41
+
+
+def test_come_out_working_policy():
+    real = analyze_bet(Place(6, 6))
+    legacy = analyze_bet(Place(6, 6), settings={"come_out_working_policy": "legacy"})
+    assert legacy.house_edge == pytest.approx(real.house_edge)
+    assert legacy.expected_rolls == pytest.approx(36 / 11)
+    assert real.expected_rolls > legacy.expected_rolls
+
+
+def test_crapless_rules():
+    analysis = analyze_bet(PassLine(5), CraplessRules())
+    assert analysis.house_edge == pytest.approx(0.0538239538)
+    assert analyze_bet(Place(2, 5), CraplessRules()).house_edge == pytest.approx(1 / 14)
+
+
+def test_stateful_bets():
+    fire = analyze_bet(Fire(1))
+    assert fire.house_edge == pytest.approx(0.2076275, abs=1e-7)
+    assert fire.expected_rolls == pytest.approx(8.5241254, abs=1e-7)
+    assert analyze_bet(All(1)).p_win == pytest.approx(0.0052577, abs=1e-7)
+
+    # The bet's own state is the starting state, and is not modified
+    started = Fire(1)
+    started.points_made = {4, 5, 6, 8}
+    assert analyze_bet(started).p_win > fire.p_win
+    assert started.points_made == {4, 5, 6, 8}
+
+
+def test_cached():
+    assert analyze_bet(PassLine(5)) is analyze_bet(PassLine(5))
+    assert analyze_bet(PassLine(5)) is not analyze_bet(PassLine(10))
+
+
+def test_errors():
+    with pytest.raises(ValueError):
+        analyze_bet(PassLine(5), point=7)
+
+    class Forever(Bet):
+        def get_result(self, table):
+            return BetResult.no_change(self.amount)
+
+    with pytest.raises(ValueError):
+        analyze_bet(Forever(5))
+
+
+def test_bet_table_covers_every_bet():
+    table = bet_table()
+    classes = {name.split("(")[0] for name in table}
+    public = {name for name in crapssim.bet.__all__ if not name.startswith("_")}
+    assert classes == public - {"BetResult", "Bet"}
+    for analysis in table.values():
+        assert analysis.p_win + analysis.p_lose + analysis.p_push == pytest.approx(1)
+        assert analysis.house_edge >= -1e-12
+
+    crapless = bet_table(CraplessRules())
+    assert "DontPass(amount=20.0)" not in crapless
+    assert "Place(2, amount=20.0)" in crapless
+
+
+def test_roll_model():
+    model = RollModel()
+    table = Table()
+    # Come-out: 8 ways to win, 4 to lose; Place 6 is off
+    assert model(PassLine(5), table) == pytest.approx(5 * 4 / 36)
+    assert model(Place(6, 6), table) == 0
+    table.point.number = 6
+    assert model(PassLine(5), table) == pytest.approx((5 * 5 - 5 * 6) / 36)
+    assert model(Place(6, 6), table) == pytest.approx((7 * 5 - 6 * 6) / 36)
+    assert model(HardWay(6, 5), table) == pytest.approx((45 - 5 * 10) / 36)
+
+    started = Fire(1)
+    started.points_made = {4, 5, 6, 8, 9}
+    table.point.number = 10
+    # Five points made pay on a seven-out, the sixth ends the bet
+    assert model(started, table) == pytest.approx((3 * 999 + 6 * 249) / 36)
+    assert started.points_made == {4, 5, 6, 8, 9}
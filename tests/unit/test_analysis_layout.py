@@ -0,0 +1,77 @@
+import pytest
+
+from crapssim.analysis import analyze_layout
+from crapssim.rules import CraplessRules
+from crapssim.strategy import BetPassLine, BetPlace
+from crapssim.strategy.single_bet import StrategyMode
+from crapssim.strategy.examples import IronCross, Pass2Come, Place68Move59, PlaceInside
+
+ROLLS_PER_SHOOTER = 1671 / 196
+
+
+def test_pass_line():
+    analysis = analyze_layout(BetPassLine(5))
+    assert analysis.exact
+    assert analysis.win_per_dollar == pytest.approx(-7 / 495)
+    assert analysis.win_per_roll == pytest.approx(-5 * (7 / 495) / (557 / 165))
+    assert analysis.rolls_per_shooter == pytest.approx(ROLLS_PER_SHOOTER)
+    assert analysis.win_per_shooter == pytest.approx(
+        analysis.win_per_roll * ROLLS_PER_SHOOTER
+    )
+
+
+@pytest.mark.parametrize(
+    "strategy, win_per_dollar",
+    [
+        (BetPlace({6: 6}), -1 / 66),
+        (BetPlace({5: 5, 9: 5}), -1 / 25),
+        (Pass2Come(5), -7 / 495),
+    ],
+)
+def test_known_edges(strategy, win_per_dollar):
+    analysis = analyze_layout(strategy, fallback_rolls=0)
+    assert analysis.win_per_dollar == pytest.approx(win_per_dollar)
+
+
+def test_static_layouts_are_exact():
+    for strategy in (PlaceInside(5), IronCross(5), Place68Move59()):
+        analysis = analyze_layout(strategy, fallback_rolls=0)
+        assert analysis.exact
+        assert analysis.n_states > 0
+        assert -0.03 < analysis.win_per_dollar < -0.01
+
+
+def test_rules_and_settings():
+    crapless = analyze_layout(BetPassLine(5), CraplessRules())
+    assert crapless.win_per_dollar == pytest.approx(-0.0538239538)
+
+    def place6(always_working=None):
+        mode = StrategyMode.ADD_IF_NOT_BET
+        return BetPlace({6: 6}, mode, skip_point=False, always_working=always_working)
+
+    off = analyze_layout(place6())
+    working = analyze_layout(place6(always_working=True))
+    legacy = analyze_layout(place6(), settings={"come_out_working_policy": "legacy"})
+    assert working.win_per_dollar == pytest.approx(-1 / 66)
+    assert working.wagered_per_roll > off.wagered_per_roll
+    assert legacy.win_per_roll == pytest.approx(working.win_per_roll)
+
+
+def test_strategy_is_not_modified():
+    strategy = Place68Move59()
+    before = strategy.snapshot()
+    analyze_layout(strategy)
+    assert strategy.snapshot() == before
+
+
+def test_fallback_to_simulation():
+    with pytest.raises(ValueError):
+        analyze_layout(Pass2Come(5), max_states=10, fallback_rolls=0)
+
+    exact = analyze_layout(BetPassLine(5))
+    simulated = analyze_layout(BetPassLine(5), max_states=10, fallback_rolls=20_000)
+    assert not simulated.exact
+    assert simulated.n_rolls == 20_000
+    assert simulated.stderr > 0
+    assert abs(simulated.win_per_roll - exact.win_per_roll) < 4 * simulated.stderr
+    assert simulated.rolls_per_shooter == pytest.approx(ROLLS_PER_SHOOTER, rel=0.1)
@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from crapssim.analysis import PolicySolver, RuinSolver, default_actions
+from crapssim.batch import Experiment, run_session
+from crapssim.bet import DontPass, PassLine
+from crapssim.rules import CraplessRules
+from crapssim.strategy.odds import PassLineOddsMultiplier
+from crapssim.strategy.single_bet import BetPassLine
+
+
+@pytest.fixture(scope="module")
+def solver():
+    return PolicySolver()
+
+
+def test_single_action_matches_ruin_solver():
+    policy = PolicySolver({"pass line": (PassLine(5),)}).solve(80, shooters=3)
+    curve = RuinSolver(BetPassLine(5)).curve(80, shooters=3)
+    assert list(policy.actions) == ["none", "pass line"]
+    for bankroll in (20, 40, 60):
+        assert policy.value(bankroll) == pytest.approx(curve.at(bankroll)[1], abs=1e-8)
+
+
+def test_optimal_beats_static_layouts(solver):
+    policy = solver.solve(100, shooters=3)
+    for strategy in (BetPassLine(5), BetPassLine(5) + PassLineOddsMultiplier(3)):
+        curve = RuinSolver(strategy).curve(100, shooters=3)
+        for bankroll in (25, 50, 75):
+            assert policy.value(bankroll) >= curve.at(bankroll)[1] - 1e-8
+    assert policy.value(0) == 0
+    assert policy.value(100) == 1
+
+
+def test_policy_strategy_achieves_its_value(solver):
+    policy = solver.solve(60, shooters=2)
+    experiment = Experiment({"best": policy.strategy()}, bankroll=30, max_shooter=2)
+    table = experiment.build_table()
+    hits = [
+        run_session(table, experiment, i).players[0].final >= 60 for i in range(2000)
+    ]
+    stderr = np.std(hits) / np.sqrt(len(hits))
+    assert abs(np.mean(hits) - policy.value(30)) < 4 * stderr
+
+
+def test_expected_final_wealth(solver):
+    policy = solver.solve(200, shooters=2, objective="final")
+    # Every bet loses on average, so far from the target the best is not to bet
+    assert policy.value(40) == pytest.approx(40)
+    assert list(policy.actions)[policy.decisions[-1, 0, 39]] == "none"
+    assert np.all(policy.values[-1, 0] >= policy.bankrolls - 1e-9)
+
+
+def test_default_actions():
+    actions = default_actions(10)
+    assert actions["pass line"] == (PassLine(10),)
+    assert actions["odds 6"][0].amount == 50
+    assert actions["place 6"][0].amount == 12
+    crapless = default_actions(rules=CraplessRules())
+    assert "don't pass" not in crapless
+    assert "odds 2" in crapless
+
+
+def test_errors(solver):
+    with pytest.raises(ValueError):
+        solver.solve(100, shooters=0)
+    with pytest.raises(ValueError):
+        solver.solve(100, ruin=100)
+    with pytest.raises(ValueError):
+        solver.solve(100, objective="median")
+    with pytest.raises(ValueError):
+        PolicySolver({"don't pass": (DontPass(5),)}, max_states=3)
@@ -0,0 +1,71 @@
+from fractions import Fraction
+
+import pytest
+
+from crapssim.analysis import (
+    analyze_bet,
+    ats_ev,
+    ats_probabilities,
+    ats_probability,
+    fire_ev,
+    fire_probabilities,
+)
+from crapssim.bet import All, Fire, Small, Tall
+from crapssim.rules import CraplessRules
+
+
+def test_fire_probabilities():
+    probabilities = fire_probabilities()
+    assert sum(probabilities.values()) == 1
+    assert all(isinstance(p, Fraction) for p in probabilities.values())
+    # Published odds: about 1 in 114, 610, and 6156 for 4, 5, and 6 points
+    assert float(probabilities[4]) == pytest.approx(1 / 113.66, rel=1e-3)
+    assert float(probabilities[5]) == pytest.approx(1 / 609.78, rel=1e-3)
+    assert float(probabilities[6]) == pytest.approx(1 / 6156.3, rel=1e-3)
+
+    started = fire_probabilities(points_made={4, 5, 6, 8, 9})
+    assert started[0] == started[4] == 0
+    assert started[5] + started[6] == 1
+
+
+@pytest.mark.parametrize("rules", [None, CraplessRules()])
+def test_fire_matches_markov_chain(rules):
+    probabilities = fire_probabilities(rules)
+    analysis = analyze_bet(Fire(1), rules)
+    assert analysis.p_win == pytest.approx(
+        float(sum(probabilities[k] for k in (4, 5, 6)))
+    )
+    assert analysis.ev == pytest.approx(float(fire_ev(rules)), abs=1e-8)
+
+
+def test_fire_payout_settings():
+    payouts = {4: 24, 5: 249, 6: 999}
+    probabilities = fire_probabilities()
+    assert fire_ev(settings={"fire_payouts": {6: 999}}) == probabilities[6] * 999 - (
+        1 - probabilities[6]
+    )
+    settings = {"fire_payouts": {**payouts, 3: 2}}
+    assert fire_ev(settings=settings) == fire_ev() + 3 * probabilities[3]
+
+
+def test_ats_probabilities():
+    probabilities = ats_probabilities()
+    assert probabilities["tall"] == probabilities["small"]
+    assert float(probabilities["all"]) == pytest.approx(1 / 190.2, rel=1e-3)
+    assert float(probabilities["tall"]) == pytest.approx(1 / 37.95, rel=1e-3)
+    assert ats_probability([12]) == Fraction(1, 7)
+    assert ats_probability(Small.numbers, hit=[2, 3, 4, 5]) == Fraction(5, 11)
+
+    with pytest.raises(ValueError):
+        ats_probability([6, 7, 8])
+
+
+@pytest.mark.parametrize("bet", [All, Tall, Small])
+def test_ats_matches_markov_chain(bet):
+    analysis = analyze_bet(bet(1))
+    assert analysis.p_win == pytest.approx(float(ats_probabilities()[bet.type]))
+    assert analysis.ev == pytest.approx(float(ats_ev(bet)))
+    settings = {"ATS_payouts": {"all": 175, "tall": 34, "small": 34}}
+    assert analyze_bet(bet(1), settings=settings).ev == pytest.approx(
+        float(ats_ev(bet.type, settings))
+    )
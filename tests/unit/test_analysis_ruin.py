@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from crapssim.analysis import RuinSolver, analyze_layout
+from crapssim.strategy.examples import IronCross, Pass2Come
+from crapssim.strategy.odds import PassLineOddsMultiplier
+from crapssim.strategy.single_bet import BetPassLine
+
+
+def gamblers_ruin_target(bankroll, target, unit):
+    """Probability of reaching target by even-money bets of unit at the pass
+    line's probability of winning."""
+    r = (251 / 495) / (244 / 495)
+    return (1 - r ** (bankroll / unit)) / (1 - r ** (target / unit))
+
+
+@pytest.fixture(scope="module")
+def pass_line():
+    return RuinSolver(BetPassLine(5))
+
+
+def test_pass_line_is_gamblers_ruin(pass_line):
+    assert pass_line.step == 5
+    curve = pass_line.curve(100)
+    np.testing.assert_allclose(curve.bankrolls, np.arange(5, 100, 5))
+    expected = gamblers_ruin_target(curve.bankrolls, 100, 5)
+    np.testing.assert_allclose(curve.p_target, expected, atol=1e-10)
+    np.testing.assert_allclose(curve.p_ruin, 1 - expected, atol=1e-10)
+    np.testing.assert_allclose(curve.expected_final, 100 * expected, atol=1e-8)
+    assert curve.at(0) == (1.0, 0.0, 0)
+    assert curve.at(100) == (0.0, 1.0, 100)
+
+
+def test_distribution_matches_curve(pass_line):
+    curve = pass_line.curve(100, shooters=3)
+    for bankroll in (5, 50, 95):
+        p_ruin, p_target, final = curve.at(bankroll)
+        dist = pass_line.distribution(bankroll, 100, shooters=3)
+        assert dist.probabilities.sum() == pytest.approx(1)
+        assert dist.p_ruin == pytest.approx(p_ruin)
+        assert dist.p_target == pytest.approx(p_target)
+        assert dist.mean == pytest.approx(final)
+    assert pass_line.curve(100, shooters=3) is curve
+
+
+def test_one_roll_distribution(pass_line):
+    dist = pass_line.distribution(100, 200, rolls=1)
+    np.testing.assert_allclose(dist.values, [95, 100, 105])
+    np.testing.assert_allclose(dist.probabilities, np.array([4, 24, 8]) / 36)
+    assert dist.quantile(0.5) == 100
+    assert dist.p_ruin == dist.p_target == 0
+
+
+def test_shooter_horizon_matches_layout(pass_line):
+    per_shooter = analyze_layout(BetPassLine(5)).win_per_shooter
+    dist = pass_line.distribution(5000, 10000, shooters=2)
+    assert dist.mean == pytest.approx(5000 + 2 * per_shooter)
+    assert pass_line.curve(10000, shooters=2).at(5000)[2] == pytest.approx(dist.mean)
+
+
+def test_ruined_when_layout_cannot_be_covered():
+    solver = RuinSolver(BetPassLine(10), step=5)
+    dist = solver.distribution(5, 100)
+    assert dist.p_ruin == 1
+    np.testing.assert_allclose(dist.values, [5])
+    assert solver.curve(100).at(5)[0] == 1
+
+
+def test_odds_and_larger_layouts():
+    odds = RuinSolver(BetPassLine(5) + PassLineOddsMultiplier(2))
+    assert odds.step == 1
+    curve = odds.curve(400, rolls=20)
+    dist = odds.distribution(200, 400, rolls=20)
+    assert dist.mean == pytest.approx(curve.at(200)[2])
+
+    iron_cross = RuinSolver(IronCross(10))
+    curve = iron_cross.curve(600, shooters=2)
+    assert np.all(np.diff(curve.p_ruin) <= 1e-12)
+    assert np.all(curve.p_ruin + curve.p_target <= 1 + 1e-12)
+
+
+def test_errors(pass_line):
+    with pytest.raises(ValueError):
+        pass_line.curve(0)
+    with pytest.raises(ValueError):
+        pass_line.curve(100, shooters=0)
+
+    with pytest.raises(ValueError):
+        RuinSolver(Pass2Come(5), max_states=10)
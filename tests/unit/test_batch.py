@@ -0,0 +1,160 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from crapssim.batch import (
+    Checkpoint,
+    Experiment,
+    Summary,
+    run_batch,
+    run_range,
+    run_session,
+    session_seed,
+)
+from crapssim.strategy import BetPassLine, PassLineOddsMultiplier
+from crapssim.strategy.examples import IronCross, PassLinePlace68
+
+
+def _experiment(**kwargs) -> Experiment:
+    strategies = {
+        "passline": BetPassLine(5) + PassLineOddsMultiplier(2),
+        "place68": PassLinePlace68(5),
+        "ironcross": IronCross(5),
+    }
+    return Experiment(strategies, max_shooter=3, **kwargs)
+
+
+class _Interrupted(Exception):
+    pass
+
+
+def _interrupt_after(n_sessions: int):
+    def progress(completed: int, total: int) -> None:
+        if completed >= n_sessions:
+            raise _Interrupted
+
+    return progress
+
+
+def test_session_seed_is_deterministic_and_distinct():
+    seeds = [session_seed(7, index) for index in range(100)]
+    assert seeds == [session_seed(7, index) for index in range(100)]
+    assert len(set(seeds)) == 100
+    assert session_seed(7, 0) != session_seed(8, 0)
+
+
+def test_run_session_does_not_depend_on_previous_sessions():
+    experiment = _experiment()
+    reused = experiment.build_table()
+    for index in range(5):
+        run_session(reused, experiment, index)
+
+    assert run_session(reused, experiment, 9) == run_session(
+        experiment.build_table(), experiment, 9
+    )
+
+
+def test_run_session_outcomes():
+    experiment = _experiment(bankroll=200)
+    session = run_session(experiment.build_table(), experiment, 0)
+
+    assert session.index == 0
+    assert session.n_shooters <= 3
+    assert [p.name for p in session.players] == ["passline", "place68", "ironcross"]
+    for player in session.players:
+        assert player.start == 200
+        assert player.net == player.bankroll + player.on_table - 200
+
+
+def test_experiment_settings_override_table_defaults():
+    experiment = _experiment(settings={"field_payouts": {2: 3, 12: 3}})
+    table = experiment.build_table()
+    assert table.settings["field_payouts"] == {2: 3, 12: 3}
+    assert table.settings["vig_rounding"] == "nearest_dollar"
+
+
+def test_summary_merge_matches_single_summary():
+    experiment = _experiment()
+    whole = run_range(experiment, 0, 20)
+    first = run_range(experiment, 0, 8)
+    first.merge(run_range(experiment, 8, 20))
+
+    assert first.sessions == whole.sessions == 20
+    for name in whole:
+        assert first[name].count == whole[name].count
+        assert first[name].net == pytest.approx(whole[name].net)
+        assert first[name].final.minimum == whole[name].final.minimum
+        assert first[name].n_ruined == whole[name].n_ruined
+
+
+def test_run_batch_is_independent_of_workers():
+    experiment = _experiment()
+    serial = run_batch(experiment, 40, chunk_size=7)
+    parallel = run_batch(experiment, 40, chunk_size=7, workers=2)
+
+    assert serial.n_sessions == 40
+    assert serial.aggregate == parallel.aggregate
+
+
+def test_run_batch_reuses_given_executor():
+    experiment = _experiment()
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        for start in [0, 20]:
+            serial = run_batch(experiment, 20, start=start, chunk_size=7)
+            parallel = run_batch(
+                experiment, 20, start=start, chunk_size=7, executor=executor
+            )
+            assert serial.aggregate == parallel.aggregate
+
+
+def test_run_batch_resumes_from_checkpoint(tmp_path):
+    experiment = _experiment()
+    expected = run_batch(experiment, 50, start=10, chunk_size=6)
+
+    with pytest.raises(_Interrupted):
+        run_batch(
+            experiment,
+            50,
+            start=10,
+            chunk_size=6,
+            checkpoint_dir=tmp_path,
+            checkpoint_every=0,
+            progress=_interrupt_after(20),
+        )
+    checkpoint = Checkpoint.load(tmp_path)
+    assert checkpoint.completed_ranges == [(10, 34)]
+    assert not checkpoint.done
+
+    resumed_sessions = []
+    resumed = run_batch(
+        experiment,
+        50,
+        start=10,
+        chunk_size=6,
+        checkpoint_dir=tmp_path,
+        checkpoint_every=0,
+        progress=lambda completed, total: resumed_sessions.append(completed),
+    )
+
+    assert resumed_sessions[0] == 30
+    assert resumed.aggregate == expected.aggregate
+    assert Checkpoint.load(tmp_path).done
+
+
+def test_run_batch_rejects_checkpoint_of_other_run(tmp_path):
+    run_batch(_experiment(), 10, chunk_size=5, checkpoint_dir=tmp_path)
+    with pytest.raises(ValueError):
+        run_batch(_experiment(seed_root=1), 10, chunk_size=5, checkpoint_dir=tmp_path)
+
+
+def test_checkpoint_merges_chunks_in_order():
+    checkpoint = Checkpoint("id", 0, 30, 10, next_index=0, aggregate=Summary())
+    checkpoint.add_chunk(20, 30, Summary(sessions=10))
+    checkpoint.add_chunk(10, 20, Summary(sessions=10))
+    assert checkpoint.next_index == 0
+    assert checkpoint.completed_ranges == [(10, 30)]
+
+    checkpoint.add_chunk(0, 10, Summary(sessions=10))
+    assert checkpoint.next_index == 30
+    assert checkpoint.aggregate.sessions == 30
+    assert checkpoint.done
@@ -0,0 +1,81 @@
+import pytest
+
+import crapssim
+from crapssim.batch import Experiment, ResultCache, experiment_key, run_batch, run_sweep
+from crapssim.batch import Sweep
+from crapssim.strategy import BetPassLine, PassLineOddsMultiplier
+from crapssim.strategy.examples import IronCross
+
+
+def _experiment(**kwargs) -> Experiment:
+    strategies = {
+        "passline": BetPassLine(5) + PassLineOddsMultiplier(2),
+        "ironcross": IronCross(5),
+    }
+    return Experiment(strategies, max_shooter=2, **kwargs)
+
+
+def test_experiment_key_depends_on_content():
+    key = experiment_key(_experiment())
+    assert key == experiment_key(_experiment())
+    assert key != experiment_key(_experiment(seed_root=1))
+    assert key != experiment_key(_experiment(bankroll=200))
+    assert key != experiment_key(_experiment(settings={"field_payouts": {2: 3}}))
+    other = Experiment({"passline": BetPassLine(10)}, max_shooter=2)
+    assert experiment_key(other) != experiment_key(
+        Experiment({"passline": BetPassLine(5)}, max_shooter=2)
+    )
+
+
+def test_experiment_key_depends_on_version(monkeypatch):
+    key = experiment_key(_experiment())
+    monkeypatch.setattr(crapssim, "__version__", "0.0.0")
+    assert experiment_key(_experiment()) != key
+
+
+def test_repeated_run_is_served_from_cache(tmp_path):
+    cache = ResultCache(tmp_path)
+    first = cache.run(_experiment(), 20, chunk_size=5)
+
+    assert cache.ranges(_experiment()) == [(0, 20)]
+    assert cache.missing(_experiment(), 0, 20) == []
+    second = cache.run(_experiment(), 20, chunk_size=5)
+    assert second.aggregate == first.aggregate
+    assert first.aggregate == run_batch(_experiment(), 20, chunk_size=5).aggregate
+
+
+def test_extended_run_only_computes_missing_sessions(tmp_path):
+    cache = ResultCache(tmp_path)
+    experiment = _experiment()
+    cache.run(experiment, 20)
+    cache.run(experiment, 10, start=30)
+
+    assert cache.missing(experiment, 0, 50) == [(20, 30), (40, 50)]
+    extended = cache.run(experiment, 50)
+    assert cache.ranges(experiment) == [(0, 50)]
+
+    expected = run_batch(experiment, 50).aggregate
+    assert extended.aggregate.sessions == 50
+    for name in expected:
+        assert extended.aggregate[name].count == expected[name].count
+        assert extended.aggregate[name].net == pytest.approx(expected[name].net)
+        assert extended.aggregate[name].n_ruined == expected[name].n_ruined
+
+
+def test_get_requires_fully_cached_range(tmp_path):
+    cache = ResultCache(tmp_path)
+    experiment = _experiment()
+    assert cache.get(experiment, 0, 10) is None
+
+    cache.run(experiment, 10)
+    cache.run(experiment, 10, start=10)
+    assert cache.get(experiment, 0, 30) is None
+    assert cache.get(experiment, 0, 20).sessions == 20
+    assert cache.get(experiment, 10, 20).sessions == 10
+
+
+def test_cache_is_a_sweep_result_store(tmp_path):
+    sweep = Sweep(IronCross, params={"base_amount": [5, 10]}, max_shooter=2)
+    run_sweep(sweep, 10, cache=ResultCache(tmp_path))
+    rows = run_sweep(sweep, 10, cache=ResultCache(tmp_path)).rows
+    assert [row["cached"] for row in rows] == [True, True]
@@ -0,0 +1,85 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from crapssim.analysis import analyze_layout
+from crapssim.batch import (
+    ControlVariateSummary,
+    Experiment,
+    PlayerOutcome,
+    SessionResult,
+    run_batch,
+    run_session,
+)
+from crapssim.strategy import BetPassLine, PassLineOddsMultiplier
+from crapssim.strategy.examples import PassLinePlace68
+
+
+def session(net, controls):
+    player = PlayerOutcome("p", 100, 100 + net, 0.0, controls=controls)
+    return SessionResult(0, 10, 1, (player,))
+
+
+def test_controls_recorded_only_when_requested():
+    experiment = Experiment({"pass": BetPassLine(5)}, max_shooter=2)
+    table = experiment.build_table()
+    plain = run_session(table, experiment, 0).players[0]
+    controlled = run_session(table, experiment, 0, controls=True).players[0]
+    assert plain.controls == {}
+    assert plain.action == controlled.action
+    assert plain.action["PassLine"] == plain.wagered
+    assert set(controlled.controls) == {"PassLine"}
+    # Pass line decisions have a known expectation, roll by roll
+    assert controlled.controls["PassLine"] != pytest.approx(controlled.net)
+
+
+def test_exact_fit():
+    summary = ControlVariateSummary()
+    rng = np.random.default_rng(1)
+    for _ in range(50):
+        z = rng.normal(size=2)
+        summary.update(session(3.0 + 2 * z[0] - z[1], {"A": z[0], "B": z[1]}))
+    stats = summary["p"]
+    mean, stderr = stats.estimate()
+    assert mean == pytest.approx(3.0)
+    assert stderr == pytest.approx(0.0, abs=1e-6)
+    assert stats.coefficients == pytest.approx({"A": 2.0, "B": -1.0})
+    assert stats.plain()[1] > 0
+
+
+def test_merge_matches_single_summary():
+    sessions = [
+        session(5.0, {"A": 1.0}),
+        session(-5.0, {"B": -2.0}),
+        session(10.0, {"A": 2.0, "B": 1.0}),
+        session(-1.0, {}),
+        session(0.0, {"A": -1.0, "B": 0.5}),
+    ]
+    whole = ControlVariateSummary()
+    for s in sessions:
+        whole.update(s)
+    left, right = ControlVariateSummary(), ControlVariateSummary()
+    for s in sessions[:2]:
+        left.update(s)
+    for s in sessions[2:]:
+        right.update(s)
+    right.merge(pickle.loads(pickle.dumps(left)))
+    assert right.sessions == whole.sessions
+    assert right["p"].estimate() == pytest.approx(whole["p"].estimate())
+    assert right["p"].plain() == pytest.approx(whole["p"].plain())
+    assert right["p"].coefficients == pytest.approx(whole["p"].coefficients)
+
+
+@pytest.mark.parametrize(
+    "strategy",
+    [BetPassLine(5) + PassLineOddsMultiplier(2), PassLinePlace68(5)],
+)
+def test_unbiased_with_tighter_interval(strategy):
+    experiment = Experiment({"s": strategy}, bankroll=10_000, max_shooter=2)
+    summary = run_batch(experiment, 400, aggregate=ControlVariateSummary).aggregate
+    stats = summary["s"]
+    exact = 2 * analyze_layout(strategy).win_per_shooter
+    mean, stderr = stats.estimate()
+    assert abs(mean - exact) < 4 * stderr
+    assert stats.variance_reduction() > 20
@@ -0,0 +1,85 @@
+import functools
+
+import numpy as np
+import pytest
+
+from crapssim.batch import (
+    Experiment,
+    FanChart,
+    PlayerOutcome,
+    SessionResult,
+    run_batch,
+    run_range,
+)
+from crapssim.strategy import BetPassLine, PassLineOddsMultiplier
+from crapssim.strategy.examples import IronCross
+
+
+def _experiment(**kwargs) -> Experiment:
+    strategies = {
+        "passline": BetPassLine(5) + PassLineOddsMultiplier(2),
+        "ironcross": IronCross(5),
+    }
+    return Experiment(strategies, bankroll=100, max_shooter=3, **kwargs)
+
+
+def _session(index, path, shooters):
+    player = PlayerOutcome("a", start=path[0], bankroll=path[-1], on_table=0)
+    return SessionResult(
+        index, len(path) - 1, max(shooters, default=0), (player,), (path,), shooters
+    )
+
+
+def test_short_sessions_keep_their_final_wealth():
+    chart = FanChart(horizon=4, buffer_size=1)
+    chart.update(_session(0, (10.0, 12.0), (1,)))
+    chart.update(_session(1, (10.0, 8.0, 6.0, 4.0, 2.0, 0.0), (1, 1, 2, 2, 2)))
+
+    np.testing.assert_array_equal(chart.active, [2, 2, 1, 1, 1])
+    np.testing.assert_allclose(chart.mean("a"), [10, 10, 9, 8, 7])
+    bands = chart.bands("a", [0, 1])
+    np.testing.assert_array_equal(bands, [[10, 8, 6, 4, 2], [10, 12, 12, 12, 12]])
+
+
+def test_shooter_axis_uses_wealth_at_end_of_each_turn():
+    chart = FanChart(horizon=3, axis="shooter")
+    chart.update(_session(0, (10.0, 8.0, 6.0, 4.0, 2.0, 5.0), (1, 1, 2, 2, 3)))
+
+    np.testing.assert_array_equal(chart.active, [1, 1, 1, 1])
+    np.testing.assert_array_equal(chart.bands("a", [0.5])[0], [10, 6, 2, 5])
+
+
+def test_fan_chart_bands_match_exact_quantiles():
+    experiment = _experiment()
+    chart = run_range(experiment, 0, 50, functools.partial(FanChart, horizon=30))
+    assert chart.names == ["passline", "ironcross"]
+    assert chart.sessions == 50
+
+    # With fewer values than the sketch size, quantiles are exact
+    bands = chart.bands("ironcross")
+    assert bands.shape == (5, 31)
+    assert np.all(np.diff(bands, axis=0) >= 0)
+    assert np.all(bands[:, 0] == 100)
+    assert chart.mean("passline")[0] == 100
+    assert chart.active[0] == 50 and np.all(np.diff(chart.active) <= 0)
+
+
+def test_fan_chart_merge_matches_single_run():
+    experiment = _experiment()
+    aggregate = functools.partial(FanChart, horizon=20, buffer_size=4)
+    whole = run_range(experiment, 0, 30, aggregate)
+    merged = run_batch(
+        experiment, 30, chunk_size=7, workers=2, aggregate=aggregate
+    ).aggregate
+
+    np.testing.assert_array_equal(merged.active, whole.active)
+    for name in whole.names:
+        np.testing.assert_allclose(merged.mean(name), whole.mean(name))
+        np.testing.assert_array_equal(merged.bands(name), whole.bands(name))
+
+
+def test_fan_chart_rejects_mismatched_merge_and_axis():
+    with pytest.raises(ValueError):
+        FanChart(axis="time")
+    with pytest.raises(ValueError):
+        FanChart(horizon=5).merge(FanChart(horizon=6))
@@ -0,0 +1,91 @@
+import functools
+import pickle
+
+import pytest
+
+from crapssim.analysis import fire_probabilities
+from crapssim.batch import (
+    Experiment,
+    ImportanceSummary,
+    PlayerOutcome,
+    SessionResult,
+    run_batch,
+    run_session,
+)
+from crapssim.dice import TiltedDice
+from crapssim.strategy.single_bet import BetFire, BetPassLine
+
+
+def tilted_fire(seven: float) -> Experiment:
+    probabilities = TiltedDice.from_totals({7: seven}).probabilities
+    return Experiment(
+        {"fire": BetFire(1)},
+        bankroll=100,
+        max_shooter=1,
+        dice_probabilities=tuple(probabilities),
+    )
+
+
+def session(weight, final, completed=False):
+    player = PlayerOutcome("p", 100, final, 0.0, completed=completed)
+    return SessionResult(0, 10, 1, (player,), weight=weight)
+
+
+def test_weighted_estimates():
+    summary = ImportanceSummary()
+    summary.update(session(0.5, 250))
+    summary.update(session(1.5, 50, completed=True))
+    stats = summary["p"]
+    assert stats.estimate("target")[0] == pytest.approx(0.25)
+    assert stats.estimate("ruin")[0] == pytest.approx(0.75)
+    assert stats.estimate("final")[0] == pytest.approx((125 + 75) / 2)
+    assert summary.mean_weight == pytest.approx(1)
+    assert summary.effective_sessions == pytest.approx(4 / 2.5)
+    assert summary.max_weight_share == pytest.approx(0.75)
+    with pytest.raises(ValueError):
+        stats.estimate("double")
+    with pytest.raises(ValueError):
+        stats.variance_reduction("final")
+
+
+def test_merge_matches_single_summary():
+    sessions = [session(w, f) for w, f in [(0.5, 250), (2.0, 90), (0.8, 210)]]
+    whole = ImportanceSummary()
+    for s in sessions:
+        whole.update(s)
+    left, right = ImportanceSummary(), ImportanceSummary()
+    left.update(sessions[0])
+    for s in sessions[1:]:
+        right.update(s)
+    left.merge(pickle.loads(pickle.dumps(right)))
+    assert left.sessions == 3
+    assert left.effective_sessions == pytest.approx(whole.effective_sessions)
+    assert left["p"].estimate() == pytest.approx(whole["p"].estimate())
+
+
+def test_fair_sessions_have_weight_one():
+    experiment = Experiment({"pass": BetPassLine(5)}, max_shooter=2)
+    result = run_session(experiment.build_table(), experiment, 0)
+    assert result.weight == 1
+    assert "dice_probabilities" not in experiment.to_dict()
+
+
+def test_tilted_experiment_round_trips():
+    experiment = tilted_fire(0.5)
+    assert Experiment.from_dict(experiment.to_dict()) == experiment
+    table = experiment.build_table()
+    result = run_session(table, experiment, 0)
+    assert result.weight == table.dice.weight != 1
+
+
+def test_tilted_dice_estimate_fire_tail_without_bias():
+    # Five or six Fire points pay at least 249 to 1
+    p = fire_probabilities()
+    exact = float(p[5] + p[6])
+    aggregate = functools.partial(ImportanceSummary, target=3.0)
+    summary = run_batch(tilted_fire(0.5), 1000, aggregate=aggregate).aggregate
+    estimate, stderr = summary["fire"].estimate("target")
+    assert abs(estimate - exact) < 4 * stderr
+    assert summary["fire"].variance_reduction("target") > 2
+    assert summary.effective_sessions < summary.sessions
+    assert summary.mean_weight == pytest.approx(1, abs=0.1)
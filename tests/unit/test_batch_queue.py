@@ -0,0 +1,131 @@
+import multiprocessing
+import os
+import time
+
+import pytest
+
+from crapssim.batch import (
+    Experiment,
+    claim_shard,
+    merge_results,
+    queue_status,
+    requeue_stale,
+    run_range,
+    submit_shards,
+    work,
+)
+from crapssim.batch.__main__ import main
+from crapssim.batch.queue import _release
+from crapssim.strategy import BetPassLine, PassLineOddsMultiplier
+from crapssim.strategy.examples import PassLinePlace68
+
+
+def _experiment() -> Experiment:
+    strategies = {
+        "passline": BetPassLine(5) + PassLineOddsMultiplier(2),
+        "place68": PassLinePlace68(5),
+    }
+    return Experiment(strategies, max_shooter=3, seed_root=11)
+
+
+def test_submit_shards_writes_descriptors(tmp_path):
+    shards = submit_shards(tmp_path, _experiment(), 25, 10, start=5)
+
+    assert [(s.start, s.stop) for s in shards] == [(5, 15), (15, 25), (25, 30)]
+    assert all(s.seed_root == 11 for s in shards)
+    assert queue_status(tmp_path).pending == 3
+    with pytest.raises(FileExistsError):
+        submit_shards(tmp_path, _experiment(), 25, 10)
+
+
+def test_shard_is_claimed_once(tmp_path):
+    submit_shards(tmp_path, _experiment(), 10, 10)
+    shard, claimed = claim_shard(tmp_path)
+
+    assert (shard.start, shard.stop) == (0, 10)
+    assert claimed.exists()
+    assert claim_shard(tmp_path) is None
+
+
+def test_workers_processes_match_single_run(tmp_path):
+    experiment = _experiment()
+    submit_shards(tmp_path, experiment, 60, 5)
+
+    context = multiprocessing.get_context("spawn")
+    workers = [context.Process(target=work, args=(tmp_path,)) for _ in range(3)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=120)
+        assert worker.exitcode == 0
+
+    status = queue_status(tmp_path)
+    assert status.finished
+    assert status.done == 12
+
+    merged = merge_results(tmp_path)
+    expected = run_range(experiment, 0, 60)
+    assert merged.n_sessions == 60
+    assert merged.aggregate.sessions == 60
+    for name in expected:
+        assert merged.aggregate[name].count == expected[name].count
+        assert merged.aggregate[name].net == pytest.approx(expected[name].net)
+        assert merged.aggregate[name].final.maximum == expected[name].final.maximum
+
+
+def test_merge_results_requires_every_shard(tmp_path):
+    submit_shards(tmp_path, _experiment(), 20, 5)
+    work(tmp_path, max_shards=2)
+
+    with pytest.raises(ValueError):
+        merge_results(tmp_path)
+
+
+def test_requeue_stale_claims(tmp_path):
+    submit_shards(tmp_path, _experiment(), 10, 5)
+    _, claimed = claim_shard(tmp_path)
+    an_hour_ago = time.time() - 3600
+    os.utime(claimed, (an_hour_ago, an_hour_ago))
+    claim_shard(tmp_path)
+
+    assert requeue_stale(tmp_path, older_than=60) == 1
+    status = queue_status(tmp_path)
+    assert (status.pending, status.claimed) == (1, 1)
+
+
+def test_fresh_claim_of_old_shard_is_not_stale(tmp_path):
+    submit_shards(tmp_path, _experiment(), 5, 5)
+    an_hour_ago = time.time() - 3600
+    for path in (tmp_path / "pending").iterdir():
+        os.utime(path, (an_hour_ago, an_hour_ago))
+    claim_shard(tmp_path)
+
+    assert requeue_stale(tmp_path, older_than=60) == 0
+
+
+def test_release_keeps_claim_of_another_worker(tmp_path):
+    submit_shards(tmp_path, _experiment(), 5, 5)
+    _, first = claim_shard(tmp_path)
+    an_hour_ago = time.time() - 3600
+    os.utime(first, (an_hour_ago, an_hour_ago))
+    assert requeue_stale(tmp_path, older_than=60) == 1
+    _, second = claim_shard(tmp_path)
+
+    # The slow first worker finishes, or fails, after the shard was claimed again
+    _release(first)
+    _release(first, tmp_path / "pending" / "shard.pkl")
+    assert first != second
+    assert second.exists()
+    assert (queue_status(tmp_path).pending, queue_status(tmp_path).claimed) == (0, 1)
+
+
+def test_command_line_worker(tmp_path, capsys):
+    submit_shards(tmp_path, _experiment(), 10, 5)
+
+    main(["work", str(tmp_path)])
+    main(["status", str(tmp_path)])
+
+    assert capsys.readouterr().out.splitlines() == [
+        "Ran 2 shards",
+        "pending=0 claimed=0 done=2",
+    ]
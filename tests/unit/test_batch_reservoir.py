@@ -0,0 +1,107 @@
+import functools
+
+import numpy as np
+import pytest
+
+from crapssim.batch import (
+    Experiment,
+    PlayerOutcome,
+    SessionResult,
+    SessionPath,
+    TrajectoryReservoir,
+    run_batch,
+    run_range,
+    run_session,
+)
+from crapssim.strategy import BetPassLine, PassLineOddsMultiplier
+from crapssim.strategy.examples import IronCross
+
+
+def _experiment() -> Experiment:
+    strategies = {
+        "passline": BetPassLine(5) + PassLineOddsMultiplier(2),
+        "ironcross": IronCross(5),
+    }
+    return Experiment(strategies, bankroll=200, max_shooter=2)
+
+
+def test_run_session_records_wealth_paths():
+    experiment = _experiment()
+    table = experiment.build_table()
+    plain = run_session(table, experiment, 3)
+    session = run_session(table, experiment, 3, paths=True)
+
+    assert plain.paths is None
+    assert session.players == plain.players
+    for player, path in zip(session.players, session.paths):
+        assert len(path) == session.n_rolls + 1
+        assert path[0] == 200
+        assert path[-1] == pytest.approx(player.final)
+
+
+def test_session_path_statistics():
+    path = SessionPath(0, np.array([100.0, 120.0, 90.0, 110.0, 80.0, 95.0]))
+    assert path.n_rolls == 5
+    assert path.final == 95
+    assert path.max_drawdown == 40
+
+
+def test_reservoir_keeps_k_sessions_and_extremes():
+    experiment = _experiment()
+    reservoir = run_range(
+        experiment, 0, 60, functools.partial(TrajectoryReservoir, k=10, n_extremes=3)
+    )
+    sample = reservoir.sample("passline")
+
+    assert reservoir.sessions == 60
+    assert len(sample) == 10
+    assert [p.index for p in sample] == sorted(p.index for p in sample)
+    assert [p.index for p in reservoir.sample("ironcross")] == [p.index for p in sample]
+
+    table = experiment.build_table()
+    sessions = [run_session(table, experiment, i) for i in range(60)]
+    finals = sorted((s.players[0].final, s.index) for s in sessions)
+    lowest = reservoir.lowest("passline")
+    assert [p.index for p in lowest] == [index for _, index in finals[:3]]
+    assert [p.final for p in lowest] == pytest.approx([f for f, _ in finals[:3]])
+    highest = [p.final for p in reservoir.highest("passline")]
+    assert highest == sorted(highest, reverse=True)
+    assert highest[0] == pytest.approx(finals[-1][0])
+    drawdowns = [p.max_drawdown for p in reservoir.deepest("ironcross")]
+    assert drawdowns == sorted(drawdowns, reverse=True)
+
+
+def test_reservoir_does_not_depend_on_chunking():
+    experiment = _experiment()
+    aggregate = functools.partial(TrajectoryReservoir, k=8, n_extremes=2)
+    whole = run_range(experiment, 0, 40, aggregate)
+    parallel = run_batch(
+        experiment, 40, chunk_size=7, workers=2, aggregate=aggregate
+    ).aggregate
+
+    for name in ("passline", "ironcross"):
+        for get in ("sample", "lowest", "highest", "deepest"):
+            expected = getattr(whole, get)(name)
+            paths = getattr(parallel, get)(name)
+            assert [p.index for p in paths] == [p.index for p in expected]
+            for path, expected_path in zip(paths, expected):
+                np.testing.assert_array_equal(path.wealth, expected_path.wealth)
+
+
+def test_reservoir_sample_is_roughly_uniform():
+    reservoir = TrajectoryReservoir(k=100)
+    player = PlayerOutcome("a", start=100, bankroll=100, on_table=0)
+    for index in range(2000):
+        reservoir.update(SessionResult(index, 0, 0, (player,), paths=((100.0,),)))
+
+    indexes = [path.index for path in reservoir.sample("a")]
+    assert len(set(indexes)) == 100
+    assert 700 < np.mean(indexes) < 1300
+    assert min(indexes) < 200 and max(indexes) > 1800
+
+
+def test_reservoir_rejects_sessions_without_paths():
+    experiment = _experiment()
+    session = run_session(experiment.build_table(), experiment, 0)
+    with pytest.raises(ValueError):
+        TrajectoryReservoir().update(session)
@@ -0,0 +1,96 @@
+import pytest
+
+from crapssim.batch import Experiment, run_range, run_until_precise
+from crapssim.strategy import BetPassLine, BetPlace, PassLineOddsMultiplier
+
+
+def _experiment() -> Experiment:
+    strategies = {
+        "passline": BetPassLine(5),
+        "odds": BetPassLine(5) + PassLineOddsMultiplier(3),
+    }
+    return Experiment(strategies, max_shooter=2, seed_root=4)
+
+
+def test_stops_when_precision_is_reached():
+    history = []
+    result = run_until_precise(
+        _experiment(), half_width=4.0, batch_size=50, progress=history.append
+    )
+
+    assert result.reached
+    assert result.reason == "precision"
+    assert result.achieved <= 4.0
+    assert result.batch.n_sessions == 50 * len(history)
+    # The previous batch had not reached the target
+    if len(history) > 1:
+        assert max(e.half_width for e in history[-2].values()) > 4.0
+
+
+def test_estimates_match_summary_of_same_sessions():
+    result = run_until_precise(_experiment(), half_width=1e-9, max_sessions=60)
+    expected = run_range(_experiment(), 0, 60)
+
+    assert result.reason == "sessions"
+    assert not result.reached
+    for name in ["passline", "odds"]:
+        assert result.estimates[name].value == pytest.approx(expected[name].net)
+        assert result.estimates[name].low < result.estimates[name].high
+
+
+def test_parallel_run_matches_serial_run():
+    kwargs = dict(half_width=1e-9, batch_size=20, max_sessions=60, chunk_size=7)
+    serial = run_until_precise(_experiment(), **kwargs)
+    parallel = run_until_precise(_experiment(), workers=2, **kwargs)
+
+    assert parallel.batch.n_sessions == 60
+    assert parallel.batch.aggregate == serial.batch.aggregate
+
+
+def test_noisier_strategy_needs_more_sessions():
+    easy = run_until_precise(
+        _experiment(), half_width=3.0, strategies=["passline"], batch_size=25
+    )
+    hard = run_until_precise(
+        _experiment(), half_width=3.0, strategies=["odds"], batch_size=25
+    )
+    assert easy.batch.n_sessions < hard.batch.n_sessions
+
+
+def test_net_per_wagered():
+    strategies = {"place6": BetPlace({6: 6}, skip_point=False)}
+    experiment = Experiment(strategies, max_shooter=3)
+    result = run_until_precise(
+        experiment, half_width=0.05, metric="net_per_wagered", batch_size=200
+    )
+
+    # Place 6 pays 7:6, a house edge of 1/66 per decided bet
+    estimate = result.estimates["place6"]
+    assert result.reached
+    assert estimate.low - 0.02 < -1 / 66 < estimate.high + 0.02
+
+
+def test_roll_and_time_budgets():
+    by_rolls = run_until_precise(
+        _experiment(), half_width=1e-9, batch_size=10, max_rolls=100
+    )
+    assert by_rolls.reason == "rolls"
+    assert (
+        by_rolls.batch.aggregate.rolls.count * by_rolls.batch.aggregate.rolls.mean
+        >= 100
+    )
+
+    by_time = run_until_precise(
+        _experiment(), half_width=1e-9, batch_size=10, max_seconds=0
+    )
+    assert by_time.reason == "time"
+    assert by_time.batch.n_sessions == 10
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"half_width": 0}, {"batch_size": 0}, {"max_sessions": 0}]
+)
+def test_invalid_arguments(kwargs):
+    kwargs = {"half_width": 1.0, **kwargs}
+    with pytest.raises(ValueError):
+        run_until_precise(_experiment(), **kwargs)
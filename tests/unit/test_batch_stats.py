@@ -0,0 +1,130 @@
+import math
+
+import numpy as np
+import pytest
+
+from crapssim.batch import Moments, QuantileSketch, StrategyStats, Summary
+from crapssim.batch.experiment import PlayerOutcome, SessionResult
+
+
+def _skewness(values: np.ndarray) -> float:
+    centered = values - values.mean()
+    return np.mean(centered**3) / np.mean(centered**2) ** 1.5
+
+
+def test_moments_match_numpy():
+    values = np.random.default_rng(0).lognormal(size=1000)
+    moments = Moments()
+    for value in values:
+        moments.add(float(value))
+
+    assert moments.count == 1000
+    assert moments.mean == pytest.approx(values.mean())
+    assert moments.variance == pytest.approx(values.var(ddof=1))
+    assert moments.skewness == pytest.approx(_skewness(values))
+    assert (moments.minimum, moments.maximum) == (values.min(), values.max())
+
+
+@pytest.mark.parametrize("split", [0, 1, 250, 999, 1000])
+def test_moments_merge_matches_single_stream(split):
+    values = np.random.default_rng(1).exponential(size=1000) * 100 + 1e6
+    first, second, whole = Moments(), Moments(), Moments()
+    for value in values[:split]:
+        first.add(float(value))
+    for value in values[split:]:
+        second.add(float(value))
+    for value in values:
+        whole.add(float(value))
+    first.merge(second)
+
+    assert first.count == whole.count
+    assert first.mean == pytest.approx(whole.mean)
+    assert first.variance == pytest.approx(whole.variance)
+    assert first.skewness == pytest.approx(whole.skewness)
+    assert first.maximum == whole.maximum
+
+
+def test_moments_of_few_values():
+    moments = Moments()
+    assert math.isnan(moments.mean)
+    moments.add(3.0)
+    assert moments.mean == 3.0
+    assert math.isnan(moments.variance)
+    assert math.isnan(moments.skewness)
+
+
+def test_sketch_is_exact_for_small_streams():
+    sketch = QuantileSketch()
+    sketch.extend(range(100, 0, -1))
+    assert sketch.quantiles([0, 0.25, 0.5, 1]) == [1, 25, 50, 100]
+
+
+def test_sketch_memory_is_bounded_and_accurate():
+    values = np.random.default_rng(2).normal(size=100_000)
+    sketch = QuantileSketch(k=200)
+    sketch.extend(values.tolist())
+
+    n_items = sum(len(items) for items in sketch.levels)
+    assert sketch.count == 100_000
+    assert n_items < 1000
+    for q in [0.05, 0.25, 0.5, 0.75, 0.95]:
+        rank = np.mean(values <= sketch.quantile(q))
+        assert rank == pytest.approx(q, abs=0.02)
+
+
+def test_sketch_merge():
+    values = np.random.default_rng(3).uniform(size=40_000)
+    parts = [QuantileSketch(k=100) for _ in range(4)]
+    for part, chunk in zip(parts, np.split(values, 4)):
+        part.extend(chunk.tolist())
+    merged = parts[0]
+    for part in parts[1:]:
+        merged.merge(part)
+
+    assert merged.count == 40_000
+    assert merged.quantile(0.5) == pytest.approx(0.5, abs=0.03)
+    assert merged.quantile(0.9) == pytest.approx(0.9, abs=0.03)
+
+
+def test_sketch_rejects_bad_quantiles():
+    with pytest.raises(ValueError):
+        QuantileSketch().quantile(0.5)
+    sketch = QuantileSketch()
+    sketch.add(1.0)
+    with pytest.raises(ValueError):
+        sketch.quantile(1.5)
+
+
+def _outcome(final: float, completed: bool = False) -> PlayerOutcome:
+    return PlayerOutcome(
+        "s", start=100, bankroll=final, on_table=0, completed=completed
+    )
+
+
+def test_strategy_stats_ruin_and_target():
+    stats = StrategyStats()
+    for outcome in [
+        _outcome(0, completed=True),
+        _outcome(3, completed=True),
+        _outcome(50),
+        _outcome(200),
+        _outcome(250),
+    ]:
+        stats.add(outcome)
+
+    assert stats.count == 5
+    assert stats.p_ruin == pytest.approx(0.4)
+    assert stats.p_target == pytest.approx(0.4)
+    assert stats.net == pytest.approx(0.6)
+    assert stats.quantiles([0.5]) == [50]
+
+
+def test_summary_tracks_strategies():
+    summary = Summary(target=1.5)
+    summary.update(SessionResult(0, 10, 1, (_outcome(160),)))
+    summary.update(SessionResult(1, 20, 2, (_outcome(40),)))
+
+    assert summary.sessions == 2
+    assert summary.rolls.mean == 15
+    assert list(summary) == ["s"]
+    assert summary["s"].p_target == 0.5
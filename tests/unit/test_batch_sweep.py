@@ -0,0 +1,140 @@
+import csv
+
+import pytest
+
+from crapssim.batch import Sweep, run_range, run_sweep
+from crapssim.bet import PassLine
+from crapssim.rules import CraplessRules
+from crapssim.strategy import BetPassLine, PassLineOddsMultiplier
+from crapssim.strategy.examples import IronCross
+
+
+def _passline_odds(multiplier: float, amount: float = 5):
+    return BetPassLine(amount) + PassLineOddsMultiplier(multiplier)
+
+
+class _MemoryStore:
+    def __init__(self):
+        self.results = {}
+        self.gets = 0
+
+    def get(self, experiment, start, stop):
+        self.gets += 1
+        return self.results.get((repr(experiment), start, stop))
+
+    def put(self, experiment, start, stop, summary):
+        self.results[(repr(experiment), start, stop)] = summary
+
+
+def _sweep(**kwargs) -> Sweep:
+    return Sweep(
+        _passline_odds,
+        params={"multiplier": [1, 2, 3]},
+        bankroll=[100, 300],
+        max_shooter=2,
+        **kwargs,
+    )
+
+
+def test_grid_expands_every_combination():
+    sweep = Sweep(
+        IronCross,
+        params={"base_amount": [5, 10]},
+        bankroll=[200, 300, 500],
+        settings={"vig_rounding": ["none", "ceil_dollar"]},
+        rules=[None, CraplessRules()],
+    )
+    points = sweep.grid()
+
+    assert len(points) == 2 * 3 * 2 * 2
+    assert points[0].params == {"base_amount": 5}
+    assert points[0].settings == {"vig_rounding": "none"}
+    assert points[-1].columns() == {
+        "base_amount": 10,
+        "bankroll": 500,
+        "vig_rounding": "ceil_dollar",
+        "rules": "CraplessRules",
+    }
+
+
+@pytest.mark.parametrize(
+    "params, settings",
+    [
+        ({"bankroll": [5]}, {}),
+        ({"net": [5]}, {}),
+        ({}, {"rules": ["x"]}),
+        ({}, {"p_ruin": [0.5]}),
+        ({"vig_rounding": ["none"]}, {"vig_rounding": ["none"]}),
+    ],
+)
+def test_grid_rejects_clashing_columns(params, settings):
+    sweep = Sweep(IronCross, params=params, settings=settings)
+    with pytest.raises(ValueError):
+        sweep.grid()
+
+
+def test_random_design_is_reproducible():
+    sweep = Sweep(
+        _passline_odds,
+        params={"multiplier": lambda rng: float(rng.uniform(1, 5)), "amount": [5, 10]},
+        bankroll=[200, 300],
+    )
+    points = sweep.random(10, seed=3)
+
+    assert points == sweep.random(10, seed=3)
+    assert all(1 <= p.params["multiplier"] <= 5 for p in points)
+    assert {p.bankroll for p in points} <= {200, 300}
+    with pytest.raises(TypeError):
+        sweep.grid()
+
+
+def test_run_sweep_rows_match_individual_runs():
+    sweep = _sweep()
+    result = run_sweep(sweep, 30, chunk_size=10)
+
+    assert len(result.rows) == 6
+    for point, row in zip(sweep.grid(), result.rows):
+        (stats,) = run_range(sweep.experiment(point), 0, 30).strategies.values()
+        assert row["multiplier"] == point.params["multiplier"]
+        assert row["bankroll"] == point.bankroll
+        assert row["sessions"] == 30
+        assert row["net"] == pytest.approx(stats.net)
+        assert row["p_ruin"] == stats.p_ruin
+        assert row["q05"] <= row["q50"] <= row["q95"]
+        assert not row["cached"]
+
+
+def test_run_sweep_shares_dice_across_configurations():
+    sweep = Sweep(_passline_odds, params={"multiplier": [2, 2]}, max_shooter=2)
+    first, second = run_sweep(sweep, 20).rows
+    assert first["net"] == second["net"]
+
+
+def test_run_sweep_in_parallel_matches_serial():
+    serial = run_sweep(_sweep(), 20, chunk_size=7)
+    parallel = run_sweep(_sweep(), 20, chunk_size=7, workers=2)
+    assert parallel.rows == serial.rows
+
+
+def test_run_sweep_skips_cached_configurations():
+    store = _MemoryStore()
+    sweep = _sweep()
+    first = run_sweep(sweep, 20, sweep.grid()[:4], cache=store)
+    second = run_sweep(sweep, 20, cache=store)
+
+    assert len(store.results) == 6
+    assert [row["cached"] for row in second.rows] == [True] * 4 + [False] * 2
+    for row, cached_row in zip(first.rows, second.rows):
+        assert row["net"] == cached_row["net"]
+
+
+def test_sweep_result_to_csv(tmp_path):
+    result = run_sweep(_sweep(), 5)
+    path = tmp_path / "sweep.csv"
+    result.to_csv(path)
+
+    with open(path) as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 6
+    assert list(rows[0])[:3] == ["multiplier", "bankroll", "rules"]
+    assert "p_target" in rows[0]
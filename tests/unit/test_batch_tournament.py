@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+
+from crapssim.batch import CovarianceMatrix, Experiment, PairedNet, run_tournament
+from crapssim.strategy import BetDontPass, BetPassLine
+from crapssim.strategy.single_bet import BetField
+
+
+def _experiment() -> Experiment:
+    candidates = {
+        "passline": BetPassLine(5),
+        "dontpass": BetDontPass(5),
+        "field25": BetField(25),
+        "field50": BetField(50),
+    }
+    return Experiment(candidates, bankroll=500, max_shooter=3, seed_root=2)
+
+
+def test_covariance_matrix_matches_numpy():
+    values = np.random.default_rng(0).normal(size=(200, 3))
+    first, second = CovarianceMatrix(3), CovarianceMatrix(3)
+    for row in values[:70]:
+        first.add(row)
+    for row in values[70:]:
+        second.add(row)
+    first.merge(second)
+
+    np.testing.assert_allclose(first.mean, values.mean(axis=0))
+    np.testing.assert_allclose(first.covariance, np.cov(values, rowvar=False))
+    diff = values[:, 0] - values[:, 2]
+    assert first.difference_stderr(0, 2) == pytest.approx(
+        diff.std(ddof=1) / np.sqrt(200)
+    )
+    subset = first.subset([2, 0])
+    np.testing.assert_allclose(subset.mean, values.mean(axis=0)[[2, 0]])
+
+
+def test_paired_net_rejects_mismatched_merge():
+    with pytest.raises(ValueError):
+        PairedNet(("a", "b")).merge(PairedNet(("a", "c")))
+
+
+def test_tournament_eliminates_dominated_candidates():
+    rounds = []
+    result = run_tournament(
+        _experiment(),
+        round_size=40,
+        max_rounds=4,
+        progress=lambda n_round, alive: rounds.append(alive),
+    )
+
+    assert result.rounds == len(rounds) <= 4
+    assert {"field25", "field50"}.isdisjoint(result.survivors)
+    assert "field50" in [s.name for s in result.ranking[-2:]]
+    assert [s.name for s in result.ranking[: len(result.survivors)]] == sorted(
+        result.survivors,
+        key=lambda n: -next(s.net for s in result.ranking if s.name == n),
+    )
+    assert result.candidate_sessions < result.uniform_sessions
+    assert 0 < result.saved < 1
+    for standing in result.ranking:
+        assert standing.low <= standing.net <= standing.high
+        assert standing.sessions % 40 == 0
+
+
+def test_tournament_halving():
+    result = run_tournament(_experiment(), round_size=20, max_rounds=5, halving=True)
+
+    assert len(result.survivors) == 1
+    assert result.rounds == 2
+    assert result.ranking[0].eliminated is None
+    assert result.ranking[1].eliminated == 2
+    assert result.ranking[-1].eliminated == 1
+
+
+def test_tournament_halving_keeps_n_survivors():
+    candidates = {f"passline{i}": BetPassLine(5) for i in range(5)}
+    experiment = Experiment(candidates, bankroll=500, max_shooter=3, seed_root=2)
+    result = run_tournament(
+        experiment, round_size=20, max_rounds=5, halving=True, n_survivors=4
+    )
+
+    assert result.rounds == 1
+    assert len(result.survivors) == 4
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"round_size": 0},
+        {"max_rounds": 0},
+        {"n_survivors": 0},
+        {"confidence": 0},
+        {"confidence": 1},
+    ],
+)
+def test_tournament_invalid_arguments(kwargs):
+    with pytest.raises(ValueError):
+        run_tournament(_experiment(), **kwargs)
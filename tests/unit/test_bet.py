@@ -1,5 +1,6 @@
 import math
 import copy
+import pickle
 
 import numpy as np
 import pytest
@@ -1664,3 +1665,45 @@ def test_lay_allows_crapless_only_numbers_in_crapless_mode(number):
 
     assert player.has_bets(Lay)
     assert player.bankroll == 10
+
+
+@pytest.mark.parametrize(
+    "bet",
+    [
+        PassLine(5),
+        Come(5, 6),
+        DontCome(5, 4),
+        Odds(PassLine, 6, 10),
+        Odds(DontCome, 4, 12, always_working=False),
+        Place(6, 12),
+        Buy(4, 25, always_working=True),
+        Lay(9, 30),
+        Put(8, 10),
+        Hop((2, 5), 1),
+        crapssim.bet.HardWay(8, 5),
+        crapssim.bet.Field(5),
+        crapssim.bet.Fire(1),
+        crapssim.bet.Small(2),
+    ],
+)
+def test_pickle_round_trip(bet):
+    unpickled = pickle.loads(pickle.dumps(bet))
+
+    assert type(unpickled) is type(bet)
+    assert unpickled == bet
+    assert vars(unpickled) == vars(bet)
+
+
+def test_pickle_box_number_bet_drops_derived_attributes():
+    assert len(pickle.dumps(Place(6, 12))) < len(pickle.dumps(vars(Place(6, 12))))
+
+
+def test_copy_fire_tracks_points_independently():
+    bet = crapssim.bet.Fire(1)
+    bet.points_made.add(4)
+
+    copied = copy.copy(bet)
+    copied.points_made.add(5)
+
+    assert bet.points_made == {4}
+    assert copied.points_made == {4, 5}
@@ -1,6 +1,10 @@
+import pickle
+
 import pytest
 
-from crapssim.dice import Dice
+import numpy as np
+
+from crapssim.dice import Dice, TiltedDice
 
 
 @pytest.fixture
@@ -54,3 +58,79 @@ def test_roll_seed_idential(seed):
     d2.roll()
     assert d1.result == d2.result
     assert d1.total == d2.total
+
+
+@pytest.mark.parametrize("seed", [8, 15, 21234, 0])
+def test_reset_matches_fresh_dice(seed):
+    d1 = Dice(seed)
+    for _ in range(5):
+        d1.roll()
+    d1.reset(seed)
+
+    assert (d1.n_rolls, d1.result) == (0, None)
+
+    d2 = Dice(seed)
+    for _ in range(5):
+        d1.roll()
+        d2.roll()
+        assert d1.result == d2.result
+
+
+def test_pickle_continues_sequence():
+    d1 = Dice(8)
+    d1.roll()
+    d2 = pickle.loads(pickle.dumps(d1))
+
+    assert (d2.n_rolls, d2.result) == (1, d1.result)
+    for _ in range(5):
+        d1.roll()
+        d2.roll()
+        assert d1.result == d2.result
+
+
+def test_unpickle_rejects_unknown_version():
+    version, *state = Dice(8).__getstate__()
+    with pytest.raises(ValueError):
+        Dice().__setstate__((version + 1, *state))
+
+
+def test_tilted_dice_track_likelihood_ratio():
+    dice = TiltedDice.from_totals({7: 0.5, 6: 2}, seed=3)
+    assert dice.probabilities.sum() == pytest.approx(1)
+    expected = 0.0
+    for _ in range(50):
+        dice.roll()
+        p = dice.probabilities[6 * (dice.result[0] - 1) + dice.result[1] - 1]
+        expected += np.log(1 / 36 / p)
+    assert dice.log_weight == pytest.approx(expected)
+    assert dice.weight == pytest.approx(np.exp(expected))
+
+    dice.fixed_roll((3, 4))
+    assert dice.log_weight == pytest.approx(expected)
+    dice.reset(3)
+    assert (dice.n_rolls, dice.weight) == (0, 1)
+
+
+def test_fair_tilted_dice_have_weight_one():
+    dice = TiltedDice(np.ones((6, 6)), seed=1)
+    for _ in range(20):
+        dice.roll()
+    assert dice.log_weight == pytest.approx(0, abs=1e-12)
+
+
+def test_tilted_dice_pickle_continues_sequence():
+    d1 = TiltedDice.from_totals({7: 0.5}, seed=8)
+    d1.roll()
+    d2 = pickle.loads(pickle.dumps(d1))
+    assert d2.log_weight == d1.log_weight
+    for _ in range(5):
+        d1.roll()
+        d2.roll()
+        assert d1.result == d2.result
+    assert d2.weight == d1.weight
+
+
+@pytest.mark.parametrize("probabilities", [np.ones(35), np.r_[0, np.ones(35)]])
+def test_tilted_dice_need_every_outcome(probabilities):
+    with pytest.raises(ValueError):
+        TiltedDice(probabilities)
@@ -1,6 +1,7 @@
 from crapssim import Table
-from crapssim.bet import PassLine
+from crapssim.bet import Field, PassLine, Place
 from crapssim.strategy import BetPassLine
+from crapssim.strategy.tools import NullStrategy
 
 
 def test_default_strategy():
@@ -93,3 +94,67 @@ def test_add_strategy_bets_calls_strategy_update_bets():
 
     assert strategy.called is True
     assert strategy.called_with is player
+
+
+def test_reset_restores_starting_bankroll_and_clears_bets():
+    table = Table()
+    player = table.add_player(500)
+    player.add_bet(PassLine(50))
+
+    player.reset()
+
+    assert (player.bankroll, player.bets) == (500, [])
+
+
+def test_reset_with_bankroll():
+    table = Table()
+    player = table.add_player(500)
+    player.add_bet(PassLine(50))
+
+    player.reset(bankroll=300)
+
+    assert (player.bankroll, player.bets) == (300, [])
+
+
+def test_wagered_counts_decided_bets():
+    table = Table()
+    player = table.add_player(500, strategy=NullStrategy())
+    player.add_bet(PassLine(10))
+    player.add_bet(Field(5))
+
+    table.fixed_run([(2, 2)])  # Field wins, pass line point set
+    assert player.wagered == 5
+
+    player.add_bet(Place(6, 12))
+    table.fixed_run([(3, 3), (1, 3)])  # Place 6 wins and stays up, then the point
+    assert player.wagered == 5 + 12 + 10
+
+    player.reset()
+    assert player.wagered == 0
+
+
+def test_action_and_net_by_bet_type():
+    table = Table()
+    player = table.add_player(500, strategy=NullStrategy())
+    player.record_by_type = True
+    player.roll_model = lambda bet, table: -1.0
+    player.add_bet(PassLine(10))
+    player.add_bet(Field(5))
+    table.fixed_run([(2, 2)])
+    player.add_bet(Place(6, 12))
+    table.fixed_run([(3, 3), (1, 3)])
+
+    assert player.action == {"Field": 5, "Place": 12, "PassLine": 10}
+    assert player.net_by_type == {"Field": 5, "Place": 14, "PassLine": 10}
+    # One expectation per bet per roll, decided or not
+    assert player.expected_by_type == {"Field": -1, "Place": -2, "PassLine": -3}
+
+    player.reset()
+    assert player.action == player.net_by_type == player.expected_by_type == {}
+
+    # Without record_by_type, only the total action is kept
+    player.record_by_type = False
+    player.add_bet(Field(5))
+    table.fixed_run([(2, 2)])
+    assert player.wagered == 5
+    assert player.action == player.net_by_type == {}
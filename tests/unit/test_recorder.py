@@ -0,0 +1,96 @@
+import numpy as np
+import pytest
+
+from crapssim import Table
+from crapssim.recorder import TrajectoryRecorder, load_chunk
+from crapssim.strategy import BetPassLine, BetPlace
+
+
+def _table(recorder: TrajectoryRecorder, seed: int = 3) -> Table:
+    table = Table(seed=seed)
+    table.add_player(300, BetPassLine(5), name="passline")
+    table.add_player(300, BetPlace({6: 6, 8: 6}), name="place")
+    table.recorder = recorder
+    return table
+
+
+def test_recorder_matches_iter_run():
+    recorder = TrajectoryRecorder(n_players=2, capacity=4)
+    table = _table(recorder)
+    records = list(table.iter_run(max_rolls=60))
+
+    trajectory = recorder.session(0)
+    assert recorder.n_sessions == 1
+    assert trajectory.n_rolls == len(records) == 60
+    assert recorder.capacity >= 60
+    assert trajectory.dice.tolist() == [list(r.dice) for r in records]
+    assert trajectory.total.tolist() == [sum(r.dice) for r in records]
+    assert trajectory.point.tolist() == [r.point_after or 0 for r in records]
+    np.testing.assert_allclose(
+        trajectory.bankroll_dollars, [r.bankrolls for r in records]
+    )
+    assert trajectory.dice.dtype == np.int8
+    assert trajectory.n_bets.dtype == np.uint16
+
+
+def test_recorder_counts_bets():
+    recorder = TrajectoryRecorder(n_players=1)
+    table = Table()
+    table.add_player(300, BetPlace({6: 6, 8: 6}))
+    table.recorder = recorder
+    table.fixed_run([(2, 2), (3, 3)])
+
+    assert recorder.session(0).n_bets[:, 0].tolist() == [0, 2]
+    assert recorder.session(0).point.tolist() == [4, 4]
+
+
+def test_recorder_sessions_are_views():
+    recorder = TrajectoryRecorder(n_players=2, bankroll_dtype="cents")
+    table = _table(recorder)
+    for seed in range(3):
+        table.reset(seed=seed)
+        table.run(max_rolls=20, max_shooter=2, verbose=False)
+
+    assert recorder.n_sessions == 3
+    lengths = [recorder.session(i).n_rolls for i in range(3)]
+    assert sum(lengths) == recorder.n_rows
+    assert recorder.session(-1).bankroll.base is not None
+    assert recorder.session(0).bankroll.dtype == np.int32
+
+    table.reset(seed=1)
+    table.run(max_rolls=20, max_shooter=2, verbose=False)
+    np.testing.assert_array_equal(
+        recorder.session(3).bankroll, recorder.session(1).bankroll
+    )
+
+
+def test_recorder_spills_chunks(tmp_path):
+    recorder = TrajectoryRecorder(n_players=2, spill_dir=tmp_path, spill_rows=50)
+    table = _table(recorder)
+    expected = []
+    for seed in range(6):
+        table.reset(seed=seed)
+        table.run(max_rolls=20, verbose=False)
+        expected.append(recorder.session(-1).bankroll.copy())
+    recorder.spill()
+
+    assert recorder.n_chunks == 2
+    assert recorder.n_sessions == 6
+    with pytest.raises(IndexError):
+        recorder.session(0)
+
+    loaded = [
+        trajectory.bankroll
+        for chunk in sorted(tmp_path.glob("chunk-*.starts.npy"))
+        for trajectory in load_chunk(str(chunk).removesuffix(".starts.npy"))
+    ]
+    assert len(loaded) == 6
+    for got, want in zip(loaded, expected):
+        np.testing.assert_array_equal(got, want)
+
+
+def test_recorder_rejects_wrong_player_count():
+    recorder = TrajectoryRecorder(n_players=3)
+    table = _table(recorder)
+    with pytest.raises(ValueError):
+        table.run(max_rolls=1, verbose=False)
@@ -1,4 +1,5 @@
 import enum
+import pickle
 from unittest.mock import MagicMock, call
 
 import pytest
@@ -16,6 +17,7 @@ from crapssim.bet import (
     DontPass,
     Field,
     HardWay,
+    Hop,
     Lay,
     Odds,
     PassLine,
@@ -221,6 +223,36 @@ def test_aggregate_strategy_after_roll_skips_completed(aggregate_strategy, playe
     aggregate_strategy.strategies[1].after_roll.assert_called_once_with(player)
 
 
+def test_aggregate_strategy_calls_all_reset(aggregate_strategy):
+    aggregate_strategy.strategies[0].reset = MagicMock()
+    aggregate_strategy.strategies[1].reset = MagicMock()
+
+    aggregate_strategy.reset()
+
+    aggregate_strategy.strategies[0].reset.assert_called_once_with()
+    aggregate_strategy.strategies[1].reset.assert_called_once_with()
+
+
+def test_aggregate_strategy_snapshot_and_restore():
+    aggregate = PlaceHitProgression([{6: 6.0}, {6: 12.0}]) + WinProgression(
+        Field(5), [1, 2]
+    )
+    aggregate.strategies[0].hit_count = 1
+    aggregate.strategies[1].current_progression = 1
+    state = aggregate.snapshot()
+
+    aggregate.reset()
+    aggregate.restore(state)
+
+    assert state == ((1, False), 1)
+    assert aggregate.strategies[0].hit_count == 1
+    assert aggregate.strategies[1].current_progression == 1
+
+
+def test_stateless_strategy_snapshot_is_none(base_strategy):
+    assert base_strategy.snapshot() is None
+
+
 # ── PlaceHitProgression ───────────────────────────────────────────────────────
 
 
@@ -327,6 +359,16 @@ def test_place_hit_progression_leaves_unowned_bets_untouched(player):
     assert Place(6, 12) in player.bets
 
 
+def test_place_hit_progression_reset():
+    strategy = PlaceHitProgression([{6: 6.0}, {6: 12.0}])
+    strategy.hit_count = 3
+    strategy._seven_out = True
+
+    strategy.reset()
+
+    assert (strategy.hit_count, strategy._seven_out) == (0, False)
+
+
 def test_place_hit_progression_repr():
     strategy = PlaceHitProgression([{6: 12.0}])
     assert repr(strategy) == "PlaceHitProgression(stages=[{6: 12.0}])"
@@ -2056,3 +2098,42 @@ def test_win_progression_completed_and_repr(player):
     assert (
         repr(strategy) == "WinProgression(first_bet=$5 PassLine, multipliers=[1, 2, 3])"
     )
+
+
+@pytest.mark.parametrize(
+    "strategy",
+    [
+        AddIfNotBet(PassLine(5)),
+        AddIfPointOff(PassLine(5)),
+        AddIfPointOn(Field(5)),
+        AddIfNewShooter(PassLine(5)),
+        RemoveIfPointOff(Place(6, 6)),
+        RemoveIfPointOff(HardWay(4, 1)),
+        RemoveIfPointOff(Hop((1, 2), 1)),
+        RemoveIfPointOff(Field(5)),
+        RemoveByType(Place),
+        CountStrategy((PassLine, Come), 2, Come(5)),
+    ],
+)
+def test_bundled_key_strategies_pickle(strategy):
+    unpickled = pickle.loads(pickle.dumps(strategy))
+
+    assert type(unpickled) is type(strategy)
+    assert unpickled.key == strategy.key or isinstance(strategy, CountStrategy)
+    assert "lambda" not in repr(strategy.key)
+
+
+@pytest.mark.parametrize(
+    "bet, removed",
+    [
+        (Place(6, 6), [Place(6, 12)]),
+        (HardWay(4, 1), [HardWay(4, 5)]),
+        (Hop((1, 2), 1), [Hop((2, 1), 5)]),
+        (Field(5), [Field(10)]),
+    ],
+)
+def test_remove_if_point_off_matches_like_bets(player, bet, removed):
+    player.bets = [Place(8, 6), HardWay(6, 1), Hop((1, 1), 1), PassLine(5)] + removed
+    strategy = RemoveIfPointOff(bet)
+
+    assert [b for b in player.bets if strategy.key(b, player)] == removed
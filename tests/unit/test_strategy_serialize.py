@@ -0,0 +1,211 @@
+import json
+
+import pytest
+
+from crapssim.batch import Experiment, experiment_key
+from crapssim.bet import (
+    All,
+    Buy,
+    CAndE,
+    Come,
+    DontCome,
+    Field,
+    Fire,
+    HardWay,
+    Hop,
+    Lay,
+    Odds,
+    PassLine,
+    Place,
+    Put,
+    World,
+)
+from crapssim.rules import CraplessRules
+from crapssim.strategy import serialize
+from crapssim.strategy.examples import (
+    DiceDoctor,
+    DoubleTap,
+    HammerLock,
+    IronCross,
+    Knockout,
+    Pass2Come,
+    PassLinePlace68,
+    Place68PR,
+    PlaceInside,
+    PutWithOdds,
+    QuickProps,
+    Risk12,
+    SqueezePlay,
+    ThreePointMolly,
+)
+from crapssim.strategy.odds import DontComeOddsMultiplier, OddsAmount
+from crapssim.strategy.single_bet import BetHop, BetPlace, StrategyMode
+from crapssim.strategy.tools import (
+    AddIfNewShooter,
+    AddIfNotBet,
+    AddIfTrue,
+    CountStrategy,
+    NullStrategy,
+    PlaceHitProgression,
+    RemoveByType,
+    RemoveIfPointOff,
+    Strategy,
+    WinProgression,
+)
+from crapssim.strategy import BetPassLine, PassLineOddsMultiplier
+from crapssim.table import Table
+
+
+class _Unregistered(NullStrategy):
+    def __init__(self, amount: float = 5) -> None:
+        self.amount = amount
+
+
+class _Registered(NullStrategy):
+    def __init__(self, numbers: tuple[int, ...]) -> None:
+        self.numbers = numbers
+
+
+serialize.register(_Registered, name="test-registered")
+
+STRATEGIES = [
+    NullStrategy(),
+    BetPassLine(5) + PassLineOddsMultiplier({4: 3, 5: 4, 6: 5, 8: 5, 9: 4, 10: 3}),
+    BetPlace({6: 6, 8: 6}, skip_point=False),
+    BetHop((2, 3), 5, mode=StrategyMode.ADD_OR_INCREASE),
+    OddsAmount(DontCome, {4: 10.5}, always_working=True),
+    DontComeOddsMultiplier(float("inf")),
+    AddIfNotBet(Odds(PassLine, 6, 10, always_working=True)),
+    AddIfNewShooter(Fire(1)),
+    CountStrategy((Place, Buy), 3, Lay(4, 20)),
+    RemoveByType((Field, CAndE)),
+    RemoveIfPointOff(Put(8, 10)),
+    WinProgression(HardWay(6, 2), [1, 2, 4.5]),
+    PlaceHitProgression([{6: 6}, {6: 12, 8: 12}]),
+    Pass2Come(5),
+    PassLinePlace68(5, 6, 6),
+    PlaceInside(10),
+    IronCross(5),
+    HammerLock(5),
+    Risk12(),
+    Knockout(5),
+    DiceDoctor(),
+    Place68PR(),
+    QuickProps(),
+    PutWithOdds(10, 2, True),
+    ThreePointMolly(5, odds_multiplier=2),
+    SqueezePlay(),
+    DoubleTap(),
+]
+
+
+def _final_bankroll(strategy: Strategy, seed: int = 3) -> float:
+    table = Table(seed=seed)
+    table.add_player(500, strategy)
+    table.run(max_rolls=300, max_shooter=5, verbose=False)
+    return table.players[0].bankroll
+
+
+@pytest.mark.parametrize("strategy", STRATEGIES, ids=repr)
+def test_round_trip(strategy):
+    data = serialize.to_dict(strategy)
+    text = json.dumps(data)
+    rebuilt = serialize.from_dict(json.loads(text))
+
+    assert type(rebuilt) is type(strategy)
+    assert serialize.to_dict(rebuilt) == data
+    assert serialize.strategy_hash(rebuilt) == serialize.strategy_hash(strategy)
+    assert _final_bankroll(rebuilt) == _final_bankroll(strategy)
+
+
+@pytest.mark.parametrize(
+    "bet",
+    [
+        PassLine(5),
+        Come(5, 6),
+        DontCome(5),
+        Odds(Come, 4, 10),
+        Place(6, 12, always_working=True),
+        Buy(10, 20),
+        Lay(4, 40),
+        Put(5, 10),
+        HardWay(8, 1),
+        Hop((1, 4), 2),
+        World(5),
+        Fire(1),
+        All(2),
+    ],
+    ids=repr,
+)
+def test_bet_round_trip(bet):
+    rebuilt = serialize.decode(json.loads(json.dumps(serialize.encode(bet))))
+    assert type(rebuilt) is type(bet)
+    assert rebuilt == bet
+    assert vars(rebuilt) == vars(bet)
+
+
+def test_canonical_form():
+    a, b, c = BetPassLine(5), PassLineOddsMultiplier(2), IronCross(10)
+    assert serialize.to_json((a + b) + c) == serialize.to_json(a + (b + c))
+    assert serialize.to_json(BetPassLine(5)) == serialize.to_json(
+        BetPassLine(bet_amount=5.0, mode=StrategyMode.ADD_IF_POINT_OFF)
+    )
+    assert serialize.strategy_hash(BetPassLine(5)) != serialize.strategy_hash(
+        BetPassLine(10)
+    )
+    assert serialize.strategy_hash(IronCross(5)) != serialize.strategy_hash(
+        PlaceInside(5)
+    )
+
+
+def test_functions_cannot_be_serialized():
+    with pytest.raises(TypeError):
+        serialize.to_dict(AddIfTrue(PassLine(5), lambda p: True))
+
+
+def test_unregistered_classes_need_allow_import():
+    data = serialize.to_dict(_Unregistered(10))
+    assert data["strategy"]["object"] == f"{__name__}:_Unregistered"
+    with pytest.raises(ValueError):
+        serialize.from_dict(data)
+
+    rebuilt = serialize.from_dict(data, allow_import=True)
+    assert isinstance(rebuilt, _Unregistered) and rebuilt.amount == 10
+
+
+def test_registered_classes_are_decoded_by_name():
+    data = serialize.to_dict(_Registered((6, 8)))
+    assert data["strategy"] == {
+        "object": "test-registered",
+        "args": [{"tuple": [6, 8]}],
+    }
+    assert serialize.from_dict(data).numbers == (6, 8)
+
+    with pytest.raises(ValueError):
+        serialize.register(_Unregistered, name="test-registered")
+
+
+def test_unsupported_format_version():
+    data = serialize.to_dict(NullStrategy())
+    data["format"] = 999
+    with pytest.raises(ValueError):
+        serialize.from_dict(data)
+
+
+def test_experiment_round_trip():
+    experiment = Experiment(
+        {"iron": IronCross(5), "pass": BetPassLine(5) + PassLineOddsMultiplier(2)},
+        bankroll=200,
+        max_shooter=3,
+        rules=CraplessRules(),
+        settings={"field_payouts": {2: 2, 12: 3}, "vig_rounding": "none"},
+        seed_root=42,
+    )
+    text = json.dumps(experiment.to_dict())
+    rebuilt = Experiment.from_dict(json.loads(text))
+
+    assert list(rebuilt.strategies) == ["iron", "pass"]
+    assert isinstance(rebuilt.rules, CraplessRules)
+    assert rebuilt.settings == {"field_payouts": {2: 2, 12: 3}, "vig_rounding": "none"}
+    assert rebuilt.max_rolls == float("inf")
+    assert experiment_key(rebuilt) == experiment_key(experiment)
@@ -1,7 +1,8 @@
 import pytest
 
 from crapssim import Table
-from crapssim.bet import Come, PassLine
+from crapssim.bet import Come, Fire, PassLine
+from crapssim.dice import TiltedDice
 from crapssim.point import Point
 from crapssim.rules import ClassicRules, CraplessRules
 from crapssim.strategy import BetPassLine
@@ -176,3 +177,139 @@ def test_crapless_passline_comeout_2_becomes_point_not_loss():
     assert table.point.status == "On"
     assert table.point.number == 2
     assert player.has_bets(PassLine)
+
+
+def test_reset_restores_initial_state():
+    table = Table(seed=3, rules=CraplessRules())
+    table.add_player(bankroll=200)
+    table.settings["vig_floor"] = 1.0
+    table.run(max_rolls=30, verbose=False)
+
+    table.reset(seed=4)
+
+    assert table.seed == 4
+    assert (table.dice.n_rolls, table.dice.result) == (0, None)
+    assert table.point.status == "Off"
+    assert (table.pass_rolls, table.last_roll) == (0, None)
+    assert (table.n_shooters, table.new_shooter) == (1, True)
+    assert (table.players[0].bankroll, table.players[0].bets) == (200, [])
+    assert isinstance(table.rules, CraplessRules)
+    assert table.settings["vig_floor"] == 1.0
+
+
+def test_restore_rewinds_state():
+    table = Table(seed=3)
+    player = table.add_player(bankroll=200)
+    table.fixed_run([(2, 2)])
+    snapshot = table.snapshot()
+
+    table.run(max_rolls=10, verbose=False)
+    table.restore(snapshot)
+
+    assert table.dice.n_rolls == 1
+    assert table.dice.result == (2, 2)
+    assert table.point.number == 4
+    assert table.n_shooters == 1
+    assert player.bankroll == 195
+    assert player.bets == [PassLine(5)]
+
+
+def test_restore_rewinds_tilted_dice_weight():
+    table = Table()
+    table.dice = TiltedDice.from_totals({7: 0.5}, seed=3)
+    table.add_player(bankroll=200)
+    table.run(max_rolls=3, verbose=False)
+    snapshot = table.snapshot()
+    log_weight = table.dice.log_weight
+
+    table.run(max_rolls=10, verbose=False)
+    table.restore(snapshot)
+
+    assert table.dice.log_weight == log_weight
+
+
+def test_restore_copies_bets_independently():
+    table = Table()
+    player = table.add_player(bankroll=200)
+    player.add_bet(Fire(1))
+    table.fixed_run([(2, 2), (2, 2)])
+    snapshot = table.snapshot()
+
+    player.bets[0].points_made.add(6)
+    table.restore(snapshot)
+    player.bets[0].points_made.add(8)
+    table.restore(snapshot)
+
+    assert player.bets[0].points_made == {4}
+
+
+def test_restore_requires_same_players():
+    table = Table()
+    table.add_player()
+    snapshot = table.snapshot()
+    table.add_player()
+
+    with pytest.raises(ValueError):
+        table.restore(snapshot)
+
+
+def _iter_run_table(seed: int = 5) -> Table:
+    table = Table(seed=seed)
+    table.add_player(300, BetPassLine(5), name="passline")
+    table.add_player(300, BetPassLine(10), name="bigger")
+    return table
+
+
+def test_iter_run_matches_run():
+    streamed = _iter_run_table()
+    records = list(streamed.iter_run(max_rolls=50, max_shooter=3))
+    table = _iter_run_table()
+    table.run(max_rolls=50, max_shooter=3, verbose=False)
+
+    assert len(records) == table.dice.n_rolls == streamed.dice.n_rolls
+    assert streamed.n_shooters == table.n_shooters
+    assert [r.roll for r in records] == list(range(1, len(records) + 1))
+    assert records[-1].bankrolls == tuple(p.bankroll for p in table.players)
+
+
+def test_iter_run_records_track_point_and_shooter():
+    table = _iter_run_table()
+    records = list(table.iter_run(max_rolls=100))
+
+    for previous, record in zip(records, records[1:]):
+        assert record.point_before == previous.point_after
+        if previous.point_after is not None and sum(record.dice) == 7:
+            assert record.point_after is None
+    for previous, record in zip(records, records[1:]):
+        seven_out = previous.point_before is not None and sum(previous.dice) == 7
+        assert record.shooter == previous.shooter + seven_out
+    assert records[0].shooter == 1
+    assert all(len(r.bet_totals) == 2 for r in records)
+
+
+def test_iter_run_fills_only_requested_fields():
+    table = _iter_run_table()
+    record = next(table.iter_run(max_rolls=10, fields=["dice", "bankrolls"]))
+
+    assert record.dice is not None
+    assert record.bankrolls is not None
+    assert record.point_before is None
+    assert record.point_after is None
+    assert record.shooter is None
+    assert record.bet_totals is None
+
+
+def test_iter_run_can_stop_and_continue():
+    table = _iter_run_table()
+    for record in table.iter_run(max_rolls=100):
+        if record.roll == 10:
+            break
+    assert table.dice.n_rolls == 10
+
+    table.run(max_rolls=5, verbose=False)
+    assert table.dice.n_rolls == 15
+
+
+def test_iter_run_rejects_unknown_fields():
+    with pytest.raises(ValueError):
+        Table().iter_run(max_rolls=10, fields=["bankroll"])
@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+
+from crapssim.bet import (
+    Any7,
+    AnyCraps,
+    Boxcars,
+    CAndE,
+    Field,
+    Hop,
+    Horn,
+    PassLine,
+    Three,
+    Two,
+    World,
+    Yo,
+)
+from crapssim.table import Table
+from crapssim.vectorized import PropPlan, dice_tape
+
+ALL_PROPS = [
+    Field(5),
+    Any7(1),
+    Two(1),
+    Three(1),
+    Yo(2),
+    Boxcars(1),
+    AnyCraps(1),
+    Horn(4),
+    World(5),
+    CAndE(2),
+    Hop((2, 3), 1),
+    Hop((4, 4), 1),
+]
+
+
+def table_bankrolls(plan, seed, bankroll, n_rolls, settings=None):
+    table = Table(seed=seed)
+    table.settings.update(settings or {})
+    table.add_player(bankroll, plan.strategy())
+    records = table.iter_run(max_rolls=n_rolls, verbose=False, fields=("bankrolls",))
+    return [record.bankrolls[0] for record in records]
+
+
+@pytest.mark.parametrize("bankroll", [10_000, 60])
+def test_matches_table_run(bankroll):
+    plan = PropPlan(ALL_PROPS)
+    seeds = range(8)
+    tape = dice_tape(seeds, 300)
+    vectorized = plan.bankrolls(tape, bankroll)
+    for seed, row in zip(seeds, vectorized):
+        expected = table_bankrolls(plan, seed, bankroll, 300)
+        # The table stops once the player can no longer bet
+        assert row[: len(expected)].tolist() == expected
+        assert np.all(row[len(expected) :] == expected[-1])
+
+
+@pytest.mark.parametrize("bankroll", [7.7, 10, 13.3])
+def test_matches_table_run_fractional(bankroll):
+    # Bankrolls left a few ulps short of a bet must stop as the table does
+    plan = PropPlan([Field(1.1), Any7(2.2), Yo(3.3)])
+    seeds = range(40)
+    tape = dice_tape(seeds, 200)
+    vectorized = plan.bankrolls(tape, bankroll)
+    for seed, row in zip(seeds, vectorized):
+        expected = table_bankrolls(plan, seed, bankroll, 200)
+        assert row[: len(expected)].tolist() == expected
+        assert np.all(row[len(expected) :] == expected[-1])
+
+
+def test_deltas_match_unlimited_bankroll():
+    plan = PropPlan(ALL_PROPS)
+    tape = dice_tape(range(4), 200)
+    path = plan.bankrolls(tape, 1e9)
+    np.testing.assert_allclose(
+        np.diff(path, axis=1, prepend=1e9), plan.deltas(tape), atol=1e-6
+    )
+    # Each prop's net win, averaged over the 36 outcomes, is its known edge
+    assert PropPlan([Any7(6)]).net.mean() == pytest.approx(-1)
+    assert PropPlan([Yo(36)]).net.mean() == pytest.approx(-4)
+
+
+def test_settings_payouts():
+    triple = {2: 2, 3: 1, 4: 1, 9: 1, 10: 1, 11: 1, 12: 3}
+    plan = PropPlan([Field(5), Hop((1, 2), 1)], settings={"field_payouts": triple})
+    assert plan.deltas(np.array([6, 6])) == 15 - 1
+    assert plan.deltas(np.array([2, 1])) == 5 + 15
+    tape = dice_tape([5], 100)
+    row = plan.bankrolls(tape, 200)[0]
+    assert row.tolist() == table_bankrolls(
+        plan, 5, 200, 100, settings={"field_payouts": triple}
+    )
+
+
+def test_errors():
+    with pytest.raises(TypeError):
+        PropPlan([PassLine(5)])
+    with pytest.raises(ValueError):
+        PropPlan([Field(5), Field(10)])
@@ -0,0 +1,271 @@
+import numpy as np
+import pytest
+
+from crapssim.rules import CraplessRules
+from crapssim.strategy.single_bet import StrategyMode
+from crapssim.table import Table
+from crapssim.vectorized import TableBatch, dice_tape
+
+CRAPLESS_ODDS = {n: 1 for n in (2, 3, 4, 5, 6, 8, 9, 10, 11, 12)}
+INSIDE = {5: 5, 6: 6, 8: 6, 9: 5}
+
+
+def table_bankrolls(batch, seed, bankroll, n_rolls, rules=None, settings=None):
+    table = Table(seed=seed, rules=rules)
+    table.settings.update(settings or {})
+    table.add_player(bankroll, batch.strategy())
+    records = table.iter_run(max_rolls=n_rolls, verbose=False, fields=("bankrolls",))
+    return [record.bankrolls[0] for record in records]
+
+
+def assert_matches_table(
+    bets, rules=None, settings=None, seeds=range(12), bankrolls=(10_000, 120.5)
+):
+    tape = dice_tape(seeds, 400)
+    for bankroll in bankrolls:
+        batch = TableBatch(len(seeds), bankroll, rules=rules, settings=settings, **bets)
+        bankrolls = batch.run(tape)
+        for seed, row in zip(seeds, bankrolls):
+            expected = table_bankrolls(batch, seed, bankroll, 400, rules, settings)
+            # The table stops once the player can no longer bet
+            assert row[: len(expected)].tolist() == expected
+            assert np.all(row[len(expected) :] == expected[-1])
+
+
+@pytest.mark.parametrize(
+    "bets, rules, settings",
+    [
+        ({"pass_line": 5, "pass_line_odds": None}, None, None),
+        (
+            {"pass_line": 10, "come": 10, "pass_line_odds": 2, "come_odds": None},
+            None,
+            None,
+        ),
+        ({"pass_line": 5, "come": 5, "come_odds": {4: 2, 5: 2, 8: 2}}, None, None),
+        (
+            {
+                "dont_pass": 10,
+                "dont_come": 10,
+                "dont_pass_odds": 6,
+                "dont_come_odds": 6,
+            },
+            None,
+            None,
+        ),
+        (
+            {"dont_pass": 7, "dont_come": 5, "dont_come_odds": 3, "odds_working": True},
+            None,
+            None,
+        ),
+        (
+            {
+                "pass_line": 3.3,
+                "dont_pass": 2.2,
+                "come": 2.7,
+                "dont_come": 1.9,
+                "pass_line_odds": 2.5,
+                "dont_pass_odds": 1.5,
+                "come_odds": 1.7,
+                "dont_come_odds": 3.1,
+            },
+            None,
+            None,
+        ),
+        (
+            {"pass_line": 5, "come": 5, "pass_line_odds": 2, "come_odds": 2},
+            CraplessRules(),
+            None,
+        ),
+        (
+            {
+                "pass_line": 5,
+                "come": 5,
+                "pass_line_odds": CRAPLESS_ODDS,
+                "come_odds": CRAPLESS_ODDS,
+            },
+            CraplessRules(),
+            None,
+        ),
+        (
+            {"pass_line": 3, "come": 7, "pass_line_odds": 10, "come_odds": 10},
+            None,
+            {"max_odds": {n: 10 for n in (4, 5, 6, 8, 9, 10)}},
+        ),
+    ],
+)
+def test_matches_table_run(bets, rules, settings):
+    assert_matches_table(bets, rules, settings)
+
+
+@pytest.mark.parametrize(
+    "bets, settings, seeds, bankroll",
+    [
+        (
+            {"pass_line": 9.4, "dont_pass": 2.8, "come": 11.1, "dont_come": 8.5},
+            {"vig_paid_on_win": False, "vig_rounding": "none"},
+            range(100, 110),
+            40.7,
+        ),
+        (
+            {"pass_line": 7.6, "dont_pass": 11.5, "come": 10.7},
+            None,
+            range(560, 570),
+            19.3,
+        ),
+        (
+            {
+                "pass_line": 7,
+                "pass_line_odds": {4: 2, 5: 5, 6: 1},
+                "dont_pass": 3.3,
+                "dont_pass_odds": 2,
+                "dont_come": 7,
+                "odds_working": True,
+                "place": {9: 10, 8: 6, 5: 20},
+                "box_mode": StrategyMode.BET_IF_POINT_ON,
+            },
+            {"vig_floor": 0.0, "vig_paid_on_win": False},
+            [311],
+            150.5,
+        ),
+    ],
+)
+def test_matches_table_run_fractional(bets, settings, seeds, bankroll):
+    # Bankrolls left a few ulps short of a bet must stop betting as the
+    # table's completed strategies do
+    assert_matches_table(bets, settings=settings, seeds=seeds, bankrolls=[bankroll])
+
+
+def test_state_by_number():
+    batch = TableBatch(1, 1000, pass_line=10, come=10, pass_line_odds=2, come_odds=2)
+    for roll in [(2, 2), (3, 3), (5, 4)]:
+        batch.roll(np.array([roll]))
+    assert batch.point.tolist() == [4]
+    assert batch.pass_line.tolist() == [10]
+    assert batch.pass_line_odds.tolist() == [20]
+    assert np.flatnonzero(batch.come[0]).tolist() == [6, 9]
+    # The Come bet on 9 moved on the last roll and has no odds yet
+    assert np.flatnonzero(batch.come_odds[0]).tolist() == [6]
+    assert batch.bet_totals.tolist() == [70]
+    assert batch.bankroll.tolist() == [1000 - 70]
+
+    batch.roll(np.array([(4, 3)]))
+    assert batch.point.tolist() == [0]
+    assert batch.bet_totals.tolist() == [0]
+    # A new Come bet and odds on 9 go up, then the seven out loses everything
+    # but the new Come bet
+    assert batch.bankroll.tolist() == [1000 - 70 - 10 - 20 + 20]
+
+
+@pytest.mark.parametrize("policy", ["legacy", "real_casino"])
+@pytest.mark.parametrize("box_working", [None, True, False])
+@pytest.mark.parametrize(
+    "box_mode", [StrategyMode.ADD_IF_NOT_BET, StrategyMode.BET_IF_POINT_ON]
+)
+def test_box_bets_match_table_run(policy, box_working, box_mode):
+    bets = {
+        "pass_line": 5,
+        "place": {6: 7.3, 8: 6, 4: 3.3},
+        "buy": {4: 25, 10: 20},
+        "lay": {5: 30, 9: 31.5},
+        "put": {6: 10, 8: 7},
+        "box_working": box_working,
+        "box_mode": box_mode,
+    }
+    settings = {"come_out_working_policy": policy}
+    assert_matches_table(bets, settings=settings, seeds=range(4))
+
+
+@pytest.mark.parametrize(
+    "settings",
+    [
+        {"vig_rounding": "none"},
+        {"vig_rounding": "ceil_dollar", "vig_floor": 1.5},
+        {"vig_paid_on_win": False},
+        {"vig_paid_on_win": False, "vig_rounding": "none", "vig_floor": 0.7},
+    ],
+)
+def test_vig_policies_match_table_run(settings):
+    bets = {"buy": {4: 25, 10: 21.3, 6: 12}, "lay": {5: 30, 9: 31.5}, "dont_come": 5}
+    assert_matches_table(bets, settings=settings)
+
+
+@pytest.mark.parametrize(
+    "bets, settings, seeds, bankroll",
+    [
+        (
+            {
+                "place": {10: 3.2, 8: 7.8, 4: 5.0},
+                "buy": {5: 7.8},
+                "box_mode": StrategyMode.BET_IF_POINT_ON,
+            },
+            {"come_out_working_policy": "legacy"},
+            range(1000, 1010),
+            19.2,
+        ),
+        (
+            {
+                "place": {5: 11.9, 8: 2.1},
+                "buy": {10: 1.4, 8: 3.6, 5: 2.0},
+                "lay": {9: 9.9},
+                "put": {4: 11.2, 5: 2.1},
+                "box_working": False,
+            },
+            {"vig_paid_on_win": False},
+            range(1400, 1410),
+            35.3,
+        ),
+    ],
+)
+def test_box_bets_match_table_run_fractional(bets, settings, seeds, bankroll):
+    assert_matches_table(bets, settings=settings, seeds=seeds, bankrolls=[bankroll])
+
+
+def test_crapless_box_bets_match_table_run():
+    bets = {"place": {2: 5, 6: 6, 12: 3}, "buy": {11: 5, 4: 10}, "put": {3: 5}}
+    assert_matches_table(bets, rules=CraplessRules())
+    # Bets on the extreme numbers are never placed under classic rules
+    assert_matches_table(bets)
+
+
+def test_box_bets_by_number():
+    settings = {"vig_paid_on_win": False}
+    batch = TableBatch(1, 1000, place=INSIDE, buy={4: 25}, settings=settings)
+    assert batch.buy[0, 4] == 0
+    batch.roll(np.array([(3, 3)]))
+    # Box bets are off on the come-out by default; the vig is paid up front
+    assert np.flatnonzero(batch.place[0]).tolist() == [5, 6, 8, 9]
+    assert batch.buy[0, 4] == 25
+    assert batch.bankroll.tolist() == [1000 - 22 - 26]
+
+    batch.roll(np.array([(3, 3)]))
+    # The Place bet on 6 wins 7 to 6 and stays up
+    assert batch.place[0, 6] == 6
+    assert batch.bankroll.tolist() == [1000 - 22 - 26 + 7]
+
+    batch.roll(np.array([(4, 3)]))
+    # A 7 on the come-out leaves the bets that are off up
+    assert batch.bet_totals.tolist() == [22 + 25]
+    assert batch.bankroll.tolist() == [1000 - 22 - 26 + 7]
+
+
+def test_strategy_and_errors():
+    batch = TableBatch(2, 100, pass_line=5, dont_come=5, dont_come_odds=6)
+    assert [type(s).__name__ for s in batch.strategy().strategies] == [
+        "BetPassLine",
+        "BetDontCome",
+        "DontComeOddsMultiplier",
+    ]
+    with pytest.raises(ValueError):
+        batch.roll(np.array([(1, 2)]))
+
+    batch = TableBatch(2, 100, place=INSIDE, lay={4: 20, 10: 20}, put={6: 5})
+    assert [type(s).__name__ for s in batch.strategy().strategies] == [
+        "BetPlace",
+        "BetLay",
+        "BetLay",
+        "BetPut",
+    ]
+    with pytest.raises(ValueError):
+        TableBatch(2, 100, place=INSIDE, box_mode=StrategyMode.REPLACE)
+    with pytest.raises(ValueError):
+        TableBatch(2, 100, buy={7: 10})
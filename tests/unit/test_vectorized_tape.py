@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+
+from crapssim.analysis import DICE_OUTCOMES
+from crapssim.dice import Dice
+from crapssim.vectorized import dice_tape, outcome_index
+
+
+def test_tape_matches_seeded_dice():
+    tape = dice_tape([3, 11], 50)
+    assert tape.shape == (2, 50, 2)
+    for seed, row in zip([3, 11], tape):
+        dice = Dice(seed)
+        for outcome in row:
+            dice.roll()
+            assert dice.result == tuple(outcome)
+
+
+def test_outcome_index():
+    dice = np.array(DICE_OUTCOMES)
+    np.testing.assert_array_equal(outcome_index(dice), np.arange(36))
+    assert outcome_index(np.array([[[6, 6]]])).shape == (1, 1)
+    with pytest.raises(ValueError):
+        outcome_index(np.array([[0, 3]]))
+    with pytest.raises(ValueError):
+        outcome_index(np.array([1, 2, 3]))
@@ -0,0 +1,68 @@
+"""Benchmark capturing and restoring table state.
+
+Compares ``Table.snapshot`` / ``Table.restore`` and a pickle round trip
+against ``copy.deepcopy`` of a table seated with several of the bundled
+example strategies, part way through a session.
+
+Usage::
+
+    python tools/bench_state.py
+"""
+
+from __future__ import annotations
+
+import copy
+import pickle
+import timeit
+
+from crapssim.strategy.examples import (
+    HammerLock,
+    IronCross,
+    Place68PR,
+    Risk12,
+    ThreePointMolly,
+)
+from crapssim.table import Table
+
+N_REPEATS = 2000
+
+
+def build_table() -> Table:
+    """Seat a handful of example strategies and play part of a session."""
+    table = Table(seed=7)
+    table.add_player(500, IronCross(5), name="ironcross")
+    table.add_player(500, HammerLock(5), name="hammerlock")
+    table.add_player(500, Risk12(5), name="risk12")
+    table.add_player(500, Place68PR(6), name="place68pr")
+    table.add_player(500, ThreePointMolly(5, odds_multiplier=2), name="molly")
+    table.run(max_rolls=37, verbose=False)
+    return table
+
+
+def per_call_us(stmt, number: int = N_REPEATS) -> float:
+    """Return the best-of-three time for ``stmt`` in microseconds per call."""
+    return min(timeit.repeat(stmt, number=number, repeat=3)) / number * 1e6
+
+
+def main() -> None:
+    table = build_table()
+    snapshot = table.snapshot()
+    payload = pickle.dumps(table)
+
+    rows = [
+        ("deepcopy(table)", per_call_us(lambda: copy.deepcopy(table))),
+        ("table.snapshot()", per_call_us(table.snapshot)),
+        ("table.restore(snapshot)", per_call_us(lambda: table.restore(snapshot))),
+        ("pickle.dumps(table)", per_call_us(lambda: pickle.dumps(table))),
+        ("pickle.loads(payload)", per_call_us(lambda: pickle.loads(payload))),
+    ]
+
+    width = max(len(name) for name, _ in rows)
+    print(f"{'operation':<{width}}  time per call")
+    for name, micros in rows:
+        print(f"{name:<{width}}  {micros:10.1f} us")
+    print(f"pickled table size: {len(payload)} bytes")
+
+
+if __name__ == "__main__":
+    main()